@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from typing import Optional
+from asyncio import Task, get_running_loop, shield
+from threading import Lock
+from time import monotonic
+from typing import NamedTuple, Optional
 from urllib.parse import urlparse, ParseResult as URI
 from msal import (
     ConfidentialClientApplication,
     ManagedIdentityClient,
+    TokenCache,
     UserAssignedManagedIdentity,
     SystemAssignedManagedIdentity,
 )
@@ -19,12 +23,33 @@ from .auth_types import AuthTypes
 from .msal_auth_configuration import MsalAuthConfiguration
 
 
+class _AccessToken(NamedTuple):
+    access_token: str
+    refresh_at: float
+    expires_at: float
+
+
 class MsalAuth(AccessTokenProviderBase):
 
     _client_credential_cache = None
 
+    # Tokens are refreshed in the background this many seconds before they expire,
+    # and are no longer handed out this many seconds before they expire.
+    REFRESH_BEFORE_EXPIRY = 5 * 60
+    MIN_REMAINING_LIFETIME = 60
+
     def __init__(self, msal_configuration: MsalAuthConfiguration):
         self._msal_configuration = msal_configuration
+        # MSAL keeps its token cache in the application object, so one is kept per authority
+        self._client_applications: dict[
+            str, ManagedIdentityClient | ConfidentialClientApplication
+        ] = {}
+        self._token_caches: dict[str, TokenCache] = {}
+        self._client_applications_lock = Lock()
+        self._access_tokens: dict[tuple[str, tuple[str, ...]], _AccessToken] = {}
+        self._acquire_tasks: dict[tuple[str, tuple[str, ...]], Task] = {}
+        # Forced refreshes are not shared with regular acquisitions, which may return the cached token.
+        self._force_refresh_tasks: dict[tuple[str, tuple[str, ...]], Task] = {}
 
     async def get_access_token(
         self, resource_url: str, scopes: list[str], force_refresh: bool = False
@@ -34,9 +59,101 @@ class MsalAuth(AccessTokenProviderBase):
             raise ValueError("Invalid instance URL")
 
         local_scopes = self._resolve_scopes_list(instance_uri, scopes)
-        msal_auth_client = self._create_client_application()
+        key = (resource_url, tuple(local_scopes))
+
+        token = self._access_tokens.get(key)
+        now = monotonic()
+        if token and not force_refresh and now < token.expires_at:
+            if now >= token.refresh_at:
+                # Refresh ahead of expiry so callers never wait on AAD.
+                self._get_acquire_task(key, resource_url, local_scopes)
+            return token.access_token
+
+        # Concurrent callers share a single acquisition, shielded so that a cancelled
+        # caller does not cancel it for the others.
+        token = await shield(
+            self._get_acquire_task(key, resource_url, local_scopes, force_refresh)
+        )
+        return token.access_token
+
+    def _get_acquire_task(
+        self,
+        key: tuple[str, tuple[str, ...]],
+        resource_url: str,
+        local_scopes: list[str],
+        force_refresh: bool = False,
+    ) -> Task:
+        tasks = self._force_refresh_tasks if force_refresh else self._acquire_tasks
+        loop = get_running_loop()
+        task = tasks.get(key)
+        if task is not None and task.get_loop() is loop:
+            return task
+
+        task = loop.create_task(
+            self._acquire_token(key, resource_url, local_scopes, force_refresh)
+        )
+        tasks[key] = task
+
+        def on_done(done: Task):
+            if tasks.get(key) is done:
+                del tasks[key]
+            if not done.cancelled():
+                # Retrieve the exception so failed background refreshes are not reported
+                # as unhandled, the next caller retries the acquisition.
+                done.exception()
+
+        task.add_done_callback(on_done)
+        return task
+
+    async def _acquire_token(
+        self,
+        key: tuple[str, tuple[str, ...]],
+        resource_url: str,
+        local_scopes: list[str],
+        force_refresh: bool = False,
+    ) -> _AccessToken:
+        auth_result_payload = await get_running_loop().run_in_executor(
+            None,
+            self._acquire_token_for_client,
+            resource_url,
+            local_scopes,
+            force_refresh,
+        )
+
+        # TODO: Handling token error / acquisition failed
+        access_token = auth_result_payload["access_token"]
+        now = monotonic()
+        expires_in = float(auth_result_payload.get("expires_in") or 0)
+        refresh_in = auth_result_payload.get("refresh_in")
+        refresh_in = (
+            float(refresh_in) if refresh_in else expires_in - self.REFRESH_BEFORE_EXPIRY
+        )
 
-        if isinstance(msal_auth_client, ManagedIdentityClient):
+        token = _AccessToken(
+            access_token,
+            refresh_at=now + refresh_in,
+            expires_at=now + expires_in - self.MIN_REMAINING_LIFETIME,
+        )
+        self._access_tokens[key] = token
+        return token
+
+    def _acquire_token_for_client(
+        self, resource_url: str, local_scopes: list[str], force_refresh: bool = False
+    ) -> dict:
+        msal_auth_client = self._get_client_application()
+        is_managed_identity = isinstance(msal_auth_client, ManagedIdentityClient)
+
+        if force_refresh:
+            # The application would otherwise return its cached token, the one being refreshed.
+            token_cache = self._token_caches[self._get_authority()]
+            entries = token_cache.search(
+                TokenCache.CredentialType.ACCESS_TOKEN,
+                target=[resource_url] if is_managed_identity else local_scopes,
+            )
+            for entry in list(entries):
+                token_cache.remove_at(entry)
+
+        if is_managed_identity:
             auth_result_payload = msal_auth_client.acquire_token_for_client(
                 resource=resource_url
             )
@@ -45,11 +162,38 @@ class MsalAuth(AccessTokenProviderBase):
                 scopes=local_scopes
             )
 
-        # TODO: Handling token error / acquisition failed
-        return auth_result_payload["access_token"]
+        return auth_result_payload
 
-    def _create_client_application(
+    def _get_client_application(
         self,
+    ) -> ManagedIdentityClient | ConfidentialClientApplication:
+        authority = self._get_authority()
+        msal_auth_client = self._client_applications.get(authority)
+        if msal_auth_client is not None:
+            return msal_auth_client
+
+        with self._client_applications_lock:
+            msal_auth_client = self._client_applications.get(authority)
+            if msal_auth_client is None:
+                token_cache = TokenCache()
+                msal_auth_client = self._create_client_application(token_cache)
+                self._token_caches[authority] = token_cache
+                self._client_applications[authority] = msal_auth_client
+
+        return msal_auth_client
+
+    def _get_authority(self) -> str:
+        if self._msal_configuration.AUTH_TYPE in (
+            AuthTypes.user_managed_identity,
+            AuthTypes.system_managed_identity,
+        ):
+            return self._msal_configuration.AUTH_TYPE
+
+        authority_path = self._msal_configuration.TENANT_ID or "botframework.com"
+        return f"https://login.microsoftonline.com/{authority_path}"
+
+    def _create_client_application(
+        self, token_cache: TokenCache
     ) -> ManagedIdentityClient | ConfidentialClientApplication:
         msal_auth_client = None
 
@@ -59,16 +203,17 @@ class MsalAuth(AccessTokenProviderBase):
                     client_id=self._msal_configuration.CLIENT_ID
                 ),
                 http_client=Session(),
+                token_cache=token_cache,
             )
 
         elif self._msal_configuration.AUTH_TYPE == AuthTypes.system_managed_identity:
             msal_auth_client = ManagedIdentityClient(
                 SystemAssignedManagedIdentity(),
                 http_client=Session(),
+                token_cache=token_cache,
             )
         else:
-            authority_path = self._msal_configuration.TENANT_ID or "botframework.com"
-            authority = f"https://login.microsoftonline.com/{authority_path}"
+            authority = self._get_authority()
 
             if self._client_credential_cache:
                 pass
@@ -98,6 +243,7 @@ class MsalAuth(AccessTokenProviderBase):
                 client_id=self._msal_configuration.CLIENT_ID,
                 authority=authority,
                 client_credential=self._client_credential_cache,
+                token_cache=token_cache,
             )
 
         return msal_auth_client
@@ -0,0 +1,122 @@
+import asyncio
+import time
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from msal import ConfidentialClientApplication, TokenCache
+
+from microsoft.agents.authentication.msal import AuthTypes, MsalAuth
+
+RESOURCE_URL = "https://api.botframework.com"
+SCOPES = ["https://api.botframework.com/.default"]
+
+
+class _Configuration:
+    AUTH_TYPE = AuthTypes.client_secret
+    TENANT_ID = "tenant-id"
+    CLIENT_ID = "client-id"
+    CLIENT_SECRET = "secret"
+    SCOPES = None
+
+
+class TestMsalAuth:
+    @pytest.fixture
+    def auth(self):
+        auth = MsalAuth(_Configuration())
+
+        def acquire_token_for_client(resource_url, local_scopes, force_refresh):
+            time.sleep(0.05)
+            return {"access_token": "token", "expires_in": 3600}
+
+        auth._acquire_token_for_client = MagicMock(side_effect=acquire_token_for_client)
+        return auth
+
+    def test_client_application_is_reused(self):
+        auth = MsalAuth(_Configuration())
+        with patch.object(auth, "_create_client_application") as create:
+            first = auth._get_client_application()
+            second = auth._get_client_application()
+        assert first is second
+        create.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_force_refresh_bypasses_msal_token_cache(self):
+        auth = MsalAuth(_Configuration())
+        issued = []
+
+        def create_client_application(token_cache: TokenCache):
+            def acquire_token_for_client(scopes):
+                # Behaves like MSAL, returning the cached token while it is valid.
+                for entry in token_cache.search(
+                    TokenCache.CredentialType.ACCESS_TOKEN, target=scopes
+                ):
+                    return {"access_token": entry["secret"], "expires_in": 3600}
+
+                issued.append(f"token{len(issued)}")
+                response = {
+                    "access_token": issued[-1],
+                    "expires_in": 3600,
+                    "token_type": "Bearer",
+                }
+                token_cache.add(
+                    {
+                        "client_id": "client-id",
+                        "scope": scopes,
+                        "token_endpoint": "https://login.microsoftonline.com/tenant-id/oauth2/v2.0/token",
+                        "response": dict(response),
+                        "params": {},
+                        "data": {},
+                    }
+                )
+                return response
+
+            application = MagicMock(spec=ConfidentialClientApplication)
+            application.acquire_token_for_client.side_effect = acquire_token_for_client
+            return application
+
+        with patch.object(
+            auth, "_create_client_application", side_effect=create_client_application
+        ):
+            assert await auth.get_access_token(RESOURCE_URL, SCOPES) == "token0"
+            auth._access_tokens.clear()
+            assert await auth.get_access_token(RESOURCE_URL, SCOPES) == "token0"
+            assert (
+                await auth.get_access_token(RESOURCE_URL, SCOPES, force_refresh=True)
+                == "token1"
+            )
+            assert await auth.get_access_token(RESOURCE_URL, SCOPES) == "token1"
+
+    @pytest.mark.asyncio
+    async def test_get_access_token_is_cached(self, auth: MsalAuth):
+        assert await auth.get_access_token(RESOURCE_URL, SCOPES) == "token"
+        assert await auth.get_access_token(RESOURCE_URL, SCOPES) == "token"
+        auth._acquire_token_for_client.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_access_token_concurrent_calls_are_coalesced(
+        self, auth: MsalAuth
+    ):
+        tokens = await asyncio.gather(
+            *(auth.get_access_token(RESOURCE_URL, SCOPES) for _ in range(10))
+        )
+        assert tokens == ["token"] * 10
+        auth._acquire_token_for_client.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_access_token_force_refresh(self, auth: MsalAuth):
+        await auth.get_access_token(RESOURCE_URL, SCOPES)
+        await auth.get_access_token(RESOURCE_URL, SCOPES, force_refresh=True)
+        assert auth._acquire_token_for_client.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_access_token_refreshes_ahead_of_expiry(self, auth: MsalAuth):
+        await auth.get_access_token(RESOURCE_URL, SCOPES)
+        key = (RESOURCE_URL, tuple(SCOPES))
+        auth._access_tokens[key] = auth._access_tokens[key]._replace(
+            refresh_at=time.monotonic()
+        )
+
+        assert await auth.get_access_token(RESOURCE_URL, SCOPES) == "token"
+        await auth._acquire_tasks[key]
+        assert auth._acquire_token_for_client.call_count == 2
@@ -0,0 +1,82 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+Microbenchmark of CachedAgentState change detection for state sizes from 1 KB to 1 MB.
+
+Each scenario measures the change detection work done by AgentState.save_changes in one
+turn, compared to hashing the whole state twice as done before dirty tracking:
+
+- untouched: the turn does not access the state.
+- set: the turn replaces a property through its accessor.
+- read: the turn reads a property without setting it, so the property is fingerprinted when
+  handed out and again on save to catch in-place mutations.
+
+Run with: python benchmarks/agent_state_change_detection.py
+"""
+
+from timeit import timeit
+
+from microsoft.agents.builder.state.agent_state import CachedAgentState
+
+SIZES = [1024, 16 * 1024, 128 * 1024, 1024 * 1024]
+ENTRY_SIZE = 64
+
+
+def create_state(size: int) -> dict:
+    entries = {
+        f"key{index}": "x" * (ENTRY_SIZE - 16) for index in range(size // ENTRY_SIZE)
+    }
+    return {"profile": {"name": "user"}, "history": entries}
+
+
+def full_hash(state: dict) -> None:
+    cached_state = CachedAgentState(dict(state))
+    initial_hash = hash(str(cached_state.store_item_to_json()))
+    _ = initial_hash != hash(str(cached_state.store_item_to_json()))
+
+
+def untouched(state: dict) -> None:
+    cached_state = CachedAgentState(dict(state))
+    if cached_state.is_changed:
+        cached_state.mark_saved()
+
+
+def set_property(state: dict) -> None:
+    cached_state = CachedAgentState(dict(state))
+    cached_state.state["history"] = state["history"]
+    cached_state.mark_dirty("history")
+    if cached_state.is_changed:
+        cached_state.mark_saved()
+
+
+def read_property(state: dict) -> None:
+    cached_state = CachedAgentState(dict(state))
+    cached_state.track_property("history")
+    if cached_state.is_changed:
+        cached_state.mark_saved()
+
+
+def main():
+    scenarios = [
+        ("full hash", full_hash),
+        ("untouched", untouched),
+        ("set", set_property),
+        ("read", read_property),
+    ]
+    print(f"{'size':>10}" + "".join(f"{name:>14}" for name, _ in scenarios))
+    for size in SIZES:
+        state = create_state(size)
+        number = max(10, 10_000_000 // (size * 10))
+        timings = [
+            timeit(lambda: scenario(state), number=number) / number * 1_000_000
+            for _, scenario in scenarios
+        ]
+        print(
+            f"{size // 1024:>7} KB"
+            + "".join(f"{timing:>11.1f} us" for timing in timings)
+        )
+
+
+if __name__ == "__main__":
+    main()
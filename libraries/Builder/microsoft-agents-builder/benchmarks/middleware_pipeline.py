@@ -0,0 +1,78 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+Benchmark of the per-turn overhead of MiddlewareSet for 0 to 20 middleware that only call
+the next one, compared to the recursive chain used before the pipeline was precompiled.
+
+Run with: python benchmarks/middleware_pipeline.py
+"""
+
+import asyncio
+from time import perf_counter
+
+from microsoft.agents.builder.middleware_set import MiddlewareSet
+
+COUNTS = [0, 1, 5, 10, 20]
+TURNS = 20000
+
+
+class PassThroughMiddleware:
+    async def on_turn(self, context, logic):
+        await logic()
+
+
+class RecursiveMiddlewareSet(MiddlewareSet):
+    async def receive_activity_with_status(self, context, callback):
+        return await self.receive_activity_internal(context, callback)
+
+    async def receive_activity_internal(
+        self, context, callback, next_middleware_index: int = 0
+    ):
+        if next_middleware_index == len(self._middleware):
+            if callback is not None:
+                return await callback(context)
+            return None
+        next_middleware = self._middleware[next_middleware_index]
+
+        async def call_next_middleware():
+            return await self.receive_activity_internal(
+                context, callback, next_middleware_index + 1
+            )
+
+        try:
+            return await next_middleware.on_turn(context, call_next_middleware)
+        except Exception as error:
+            raise error
+
+
+async def callback(context):
+    return None
+
+
+async def time_turns(middleware_set: MiddlewareSet) -> float:
+    start = perf_counter()
+    for _ in range(TURNS):
+        await middleware_set.receive_activity_with_status(None, callback)
+
+    return (perf_counter() - start) / TURNS * 1_000_000
+
+
+async def main():
+    print(f"{'middleware':>10}{'recursive':>16}{'compiled':>16}")
+    for count in COUNTS:
+        middleware = [PassThroughMiddleware() for _ in range(count)]
+        recursive = RecursiveMiddlewareSet()
+        compiled = MiddlewareSet()
+        if middleware:
+            recursive.use(*middleware)
+            compiled.use(*middleware)
+
+        print(
+            f"{count:>10}{await time_turns(recursive):>13.2f} us"
+            f"{await time_turns(compiled):>13.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,120 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+Benchmark of the copy made of each outgoing activity by TurnContext.send_activities, for
+activities carrying Adaptive Cards of increasing size.
+
+Compares the deep copy made before with the shallow copy made now, and measures a whole
+send_activities call through an adapter that does nothing.
+
+Run with: python benchmarks/send_activities_copy.py
+"""
+
+import asyncio
+from copy import deepcopy
+from time import perf_counter
+from timeit import timeit
+
+from microsoft.agents.builder import ChannelAdapter, TurnContext
+from microsoft.agents.core.models import (
+    Activity,
+    ActivityTypes,
+    Attachment,
+    ChannelAccount,
+    ConversationAccount,
+    ResourceResponse,
+)
+
+CARD_ELEMENTS = [10, 100, 1000]
+ITERATIONS = 2000
+
+
+class NullAdapter(ChannelAdapter):
+    async def send_activities(self, context, activities):
+        return [ResourceResponse() for _ in activities]
+
+    async def update_activity(self, context, activity):
+        pass
+
+    async def delete_activity(self, context, reference):
+        pass
+
+
+def create_card_activity(elements: int) -> Activity:
+    card = {
+        "type": "AdaptiveCard",
+        "version": "1.5",
+        "body": [
+            {
+                "type": "ColumnSet",
+                "columns": [
+                    {
+                        "type": "Column",
+                        "items": [
+                            {
+                                "type": "TextBlock",
+                                "text": f"Item {index}",
+                                "wrap": True,
+                            },
+                            {
+                                "type": "Image",
+                                "url": f"https://example.com/{index}.png",
+                            },
+                        ],
+                    }
+                ],
+            }
+            for index in range(elements)
+        ],
+        "actions": [{"type": "Action.Submit", "title": "OK", "data": {"id": 1}}],
+    }
+    return Activity(
+        type=ActivityTypes.message,
+        attachments=[
+            Attachment(
+                content_type="application/vnd.microsoft.card.adaptive", content=card
+            )
+        ],
+    )
+
+
+def create_context() -> TurnContext:
+    return TurnContext(
+        NullAdapter(),
+        Activity(
+            type=ActivityTypes.message,
+            id="incoming",
+            channel_id="msteams",
+            service_url="https://smba.trafficmanager.net/amer/",
+            conversation=ConversationAccount(id="conversation"),
+            from_property=ChannelAccount(id="user"),
+            recipient=ChannelAccount(id="agent"),
+        ),
+    )
+
+
+async def time_send_activities(activity: Activity) -> float:
+    context = create_context()
+    start = perf_counter()
+    for _ in range(ITERATIONS):
+        await context.send_activities([activity])
+
+    return (perf_counter() - start) / ITERATIONS * 1_000_000
+
+
+async def main():
+    print(f"{'elements':>10}{'deepcopy':>16}{'model_copy':>16}{'send_activities':>22}")
+    for elements in CARD_ELEMENTS:
+        activity = create_card_activity(elements)
+        deep = timeit(lambda: deepcopy(activity), number=ITERATIONS)
+        shallow = timeit(lambda: activity.model_copy(), number=ITERATIONS)
+        send = await time_send_activities(activity)
+        print(
+            f"{elements:>10}{deep / ITERATIONS * 1_000_000:>13.1f} us"
+            f"{shallow / ITERATIONS * 1_000_000:>13.1f} us{send:>19.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
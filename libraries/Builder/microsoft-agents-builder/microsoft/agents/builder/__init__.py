@@ -7,7 +7,10 @@ from .channel_adapter import ChannelAdapter
 from .channel_api_handler_protocol import ChannelApiHandlerProtocol
 from .channel_service_adapter import ChannelServiceAdapter
 from .channel_service_client_factory_base import ChannelServiceClientFactoryBase
+from .conversation_turn_scheduler import ConversationTurnScheduler
+from .lazy_user_token_client import LazyUserTokenClient
 from .message_factory import MessageFactory
+from .proactive_result import ProactiveResult
 from .middleware_set import Middleware
 from .rest_channel_service_client_factory import RestChannelServiceClientFactory
 from .turn_context import TurnContext
@@ -22,7 +25,10 @@ __all__ = [
     "ChannelApiHandlerProtocol",
     "ChannelServiceAdapter",
     "ChannelServiceClientFactoryBase",
+    "ConversationTurnScheduler",
+    "LazyUserTokenClient",
     "MessageFactory",
+    "ProactiveResult",
     "Middleware",
     "RestChannelServiceClientFactory",
     "TurnContext",
@@ -2,6 +2,7 @@
 # Licensed under the MIT License.
 from __future__ import annotations
 from http import HTTPStatus
+from typing import Any, Awaitable, Callable
 from pydantic import BaseModel
 
 from microsoft.agents.core import TurnContextProtocol
@@ -18,6 +19,33 @@ from microsoft.agents.core.models import (
 
 from .agent import Agent
 
+# Called with the handler and the turn context, routes dispatch to the handler's methods.
+Route = Callable[["ActivityHandler", TurnContextProtocol], Awaitable[Any]]
+
+
+def route_to(method_name: str) -> Route:
+    """
+    Creates a route calling a handler method with the turn context.
+
+    The method is looked up on each call, so that overrides in derived classes are used.
+
+    :param method_name: The name of the handler method.
+    """
+    return lambda handler, turn_context: getattr(handler, method_name)(turn_context)
+
+
+async def _sign_in_invoke(
+    handler: "ActivityHandler", turn_context: TurnContextProtocol
+):
+    await handler.on_sign_in_invoke(turn_context)
+
+
+async def _adaptive_card_invoke(
+    handler: "ActivityHandler", turn_context: TurnContextProtocol
+):
+    invoke_value = handler._get_adaptive_card_invoke_value(turn_context.activity)
+    return await handler.on_adaptive_card_invoke(turn_context, invoke_value)
+
 
 class ActivityHandler(Agent):
     """
@@ -27,8 +55,62 @@ class ActivityHandler(Agent):
         Derive from this class to handle particular activity types.
         Yon can add pre and post processing of activities by calling the base class
         in the derived class.
+        Activity types and invoke names are dispatched with tables built once per class,
+        which derived classes can extend with :meth:`register_activity_route()` and
+        :meth:`register_invoke_route()`.
     """
 
+    _activity_routes: dict[str, Route] = {
+        ActivityTypes.message: route_to("on_message_activity"),
+        ActivityTypes.message_update: route_to("on_message_update_activity"),
+        ActivityTypes.message_delete: route_to("on_message_delete_activity"),
+        ActivityTypes.conversation_update: route_to("on_conversation_update_activity"),
+        ActivityTypes.message_reaction: route_to("on_message_reaction_activity"),
+        ActivityTypes.event: route_to("on_event_activity"),
+        ActivityTypes.invoke: route_to("_on_invoke_turn"),
+        ActivityTypes.end_of_conversation: route_to("on_end_of_conversation_activity"),
+        ActivityTypes.typing: route_to("on_typing_activity"),
+        ActivityTypes.installation_update: route_to("on_installation_update"),
+    }
+
+    # Invoke routes return the body of the invoke response.
+    _invoke_routes: dict[str, Route] = {
+        SignInConstants.verify_state_operation_name: _sign_in_invoke,
+        SignInConstants.token_exchange_operation_name: _sign_in_invoke,
+        "adaptiveCard/action": _adaptive_card_invoke,
+    }
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Every class gets its own tables, so routes registered on it do not leak to its bases.
+        cls._activity_routes = dict(cls._activity_routes)
+        cls._invoke_routes = dict(cls._invoke_routes)
+
+    @classmethod
+    def register_activity_route(cls, activity_type: str, route: Route) -> None:
+        """
+        Routes activities of a type to a handler method, replacing any existing route.
+
+        Call it on a derived class, it applies to that class and the classes later derived from it.
+
+        :param activity_type: The activity type.
+        :param route: Called with the handler and the turn context.
+        """
+        cls._activity_routes[activity_type] = route
+
+    @classmethod
+    def register_invoke_route(cls, name: str, route: Route) -> None:
+        """
+        Routes invoke activities with a name to a handler method, replacing any existing route.
+
+        Call it on a derived class, it applies to that class and the classes later derived from it.
+
+        :param name: The invoke activity name.
+        :param route: Called with the handler and the turn context, returns the body of the
+        invoke response.
+        """
+        cls._invoke_routes[name] = route
+
     async def on_turn(
         self, turn_context: TurnContextProtocol
     ):  # pylint: disable=arguments-differ
@@ -65,38 +147,24 @@ class ActivityHandler(Agent):
                 "ActivityHandler.on_turn(): turn_context activity must have a non-None type."
             )
 
-        if turn_context.activity.type == ActivityTypes.message:
-            await self.on_message_activity(turn_context)
-        elif turn_context.activity.type == ActivityTypes.message_update:
-            await self.on_message_update_activity(turn_context)
-        elif turn_context.activity.type == ActivityTypes.message_delete:
-            await self.on_message_delete_activity(turn_context)
-        elif turn_context.activity.type == ActivityTypes.conversation_update:
-            await self.on_conversation_update_activity(turn_context)
-        elif turn_context.activity.type == ActivityTypes.message_reaction:
-            await self.on_message_reaction_activity(turn_context)
-        elif turn_context.activity.type == ActivityTypes.event:
-            await self.on_event_activity(turn_context)
-        elif turn_context.activity.type == ActivityTypes.invoke:
-            invoke_response = await self.on_invoke_activity(turn_context)
-
-            # If OnInvokeActivityAsync has already sent an InvokeResponse, do not send another one.
-            if invoke_response and not turn_context.turn_state.get(
-                ActivityTypes.invoke_response
-            ):
-                response = invoke_response.model_dump(by_alias=True, exclude_none=True)
-                await turn_context.send_activity(
-                    Activity(value=response, type=ActivityTypes.invoke_response)
-                )
-        elif turn_context.activity.type == ActivityTypes.end_of_conversation:
-            await self.on_end_of_conversation_activity(turn_context)
-        elif turn_context.activity.type == ActivityTypes.typing:
-            await self.on_typing_activity(turn_context)
-        elif turn_context.activity.type == ActivityTypes.installation_update:
-            await self.on_installation_update(turn_context)
+        route = self._activity_routes.get(turn_context.activity.type)
+        if route:
+            await route(self, turn_context)
         else:
             await self.on_unrecognized_activity_type(turn_context)
 
+    async def _on_invoke_turn(self, turn_context: TurnContextProtocol):
+        invoke_response = await self.on_invoke_activity(turn_context)
+
+        # If OnInvokeActivityAsync has already sent an InvokeResponse, do not send another one.
+        if invoke_response and not turn_context.turn_state.get(
+            ActivityTypes.invoke_response
+        ):
+            response = invoke_response.model_dump(by_alias=True, exclude_none=True)
+            await turn_context.send_activity(
+                Activity(value=response, type=ActivityTypes.invoke_response)
+            )
+
     async def on_message_activity(  # pylint: disable=unused-argument
         self, turn_context: TurnContextProtocol
     ):
@@ -473,22 +541,9 @@ class ActivityHandler(Agent):
         :returns: A task that represents the work queued to execute
         """
         try:
-            if (
-                turn_context.activity.name
-                == SignInConstants.verify_state_operation_name
-                or turn_context.activity.name
-                == SignInConstants.token_exchange_operation_name
-            ):
-                await self.on_sign_in_invoke(turn_context)
-                return self._create_invoke_response()
-
-            if turn_context.activity.name == "adaptiveCard/action":
-                invoke_value = self._get_adaptive_card_invoke_value(
-                    turn_context.activity
-                )
-                return self._create_invoke_response(
-                    await self.on_adaptive_card_invoke(turn_context, invoke_value)
-                )
+            route = self._invoke_routes.get(turn_context.activity.name)
+            if route:
+                return self._create_invoke_response(await route(self, turn_context))
 
             raise _InvokeResponseException(HTTPStatus.NOT_IMPLEMENTED)
         except _InvokeResponseException as invoke_exception:
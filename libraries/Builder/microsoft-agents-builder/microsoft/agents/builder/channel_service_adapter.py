@@ -3,11 +3,22 @@
 
 from __future__ import annotations
 
-from asyncio import sleep
+from asyncio import Lock, Queue, Semaphore, Task, create_task, gather, sleep
 from abc import ABC
 from copy import Error
+from functools import partial
 from http import HTTPStatus
-from typing import Awaitable, Callable, cast
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Optional,
+    TypeVar,
+    Union,
+    cast,
+)
 from uuid import uuid4
 
 from microsoft.agents.core.models import (
@@ -29,20 +40,51 @@ from microsoft.agents.connector import (
     ConnectorClientBase,
     UserTokenClientBase,
     ConnectorClient,
-    UserTokenClient,
 )
 from microsoft.agents.authorization import AuthenticationConstants, ClaimsIdentity
 from .channel_service_client_factory_base import ChannelServiceClientFactoryBase
 from .channel_adapter import ChannelAdapter
+from .conversation_turn_scheduler import ConversationTurnScheduler
+from .lazy_user_token_client import LazyUserTokenClient
+from .proactive_result import ProactiveResult, _RateLimitedSender, _TokenBucket
 from .turn_context import TurnContext
 
+T = TypeVar("T")
+
 
 class ChannelServiceAdapter(ChannelAdapter, ABC):
     _AGENT_CONNECTOR_CLIENT_KEY = "ConnectorClient"
+    _RATE_LIMITED_SENDER_KEY = "RateLimitedSender"
 
-    def __init__(self, channel_service_client_factory: ChannelServiceClientFactoryBase):
+    def __init__(
+        self,
+        channel_service_client_factory: ChannelServiceClientFactoryBase,
+        *,
+        pipelined_delivery: bool = False,
+        max_concurrent_sends: int = 4,
+        unordered_channels: Optional[Iterable[str]] = None,
+        turn_scheduler: Optional[ConversationTurnScheduler] = None,
+    ):
+        """
+        :param channel_service_client_factory: The factory to use to create the channel service client.
+        :param pipelined_delivery: True to overlap the requests of the activities passed to
+        send_activities instead of sending them one after the other. Only activities on
+        unordered_channels, or of different conversations, can overlap: a call sending to a
+        single conversation of another channel is sent one after the other, as without it.
+        :param max_concurrent_sends: Maximum number of concurrent requests per send_activities
+        call when pipelined_delivery is enabled.
+        :param unordered_channels: Channels that do not need the activities of a conversation to
+        be delivered in order. On other channels, activities of the same conversation are still
+        sent one after the other.
+        :param turn_scheduler: Runs the turns of process_activity one after the other per
+        conversation, so that concurrent turns of a conversation cannot race on its state.
+        """
         super().__init__()
         self._channel_service_client_factory = channel_service_client_factory
+        self._pipelined_delivery = pipelined_delivery
+        self._max_concurrent_sends = max_concurrent_sends
+        self._unordered_channels = frozenset(unordered_channels or ())
+        self._turn_scheduler = turn_scheduler
 
     async def send_activities(
         self, context: TurnContext, activities: list[Activity]
@@ -56,51 +98,128 @@ class ChannelServiceAdapter(ChannelAdapter, ABC):
         if len(activities) == 0:
             raise TypeError("Expecting one or more activities, but the list was empty.")
 
+        if (
+            self._pipelined_delivery
+            and len(activities) > 1
+            and self._can_overlap(activities)
+        ):
+            return await self._send_activities_pipelined(context, activities)
+
         responses = []
 
         for activity in activities:
             activity.id = None
+            responses.append(await self._send_activity(context, activity))
 
-            response = ResourceResponse()
-
-            if activity.type == "delay":
-                delay_time = int((activity.value or 1000) / 1000)
-                await sleep(delay_time)
-            elif activity.type == ActivityTypes.invoke_response:
-                context.turn_state[self.INVOKE_RESPONSE_KEY] = activity
-            elif (
-                activity.type == ActivityTypes.trace
-                and activity.channel_id != Channels.emulator
-            ):
-                # no-op
-                pass
-            else:
-                connector_client = cast(
-                    ConnectorClientBase,
-                    context.turn_state.get(self._AGENT_CONNECTOR_CLIENT_KEY),
-                )
-                if not connector_client:
-                    raise Error("Unable to extract ConnectorClient from turn context.")
+        return responses
 
-                if activity.reply_to_id:
-                    response = await connector_client.conversations.reply_to_activity(
-                        activity.conversation.id,
-                        activity.reply_to_id,
-                        activity,
-                    )
+    def _can_overlap(self, activities: list[Activity]) -> bool:
+        conversation_ids = set()
+        for activity in activities:
+            if activity.channel_id in self._unordered_channels:
+                return True
+            conversation_ids.add(
+                activity.conversation.id if activity.conversation else None
+            )
+
+        return len(conversation_ids) > 1
+
+    async def _send_activities_pipelined(
+        self, context: TurnContext, activities: list[Activity]
+    ) -> list[ResourceResponse]:
+        responses: list[ResourceResponse] = [None] * len(activities)
+        semaphore = Semaphore(self._max_concurrent_sends)
+        # Last task sent on each ordering lane, the next activity of the lane waits for it.
+        lanes: dict[object, Task] = {}
+        pending: list[Task] = []
+
+        async def send(index: int, activity: Activity, previous: Optional[Task]):
+            if previous:
+                await previous
+            async with semaphore:
+                responses[index] = await self._send_activity(context, activity)
+
+        try:
+            for index, activity in enumerate(activities):
+                activity.id = None
+
+                if activity.type in ("delay", ActivityTypes.typing):
+                    # Delays and typing indicators are ordering barriers for everything around them.
+                    await gather(*pending)
+                    pending.clear()
+                    lanes.clear()
+                    responses[index] = await self._send_activity(context, activity)
+                    continue
+
+                if activity.channel_id in self._unordered_channels:
+                    lane = index
                 else:
-                    response = (
-                        await connector_client.conversations.send_to_conversation(
-                            activity.conversation.id,
-                            activity,
-                        )
-                    )
-            response = response or ResourceResponse(id=activity.id or "")
+                    lane = activity.conversation.id if activity.conversation else None
 
-            responses.append(response)
+                task = create_task(send(index, activity, lanes.get(lane)))
+                lanes[lane] = task
+                pending.append(task)
+
+            await gather(*pending)
+        except BaseException:
+            for task in pending:
+                task.cancel()
+            raise
 
         return responses
 
+    async def _send_activity(
+        self, context: TurnContext, activity: Activity
+    ) -> ResourceResponse:
+        response = ResourceResponse()
+
+        if activity.type == "delay":
+            await sleep((activity.value or 1000) / 1000)
+        elif activity.type == ActivityTypes.invoke_response:
+            context.turn_state[self.INVOKE_RESPONSE_KEY] = activity
+        elif (
+            activity.type == ActivityTypes.trace
+            and activity.channel_id != Channels.emulator
+        ):
+            # no-op
+            pass
+        else:
+            connector_client = cast(
+                ConnectorClientBase,
+                context.turn_state.get(self._AGENT_CONNECTOR_CLIENT_KEY),
+            )
+            if not connector_client:
+                raise Error("Unable to extract ConnectorClient from turn context.")
+
+            if activity.reply_to_id:
+                request = partial(
+                    connector_client.conversations.reply_to_activity,
+                    activity.conversation.id,
+                    activity.reply_to_id,
+                    activity,
+                )
+            else:
+                request = partial(
+                    connector_client.conversations.send_to_conversation,
+                    activity.conversation.id,
+                    activity,
+                )
+            response = await self._send_request(context, request)
+
+        return response or ResourceResponse(id=activity.id or "")
+
+    async def _send_request(
+        self, context: TurnContext, request: Callable[[], Awaitable[T]]
+    ) -> T:
+        # Proactive turns of continue_conversations rate limit and retry their requests.
+        sender: _RateLimitedSender = context.turn_state.get(
+            self._RATE_LIMITED_SENDER_KEY
+        )
+        if sender:
+            return await sender.send(request)
+
+        return await request()
+
     async def update_activity(self, context: TurnContext, activity: Activity):
         if not context:
             raise TypeError("Expected TurnContext but got None instead")
@@ -115,8 +234,14 @@ class ChannelServiceAdapter(ChannelAdapter, ABC):
         if not connector_client:
             raise Error("Unable to extract ConnectorClient from turn context.")
 
-        return await connector_client.conversations.update_activity(
-            activity.conversation.id, activity.id, activity
+        return await self._send_request(
+            context,
+            partial(
+                connector_client.conversations.update_activity,
+                activity.conversation.id,
+                activity.id,
+                activity,
+            ),
         )
 
     async def delete_activity(
@@ -135,8 +260,13 @@ class ChannelServiceAdapter(ChannelAdapter, ABC):
         if not connector_client:
             raise Error("Unable to extract ConnectorClient from turn context.")
 
-        await connector_client.conversations.delete_activity(
-            reference.conversation.id, reference.activity_id
+        await self._send_request(
+            context,
+            partial(
+                connector_client.conversations.delete_activity,
+                reference.conversation.id,
+                reference.activity_id,
+            ),
         )
 
     async def continue_conversation(  # pylint: disable=arguments-differ
@@ -175,6 +305,126 @@ class ChannelServiceAdapter(ChannelAdapter, ABC):
             callback,
         )
 
+    async def continue_conversations(
+        self,
+        agent_app_id: str,
+        references: Union[
+            Iterable[ConversationReference], AsyncIterable[ConversationReference]
+        ],
+        callback: Callable[[TurnContext], Awaitable],
+        *,
+        max_concurrency: int = 16,
+        requests_per_second: Optional[float] = None,
+        max_attempts: int = 3,
+    ) -> AsyncIterator[ProactiveResult]:
+        """
+        Runs a proactive turn for each conversation reference, such as to broadcast a message.
+
+        Each turn gets its connector client from the factory, which can reuse them while their
+        token is valid. When a service URL answers 429 to a request of a turn, the requests to
+        it pause for the time given by Retry-After and the rejected request is sent again,
+        without running the turn again.
+
+        :param agent_app_id: The application Id of the agent.
+        :param references: The conversations to continue, read as the turns progress.
+        :param callback: The method to call for each resulting agent turn.
+        :param max_concurrency: Maximum number of turns running at the same time.
+        :param requests_per_second: Maximum rate of the requests sent, updated or deleted
+        activities, per service URL, None for no limit.
+        :param max_attempts: Maximum number of times a request is sent when it is rate limited.
+        :return: The result of each reference, in completion order.
+        """
+        if not callback:
+            raise TypeError(
+                "ChannelServiceAdapter.continue_conversations(): callback is required."
+            )
+        if max_concurrency <= 0:
+            raise ValueError(
+                "ChannelServiceAdapter.continue_conversations(): max_concurrency must be greater than 0"
+            )
+
+        claims_identity = self.create_claims_identity(agent_app_id)
+        audience = claims_identity.get_token_audience()
+        buckets: dict[str, _TokenBucket] = {}
+        user_token_client = LazyUserTokenClient(
+            lambda: self._channel_service_client_factory.create_user_token_client(
+                claims_identity
+            )
+        )
+        iterator = _aiter(references)
+        next_lock = Lock()
+        results: Queue = Queue(max_concurrency)
+
+        async def run_turn(reference: ConversationReference) -> ProactiveResult:
+            activity = reference.get_continuation_activity()
+            service_url = activity.service_url
+            bucket = buckets.get(service_url)
+            if bucket is None:
+                bucket = buckets[service_url] = _TokenBucket(
+                    requests_per_second, max(requests_per_second or 1, 1)
+                )
+            sender = _RateLimitedSender(bucket, max_attempts)
+
+            try:
+                self._validate_continuation_activity(activity)
+                connector_client = (
+                    await self._channel_service_client_factory.create_connector_client(
+                        claims_identity, service_url, audience
+                    )
+                )
+                try:
+                    context = self._create_turn_context(
+                        activity,
+                        claims_identity,
+                        audience,
+                        connector_client,
+                        user_token_client,
+                        callback,
+                    )
+                    context.turn_state[self._RATE_LIMITED_SENDER_KEY] = sender
+                    # Errors are reported in the results instead of being handled by on_turn_error.
+                    await self.middleware_set.receive_activity_with_status(
+                        context, callback
+                    )
+                finally:
+                    await connector_client.close()
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                return ProactiveResult(reference, error, sender.retries)
+
+            return ProactiveResult(reference, None, sender.retries)
+
+        async def work():
+            while True:
+                async with next_lock:
+                    try:
+                        reference = await iterator.__anext__()
+                    except StopAsyncIteration:
+                        return
+                await results.put(await run_turn(reference))
+
+        async def run_workers():
+            try:
+                await gather(*workers)
+            finally:
+                await results.put(None)
+
+        workers = [create_task(work()) for _ in range(max_concurrency)]
+        runner = create_task(run_workers())
+        try:
+            while True:
+                result = await results.get()
+                if result is None:
+                    break
+                yield result
+
+            # Raises the error of the references iterator, if any.
+            await runner
+        finally:
+            for task in (*workers, runner):
+                task.cancel()
+            await gather(*workers, runner, return_exceptions=True)
+            await user_token_client.close()
+
     async def continue_conversation_with_claims(
         self,
         claims_identity: ClaimsIdentity,
@@ -229,9 +479,10 @@ class ChannelServiceAdapter(ChannelAdapter, ABC):
             create_conversation_result, channel_id, service_url, conversation_parameters
         )
 
-        # Create a UserTokenClient instance for the application to use. (For example, in the OAuthPrompt.)
-        user_token_client: UserTokenClient = (
-            await self._channel_service_client_factory.create_user_token_client(
+        # Create a UserTokenClient for the application to use (for example, in the OAuthPrompt)
+        # the first time it is needed.
+        user_token_client = LazyUserTokenClient(
+            lambda: self._channel_service_client_factory.create_user_token_client(
                 claims_identity
             )
         )
@@ -266,9 +517,10 @@ class ChannelServiceAdapter(ChannelAdapter, ABC):
             )
         )
 
-        # Create a UserTokenClient instance for the application to use. (For example, in the OAuthPrompt.)
-        user_token_client: UserTokenClient = (
-            await self._channel_service_client_factory.create_user_token_client(
+        # Create a UserTokenClient for the application to use (for example, in the OAuthPrompt)
+        # the first time it is needed.
+        user_token_client = LazyUserTokenClient(
+            lambda: self._channel_service_client_factory.create_user_token_client(
                 claims_identity
             )
         )
@@ -315,6 +567,32 @@ class ChannelServiceAdapter(ChannelAdapter, ABC):
             If the task completes successfully, then an :class:`InvokeResponse` is returned;
             otherwise. `null` is returned.
         """
+        turn = await self._prepare_activity_turn(claims_identity, activity, callback)
+        return await self._run_activity_turn(activity, turn)
+
+    async def _run_activity_turn(
+        self, activity: Activity, turn: _ActivityTurn
+    ) -> InvokeResponse:
+        if self._turn_scheduler:
+            return await self._turn_scheduler.run(
+                activity.conversation.id if activity.conversation else None, turn
+            )
+
+        return await turn()
+
+    async def _prepare_activity_turn(
+        self,
+        claims_identity: ClaimsIdentity,
+        activity: Activity,
+        callback: Callable[[TurnContext], Awaitable],
+    ) -> _ActivityTurn:
+        """
+        Creates the clients of the turn of an incoming activity, which fails with PermissionError
+        when the request cannot be authenticated.
+
+        :return: Called without arguments, returns the awaitable running the turn. Its close
+        method releases the clients of a turn that will not run.
+        """
         scopes: list[str] = None
         outgoing_audience: str = None
 
@@ -344,9 +622,9 @@ class ChannelServiceAdapter(ChannelAdapter, ABC):
             )
         )
 
-        # Create a UserTokenClient instance for the OAuth flow.
-        user_token_client: UserTokenClient = (
-            await self._channel_service_client_factory.create_user_token_client(
+        # Create a UserTokenClient for the OAuth flow the first time it is needed.
+        user_token_client = LazyUserTokenClient(
+            lambda: self._channel_service_client_factory.create_user_token_client(
                 claims_identity, use_anonymous_auth_callback
             )
         )
@@ -361,13 +639,9 @@ class ChannelServiceAdapter(ChannelAdapter, ABC):
             callback,
         )
 
-        await self.run_pipeline(context, callback)
-
-        await connector_client.close()
-        await user_token_client.close()
-
-        # If there are any results they will have been left on the TurnContext.
-        return self._process_turn_results(context)
+        return _ActivityTurn(
+            self, context, callback, connector_client, user_token_client
+        )
 
     def create_claims_identity(self, agent_app_id: str = "") -> ClaimsIdentity:
         return ClaimsIdentity(
@@ -460,3 +734,41 @@ class ChannelServiceAdapter(ChannelAdapter, ABC):
 
         # No body to return
         return None
+
+
+class _ActivityTurn:
+    def __init__(
+        self,
+        adapter: ChannelServiceAdapter,
+        context: TurnContext,
+        callback: Callable[[TurnContext], Awaitable],
+        connector_client: ConnectorClientBase,
+        user_token_client: UserTokenClientBase,
+    ):
+        self._adapter = adapter
+        self._context = context
+        self._callback = callback
+        self._connector_client = connector_client
+        self._user_token_client = user_token_client
+
+    async def __call__(self) -> InvokeResponse:
+        try:
+            await self._adapter.run_pipeline(self._context, self._callback)
+        finally:
+            await self.close()
+
+        # If there are any results they will have been left on the TurnContext.
+        return self._adapter._process_turn_results(self._context)
+
+    async def close(self) -> None:
+        await self._connector_client.close()
+        await self._user_token_client.close()
+
+
+async def _aiter(references) -> AsyncIterator:
+    if hasattr(references, "__aiter__"):
+        async for reference in references:
+            yield reference
+    else:
+        for reference in references:
+            yield reference
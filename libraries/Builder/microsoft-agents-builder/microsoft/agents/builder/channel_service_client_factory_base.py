@@ -39,3 +39,9 @@ class ChannelServiceClientFactoryBase(Protocol):
         :return: Asynchronous Task with UserTokenClientBase instance.
         """
         pass
+
+    async def close(self) -> None:
+        """
+        Releases the resources shared by the clients created by this factory.
+        """
+        pass
@@ -0,0 +1,80 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from asyncio import Lock, Semaphore
+from typing import Awaitable, Callable, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Lane:
+    __slots__ = ("lock", "users")
+
+    def __init__(self):
+        self.lock = Lock()
+        self.users = 0
+
+
+class ConversationTurnScheduler:
+    """
+    Runs the turns of a conversation one after the other, in the order they arrive, while
+    turns of different conversations run concurrently up to a global limit.
+
+    Must be used from a single event loop, which is the one of the first turn run. A turn must
+    not wait for another turn of its own conversation, which would never start.
+    """
+
+    def __init__(self, max_concurrency: int = 64):
+        """
+        :param max_concurrency: Maximum number of turns running at the same time, across all
+        conversations.
+        """
+        if max_concurrency <= 0:
+            raise ValueError(
+                "ConversationTurnScheduler: max_concurrency must be greater than 0"
+            )
+
+        self.max_concurrency = max_concurrency
+        # Created with the first turn, on Python 3.9 it binds to the loop running when created.
+        self._semaphore: Optional[Semaphore] = None
+        # Only conversations with a turn running or waiting have a lane.
+        self._lanes: dict[Hashable, _Lane] = {}
+
+    @property
+    def conversation_count(self) -> int:
+        """
+        The number of conversations with a turn running or waiting.
+        """
+        return len(self._lanes)
+
+    async def run(
+        self, conversation_key: Optional[Hashable], turn: Callable[[], Awaitable[T]]
+    ) -> T:
+        """
+        Runs a turn once the previous turns of its conversation completed.
+
+        :param conversation_key: Identifies the conversation, None to only apply the global limit.
+        :param turn: Called without arguments, returns the awaitable running the turn.
+        :return: The result of the turn.
+        """
+        if self._semaphore is None:
+            self._semaphore = Semaphore(self.max_concurrency)
+
+        if conversation_key is None:
+            async with self._semaphore:
+                return await turn()
+
+        lane = self._lanes.get(conversation_key)
+        if lane is None:
+            lane = self._lanes[conversation_key] = _Lane()
+        lane.users += 1
+
+        try:
+            # The lane is entered first, so that a busy conversation holds a single slot of the global limit.
+            async with lane.lock:
+                async with self._semaphore:
+                    return await turn()
+        finally:
+            lane.users -= 1
+            if not lane.users:
+                del self._lanes[conversation_key]
@@ -0,0 +1,97 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from asyncio import CancelledError, Future, get_running_loop, shield
+from typing import Any, Awaitable, Callable, Optional
+
+from microsoft.agents.connector import UserTokenClientBase
+from microsoft.agents.connector.agent_sign_in_base import AgentSignInBase
+from microsoft.agents.connector.user_token_base import UserTokenBase
+
+
+class _LazyOperations:
+    """
+    Forwards calls to an operations group of the user token client, creating the client
+    on the first call.
+    """
+
+    def __init__(self, lazy_client: "LazyUserTokenClient", operations_name: str):
+        self._lazy_client = lazy_client
+        self._operations_name = operations_name
+
+    def __getattr__(self, method_name: str) -> Callable[..., Awaitable[Any]]:
+        async def call(*args, **kwargs):
+            client = await self._lazy_client.get_client()
+            operations = getattr(client, self._operations_name)
+            return await getattr(operations, method_name)(*args, **kwargs)
+
+        return call
+
+
+class LazyUserTokenClient(UserTokenClientBase):
+    """
+    A UserTokenClientBase that only creates the underlying client, and acquires its token,
+    the first time one of its operations is used.
+    """
+
+    def __init__(self, create_client: Callable[[], Awaitable[UserTokenClientBase]]):
+        """
+        :param create_client: Creates the underlying user token client.
+        """
+        self._create_client = create_client
+        self._client: Optional[Future] = None
+        self._agent_sign_in = _LazyOperations(self, "agent_sign_in")
+        self._user_token = _LazyOperations(self, "user_token")
+
+    @property
+    def agent_sign_in(self) -> AgentSignInBase:
+        return self._agent_sign_in
+
+    @property
+    def user_token(self) -> UserTokenBase:
+        return self._user_token
+
+    @property
+    def is_created(self) -> bool:
+        """
+        Gets whether the underlying client was created.
+        """
+        return self._client is not None
+
+    async def get_client(self) -> UserTokenClientBase:
+        """
+        Gets the underlying user token client, creating it on first use.
+        """
+        while self._client is not None:
+            client = self._client
+            try:
+                # Shielded, so that a cancelled caller does not cancel the creation others wait for.
+                return await shield(client)
+            except CancelledError:
+                if not client.cancelled():
+                    raise
+                # The caller creating the client was cancelled, the creation is started again.
+
+        # Concurrent first uses in the same turn share a single creation.
+        client = self._client = get_running_loop().create_future()
+        try:
+            result = await self._create_client()
+        except BaseException as error:
+            # Resets the creation, so that the next call retries it.
+            self._client = None
+            if isinstance(error, CancelledError):
+                client.cancel()
+            else:
+                client.set_exception(error)
+                client.exception()
+            raise
+
+        client.set_result(result)
+        return result
+
+    async def close(self) -> None:
+        """
+        Closes the underlying client if it was created.
+        """
+        if self._client is not None and self._client.done():
+            await self._client.result().close()
@@ -2,6 +2,7 @@
 # Licensed under the MIT License.
 
 from abc import abstractmethod
+from functools import partial
 from typing import Awaitable, Callable, Protocol
 
 from .turn_context import TurnContext
@@ -15,16 +16,23 @@ class Middleware(Protocol):
         pass
 
 
+_Pipeline = Callable[[TurnContext, Callable[[TurnContext], Awaitable]], Awaitable]
+
+
 class MiddlewareSet(Middleware):
     """
     A set of `Middleware` plugins. The set itself is middleware so you can easily package up a set
     of middleware that can be composed into an agent with a single `agent.use(mySet)` call or even into
     another middleware set using `set.use(mySet)`.
+
+    The chain of middleware is built once by `use()`, a turn only binds the context to each step.
     """
 
     def __init__(self):
         super(MiddlewareSet, self).__init__()
         self._middleware: list[Middleware] = []
+        # The pipeline starting at each middleware index, the last one only calls the callback.
+        self._pipelines: list[_Pipeline] = [_call_callback]
 
     def use(self, *middleware: Middleware):
         """
@@ -33,13 +41,15 @@ class MiddlewareSet(Middleware):
         :return:
         """
         for idx, mid in enumerate(middleware):
-            if hasattr(mid, "on_turn") and callable(mid.on_turn):
-                self._middleware.append(mid)
-                return self
-            raise TypeError(
-                'MiddlewareSet.use(): invalid middleware at index "%s" being added.'
-                % idx
-            )
+            if not (hasattr(mid, "on_turn") and callable(mid.on_turn)):
+                raise TypeError(
+                    'MiddlewareSet.use(): invalid middleware at index "%s" being added.'
+                    % idx
+                )
+
+        self._middleware.extend(middleware)
+        self._pipelines = _compile(self._middleware)
+        return self
 
     async def receive_activity(self, context: TurnContext):
         await self.receive_activity_internal(context, None)
@@ -53,7 +63,7 @@ class MiddlewareSet(Middleware):
     async def receive_activity_with_status(
         self, context: TurnContext, callback: Callable[[TurnContext], Awaitable]
     ):
-        return await self.receive_activity_internal(context, callback)
+        return await self._pipelines[0](context, callback)
 
     async def receive_activity_internal(
         self,
@@ -61,18 +71,26 @@ class MiddlewareSet(Middleware):
         callback: Callable[[TurnContext], Awaitable],
         next_middleware_index: int = 0,
     ):
-        if next_middleware_index == len(self._middleware):
-            if callback is not None:
-                return await callback(context)
-            return None
-        next_middleware = self._middleware[next_middleware_index]
-
-        async def call_next_middleware():
-            return await self.receive_activity_internal(
-                context, callback, next_middleware_index + 1
-            )
-
-        try:
-            return await next_middleware.on_turn(context, call_next_middleware)
-        except Exception as error:
-            raise error
+        return await self._pipelines[next_middleware_index](context, callback)
+
+
+def _compile(middleware: list[Middleware]) -> list[_Pipeline]:
+    pipelines = [_call_callback]
+    for mid in reversed(middleware):
+        pipelines.append(partial(_call_middleware, mid.on_turn, pipelines[-1]))
+
+    pipelines.reverse()
+    return pipelines
+
+
+def _call_middleware(
+    on_turn, next_pipeline: _Pipeline, context: TurnContext, callback
+) -> Awaitable:
+    # Not a coroutine itself, so that a turn awaits no extra frame per middleware.
+    return on_turn(context, partial(next_pipeline, context, callback))
+
+
+async def _call_callback(context: TurnContext, callback):
+    if callback is not None:
+        return await callback(context)
+    return None
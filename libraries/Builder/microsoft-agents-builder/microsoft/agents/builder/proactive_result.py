@@ -0,0 +1,124 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from asyncio import sleep
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from time import monotonic
+from typing import Awaitable, Callable, NamedTuple, Optional, TypeVar
+
+from microsoft.agents.core.models import ConversationReference
+
+_TOO_MANY_REQUESTS = 429
+
+T = TypeVar("T")
+
+
+class ProactiveResult(NamedTuple):
+    """
+    The outcome of the proactive turn of one conversation reference.
+    """
+
+    reference: ConversationReference
+    error: Optional[BaseException] = None
+    retries: int = 0
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+class _TokenBucket:
+    """
+    Spaces out the requests sent to a service URL, and pauses them all when it answers 429.
+    """
+
+    def __init__(self, rate: Optional[float], capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = monotonic()
+        self.paused_until = 0.0
+
+    async def acquire(self) -> None:
+        while True:
+            now = monotonic()
+            if now < self.paused_until:
+                await sleep(self.paused_until - now)
+                continue
+
+            if self.rate is None:
+                return
+
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated_at) * self.rate
+            )
+            self.updated_at = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+
+            await sleep((1 - self.tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        self.paused_until = max(self.paused_until, monotonic() + seconds)
+
+
+class _RateLimitedSender:
+    """
+    Sends the requests of a turn through the token bucket of its service URL, retrying those
+    rejected with 429 instead of running the turn again.
+    """
+
+    def __init__(self, bucket: _TokenBucket, max_attempts: int):
+        self.bucket = bucket
+        self.max_attempts = max_attempts
+        self.retries = 0
+
+    async def send(self, request: Callable[[], Awaitable[T]]) -> T:
+        for attempt in range(1, self.max_attempts + 1):
+            await self.bucket.acquire()
+            try:
+                return await request()
+            except Exception as error:
+                if not _is_too_many_requests(error) or attempt == self.max_attempts:
+                    raise
+
+                retry_after = _get_retry_after(error)
+                self.bucket.pause(
+                    retry_after
+                    if retry_after is not None
+                    else min(2 ** (attempt - 1), 30)
+                )
+                self.retries += 1
+
+
+def _is_too_many_requests(error: BaseException) -> bool:
+    """
+    Works with any HTTP error exposing its status, such as aiohttp's.
+    """
+    return getattr(error, "status", None) == _TOO_MANY_REQUESTS
+
+
+def _get_retry_after(error: BaseException) -> Optional[float]:
+    """
+    Gets the seconds to wait given by the Retry-After header of an HTTP error, None when it has
+    none or it cannot be parsed.
+    """
+    value = (getattr(error, "headers", None) or {}).get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
@@ -1,5 +1,8 @@
+from time import time
 from typing import Any, Optional
 
+import jwt
+
 from microsoft.agents.authorization import (
     AuthenticationConstants,
     AnonymousTokenProvider,
@@ -8,7 +11,7 @@ from microsoft.agents.authorization import (
 )
 from microsoft.agents.authorization import AccessTokenProviderBase
 from microsoft.agents.connector import ConnectorClientBase
-from microsoft.agents.connector.client import UserTokenClient
+from microsoft.agents.connector.client import ClientSessionPool, UserTokenClient
 from microsoft.agents.connector.teams import TeamsConnectorClient
 
 from .channel_service_client_factory_base import ChannelServiceClientFactoryBase
@@ -17,16 +20,37 @@ from .channel_service_client_factory_base import ChannelServiceClientFactoryBase
 class RestChannelServiceClientFactory(ChannelServiceClientFactoryBase):
     _ANONYMOUS_TOKEN_PROVIDER = AnonymousTokenProvider()
 
+    # Cached clients are rebuilt with a new token this many seconds before it expires.
+    CLIENT_REFRESH_BEFORE_EXPIRY = 5 * 60
+
     def __init__(
         self,
         configuration: Any,
         connections: Connections,
         token_service_endpoint=AuthenticationConstants.AGENTS_SDK_OAUTH_URL,
         token_service_audience=AuthenticationConstants.AGENTS_SDK_SCOPE,
+        session_pool: Optional[ClientSessionPool] = None,
+        cache_clients: bool = False,
     ) -> None:
+        """
+        :param configuration: The agent configuration.
+        :param connections: The connections used to get token providers.
+        :param token_service_endpoint: The endpoint of the user token service.
+        :param token_service_audience: The audience of the user token service.
+        :param session_pool: When provided, clients send their requests over the pool's
+        long-lived sessions instead of opening a new session per client.
+        :param cache_clients: True to reuse built clients until their access token nears
+        expiry. Cached clients always use pooled sessions, a pool is created if none is provided.
+        """
         self._connections = connections
         self._token_service_endpoint = token_service_endpoint
         self._token_service_audience = token_service_audience
+        self._session_pool = session_pool
+        self._cache_clients = cache_clients
+        self._clients: dict[tuple, tuple[float, Any]] = {}
+
+        if cache_clients and not session_pool:
+            self._session_pool = ClientSessionPool()
 
     async def create_connector_client(
         self,
@@ -45,24 +69,49 @@ class RestChannelServiceClientFactory(ChannelServiceClientFactoryBase):
                 "RestChannelServiceClientFactory.create_connector_client: audience can't be None or Empty"
             )
 
+        scopes = scopes or [f"{audience}/.default"]
+        cache_key = (
+            "connector",
+            service_url,
+            audience,
+            tuple(scopes),
+            claims_identity.get_app_id(),
+            use_anonymous,
+        )
+        connector_client = self._get_cached_client(cache_key)
+        if connector_client:
+            return connector_client
+
         token_provider: AccessTokenProviderBase = (
             self._connections.get_token_provider(claims_identity, service_url)
             if not use_anonymous
             else self._ANONYMOUS_TOKEN_PROVIDER
         )
 
-        token = await token_provider.get_access_token(
-            audience, scopes or [f"{audience}/.default"]
-        )
+        token = await token_provider.get_access_token(audience, scopes)
 
-        return TeamsConnectorClient(
+        connector_client = TeamsConnectorClient(
             endpoint=service_url,
             token=token,
+            session=self._get_session(service_url),
         )
+        self._cache_client(cache_key, token, connector_client)
+        return connector_client
 
     async def create_user_token_client(
         self, claims_identity: ClaimsIdentity, use_anonymous: bool = False
     ) -> UserTokenClient:
+        cache_key = (
+            "user_token",
+            self._token_service_endpoint,
+            self._token_service_audience,
+            claims_identity.get_app_id(),
+            use_anonymous,
+        )
+        user_token_client = self._get_cached_client(cache_key)
+        if user_token_client:
+            return user_token_client
+
         token_provider = (
             self._connections.get_token_provider(
                 claims_identity, self._token_service_endpoint
@@ -74,7 +123,59 @@ class RestChannelServiceClientFactory(ChannelServiceClientFactoryBase):
         token = await token_provider.get_access_token(
             self._token_service_audience, [f"{self._token_service_audience}/.default"]
         )
-        return UserTokenClient(
+        user_token_client = UserTokenClient(
             endpoint=self._token_service_endpoint,
             token=token,
+            session=self._get_session(self._token_service_endpoint),
         )
+        self._cache_client(cache_key, token, user_token_client)
+        return user_token_client
+
+    async def close(self) -> None:
+        self._clients.clear()
+        if self._session_pool:
+            await self._session_pool.close()
+
+    def _get_session(self, endpoint: str):
+        if not self._session_pool:
+            return None
+
+        return self._session_pool.get_session(endpoint)
+
+    def _get_cached_client(self, cache_key: tuple) -> Optional[Any]:
+        if not self._cache_clients:
+            return None
+
+        entry = self._clients.get(cache_key)
+        if entry is None:
+            return None
+
+        expires_at, client = entry
+        if time() >= expires_at:
+            del self._clients[cache_key]
+            return None
+
+        return client
+
+    def _cache_client(self, cache_key: tuple, token: str, client: Any) -> None:
+        if not self._cache_clients:
+            return
+
+        if not token:
+            # Anonymous clients carry no token that could expire.
+            self._clients[cache_key] = (float("inf"), client)
+            return
+
+        try:
+            expiration = jwt.decode(token, options={"verify_signature": False}).get(
+                "exp"
+            )
+        except jwt.PyJWTError:
+            expiration = None
+
+        # Clients holding a token of unknown lifetime are not reused.
+        if expiration:
+            self._clients[cache_key] = (
+                float(expiration) - self.CLIENT_REFRESH_BEFORE_EXPIRY,
+                client,
+            )
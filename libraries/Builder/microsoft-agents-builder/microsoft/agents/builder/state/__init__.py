@@ -1,5 +1,6 @@
 from .agent_state import AgentState
+from .agent_state_set import AgentStateSet
 from .state_property_accessor import StatePropertyAccessor
 from .user_state import UserState
 
-__all__ = ["AgentState", "StatePropertyAccessor", "UserState"]
+__all__ = ["AgentState", "AgentStateSet", "StatePropertyAccessor", "UserState"]
@@ -5,9 +5,10 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from copy import deepcopy
-from typing import Callable, Dict, Union, Type
+from marshal import dumps
+from typing import Callable, Dict, Optional, Set, Union, Type
 
-from microsoft.agents.storage import Storage, StoreItem
+from microsoft.agents.storage import ETagConflictError, Storage, StoreItem
 
 from .state_property_accessor import StatePropertyAccessor
 from ..turn_context import TurnContext
@@ -16,16 +17,28 @@ from ..turn_context import TurnContext
 class CachedAgentState(StoreItem):
     """
     Internal cached bot state.
+
+    .. remarks::
+        Changes made through the property accessors mark the state as dirty. Hashes are only
+        computed for values handed out to callers, as a fallback to detect in-place mutation.
     """
 
-    def __init__(self, state: Dict[str, StoreItem | dict] = None):
-        if state:
-            self.state = state
-            internal_hash = state.pop("CachedAgentState._hash", None)
-            self.hash = internal_hash or self.compute_hash()
-        else:
-            self.state = {}
-            self.hash = hash(str({}))
+    def __init__(
+        self, state: Dict[str, StoreItem | dict] = None, e_tag: Optional[str] = None
+    ):
+        """
+        :param state: The state properties.
+        :param e_tag: The version of the state in storage, an empty string for state that is
+        not stored yet.
+        """
+        self.state = state or {}
+        self.e_tag = e_tag
+        # Earlier versions stored a hash of the state along with it.
+        self.state.pop("CachedAgentState._hash", None)
+        self._is_dirty = False
+        self._dirty_properties: Set[str] = set()
+        self._is_state_tracked = False
+        self._property_hashes: Dict[str, Optional[int]] = {}
 
     @property
     def has_state(self) -> bool:
@@ -33,26 +46,107 @@ class CachedAgentState(StoreItem):
 
     @property
     def is_changed(self) -> bool:
-        return self.hash != self.compute_hash()
+        if self._is_dirty or self._dirty_properties:
+            return True
+
+        if self._is_state_tracked and self.state.keys() - self._property_hashes.keys():
+            return True
+
+        return any(
+            self._compute_property_hash(property_name) != property_hash
+            for property_name, property_hash in self._property_hashes.items()
+        )
+
+    def mark_dirty(self, property_name: Optional[str] = None) -> None:
+        """
+        Marks a property, or the whole state, as changed so that it is saved without comparing hashes.
+        """
+        if property_name is None:
+            self._is_dirty = True
+        else:
+            self._dirty_properties.add(property_name)
+
+    def track_property(self, property_name: str) -> None:
+        """
+        Remembers the hash of a property value handed out to a caller, which may mutate it in place.
+        """
+        if property_name not in self._property_hashes:
+            self._property_hashes[property_name] = (
+                None
+                if self._is_dirty or property_name in self._dirty_properties
+                else self._compute_property_hash(property_name)
+            )
 
-    def compute_hash(self) -> str:
-        return hash(str(self.store_item_to_json()))
+    def track_state(self) -> None:
+        """
+        Remembers the hashes of all properties, the state being handed out to a caller as a dictionary.
+        """
+        if not self._is_state_tracked:
+            self._is_state_tracked = True
+            for property_name in self.state:
+                self.track_property(property_name)
+
+    def mark_saved(self) -> None:
+        """
+        Resets change tracking once the state has been written to storage.
+        """
+        self._is_dirty = False
+        self._dirty_properties.clear()
+        if self._is_state_tracked:
+            self._property_hashes.update(dict.fromkeys(self.state))
+        for property_name in self._property_hashes:
+            self._property_hashes[property_name] = self._compute_property_hash(
+                property_name
+            )
+
+    def rebase(self, latest: CachedAgentState) -> CachedAgentState:
+        """
+        Reapplies the changes made to this state on top of a more recent version of it.
+
+        :param latest: The state as last read from storage.
+        :return: The state to write in place of this one.
+        """
+        if self._is_dirty:
+            # The whole state was replaced, it overwrites the latest version.
+            self.e_tag = latest.e_tag
+            return self
+
+        for property_name in self._get_changed_properties():
+            if property_name in self.state:
+                latest.state[property_name] = self.state[property_name]
+                latest.track_property(property_name)
+            else:
+                latest.state.pop(property_name, None)
+            latest.mark_dirty(property_name)
+
+        return latest
 
     def store_item_to_json(self) -> dict:
         if not self.state:
             return {}
         # TODO: Might need to change this check to include Types that implement but not inherit.
-        serialized = {
-            key: value.store_item_to_json() if isinstance(value, StoreItem) else value
-            for key, value in self.state.items()
-        }
-        serialized["CachedAgentState._hash"] = self.hash
-        return serialized
+        return {key: _to_json(value) for key, value in self.state.items()}
 
     @staticmethod
     def from_json_to_store_item(json_data: dict) -> StoreItem:
         return CachedAgentState(json_data)
 
+    def _get_changed_properties(self) -> Set[str]:
+        changed_properties = set(self._dirty_properties)
+        changed_properties.update(
+            property_name
+            for property_name, property_hash in self._property_hashes.items()
+            if property_hash is not None
+            and self._compute_property_hash(property_name) != property_hash
+        )
+        if self._is_state_tracked:
+            changed_properties.update(self.state.keys() - self._property_hashes.keys())
+
+        return changed_properties
+
+    def _compute_property_hash(self, property_name: str) -> int:
+        return _fingerprint(_to_json(self.state.get(property_name)))
+
 
 class AgentState:
     """
@@ -66,6 +160,10 @@ class AgentState:
         You can define additional scopes for your bot.
     """
 
+    # Number of writes save_changes attempts, reloading the state and reapplying its changes
+    # after each ETag conflict.
+    MAX_SAVE_ATTEMPTS = 3
+
     def __init__(self, storage: Storage, context_service_key: str):
         """
         Initializes a new instance of the :class:`BotState` class.
@@ -98,6 +196,26 @@ class AgentState:
         _assert_value(turn_context, self.get_cached_state.__name__)
         return turn_context.turn_state.get(self._context_service_key)
 
+    def set_cached_state(
+        self, turn_context: TurnContext, cached_state: CachedAgentState
+    ) -> None:
+        """
+        Caches the bot state instance for this "BotState" in the turn context.
+
+        :param turn_context: The context object for this turn.
+        :type turn_context: :class:`TurnContext`
+        :param cached_state: The cached bot state instance.
+        """
+        _assert_value(turn_context, self.set_cached_state.__name__)
+        turn_context.turn_state[self._context_service_key] = cached_state
+
+    @property
+    def storage(self) -> Storage:
+        """
+        The storage layer this state management object reads from and writes to.
+        """
+        return self._storage
+
     def create_property(self, name: str) -> StatePropertyAccessor:
         """
         Creates a property definition and registers it with this :class:`BotState`.
@@ -114,8 +232,11 @@ class AgentState:
     def get(self, turn_context: TurnContext) -> Dict[str, StoreItem]:
         _assert_value(turn_context, self.get.__name__)
         cached = self.get_cached_state(turn_context)
+        if cached is None:
+            return None
 
-        return getattr(cached, "state", None)
+        cached.track_state()
+        return cached.state
 
     async def load(self, turn_context: TurnContext, force: bool = False) -> None:
         """
@@ -133,8 +254,9 @@ class AgentState:
 
         if force or not cached_state:
             items = await self._storage.read([storage_key], target_cls=CachedAgentState)
-            val = items.get(storage_key, CachedAgentState())
-            turn_context.turn_state[self._context_service_key] = val
+            self.set_cached_state(
+                turn_context, items.get(storage_key) or CachedAgentState(e_tag="")
+            )
 
     async def save_changes(
         self, turn_context: TurnContext, force: bool = False
@@ -154,9 +276,29 @@ class AgentState:
 
         if force or (cached_state is not None and cached_state.is_changed):
             storage_key = self.get_storage_key(turn_context)
-            changes: Dict[str, StoreItem] = {storage_key: cached_state}
-            await self._storage.write(changes)
-            cached_state.hash = cached_state.compute_hash()
+            for attempt in range(1, self.MAX_SAVE_ATTEMPTS + 1):
+                try:
+                    changes: Dict[str, StoreItem] = {storage_key: cached_state}
+                    await self._storage.write(changes)
+                    cached_state.mark_saved()
+                    return
+                except ETagConflictError:
+                    if attempt == self.MAX_SAVE_ATTEMPTS:
+                        raise
+                    cached_state = await self._reload_and_rebase(
+                        turn_context, cached_state
+                    )
+
+    async def _reload_and_rebase(
+        self, turn_context: TurnContext, cached_state: CachedAgentState
+    ) -> CachedAgentState:
+        storage_key = self.get_storage_key(turn_context)
+        items = await self._storage.read([storage_key], target_cls=CachedAgentState)
+        cached_state = cached_state.rebase(
+            items.get(storage_key) or CachedAgentState(e_tag="")
+        )
+        self.set_cached_state(turn_context, cached_state)
+        return cached_state
 
     async def clear_state(self, turn_context: TurnContext):
         """
@@ -172,10 +314,10 @@ class AgentState:
         """
         _assert_value(turn_context, self.clear_state.__name__)
 
-        #  Explicitly setting the hash will mean IsChanged is always true. And that will force a Save.
+        # Marking the empty state as dirty will mean is_changed is always true. And that will force a Save.
         cache_value = CachedAgentState()
-        cache_value.hash = ""
-        turn_context.turn_state[self._context_service_key] = cache_value
+        cache_value.mark_dirty()
+        self.set_cached_state(turn_context, cache_value)
 
     async def delete(self, turn_context: TurnContext) -> None:
         """
@@ -227,6 +369,7 @@ class AgentState:
         # if there is no value, this will throw, to signal to IPropertyAccesor that a default value should be computed
         # This allows this to work with value types
         value = cached_state.state[property_name]
+        cached_state.track_property(property_name)
 
         if target_cls:
             # Attempt to deserialize the value if it is not None
@@ -256,6 +399,7 @@ class AgentState:
             raise TypeError("BotState.delete_property(): property_name cannot be None.")
         cached_state = self.get_cached_state(turn_context)
         del cached_state.state[property_name]
+        cached_state.mark_dirty(property_name)
 
     async def set_property_value(
         self, turn_context: TurnContext, property_name: str, value: StoreItem
@@ -278,6 +422,7 @@ class AgentState:
             raise TypeError("BotState.delete_property(): property_name cannot be None.")
         cached_state = self.get_cached_state(turn_context)
         cached_state.state[property_name] = value
+        cached_state.mark_dirty(property_name)
 
 
 class BotStatePropertyAccessor(StatePropertyAccessor):
@@ -361,6 +506,20 @@ class BotStatePropertyAccessor(StatePropertyAccessor):
         await self._bot_state.set_property_value(turn_context, self._name, value)
 
 
+def _to_json(value: StoreItem | dict):
+    return value.store_item_to_json() if isinstance(value, StoreItem) else value
+
+
+def _fingerprint(value) -> int:
+    # Version 2 of marshal, unlike later ones, does not write back-references to the objects
+    # referenced more than once, so equal values give the same bytes whatever references the
+    # turn holds to them. It is still cheaper than building their str().
+    try:
+        return hash(dumps(value, 2))
+    except ValueError:
+        return hash(str(value))
+
+
 def _assert_value(value: StoreItem, func_name: str):
     """
     Asserts that the value is present.
@@ -0,0 +1,148 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from __future__ import annotations
+
+from asyncio import gather
+from typing import Dict, List
+
+from microsoft.agents.storage import ETagConflictError, Storage, StoreItem
+
+from .agent_state import AgentState, CachedAgentState
+from ..turn_context import TurnContext
+
+
+class AgentStateSet:
+    """
+    Loads and saves a set of :class:`AgentState` scopes together.
+
+    .. remarks::
+        Scopes sharing a storage are read with a single multi-key read and written with a
+        single multi-key write holding only the changed scopes, instead of one round trip
+        per scope.
+    """
+
+    def __init__(self, *agent_states: AgentState):
+        """
+        Initializes a new instance of the :class:`AgentStateSet` class.
+
+        :param agent_states: The state scopes to manage.
+        """
+        self.agent_states: List[AgentState] = []
+        for agent_state in agent_states:
+            self.add(agent_state)
+
+    def add(self, agent_state: AgentState) -> AgentStateSet:
+        """
+        Adds a state scope to the set.
+
+        :param agent_state: The state scope to add.
+        :return: The updated set.
+        """
+        if agent_state is None:
+            raise TypeError("AgentStateSet.add(): agent_state cannot be None.")
+
+        self.agent_states.append(agent_state)
+        return self
+
+    async def load_all(self, turn_context: TurnContext, force: bool = False) -> None:
+        """
+        Loads the state of every scope not yet cached in the turn context.
+
+        :param turn_context: The context object for this turn
+        :type turn_context: :class:`TurnContext`
+        :param force: Optional, true to bypass the cache
+        :type force: bool
+        """
+        if turn_context is None:
+            raise TypeError("AgentStateSet.load_all(): turn_context cannot be None.")
+
+        to_load = [
+            agent_state
+            for agent_state in self.agent_states
+            if force or not agent_state.get_cached_state(turn_context)
+        ]
+        await gather(
+            *(
+                self._load(turn_context, storage, agent_states)
+                for storage, agent_states in _group_by_storage(to_load)
+            )
+        )
+
+    async def save_all_changes(
+        self, turn_context: TurnContext, force: bool = False
+    ) -> None:
+        """
+        Saves the state of every scope that changed during the turn.
+
+        :param turn_context: The context object for this turn
+        :type turn_context: :class:`TurnContext`
+        :param force: Optional, true to save state to storage whether or not there are changes
+        :type force: bool
+        """
+        if turn_context is None:
+            raise TypeError(
+                "AgentStateSet.save_all_changes(): turn_context cannot be None."
+            )
+
+        to_save = [
+            agent_state
+            for agent_state in self.agent_states
+            if (cached_state := agent_state.get_cached_state(turn_context)) is not None
+            and (force or cached_state.is_changed)
+        ]
+        await gather(
+            *(
+                self._save(turn_context, storage, agent_states)
+                for storage, agent_states in _group_by_storage(to_save)
+            )
+        )
+
+    @staticmethod
+    async def _load(
+        turn_context: TurnContext, storage: Storage, agent_states: List[AgentState]
+    ) -> None:
+        storage_keys = [
+            agent_state.get_storage_key(turn_context) for agent_state in agent_states
+        ]
+        items = await storage.read(
+            list(dict.fromkeys(storage_keys)), target_cls=CachedAgentState
+        )
+        for agent_state, storage_key in zip(agent_states, storage_keys):
+            agent_state.set_cached_state(
+                turn_context, items.get(storage_key) or CachedAgentState(e_tag="")
+            )
+
+    @staticmethod
+    async def _save(
+        turn_context: TurnContext, storage: Storage, agent_states: List[AgentState]
+    ) -> None:
+        changes: Dict[str, StoreItem] = {
+            agent_state.get_storage_key(turn_context): agent_state.get_cached_state(
+                turn_context
+            )
+            for agent_state in agent_states
+        }
+        try:
+            await storage.write(changes)
+        except ETagConflictError:
+            # Each scope reloads and reapplies its own changes.
+            await gather(
+                *(
+                    agent_state.save_changes(turn_context, force=True)
+                    for agent_state in agent_states
+                )
+            )
+            return
+
+        for cached_state in changes.values():
+            cached_state.mark_saved()
+
+
+def _group_by_storage(agent_states: List[AgentState]):
+    groups: Dict[int, tuple[Storage, List[AgentState]]] = {}
+    for agent_state in agent_states:
+        storage = agent_state.storage
+        groups.setdefault(id(storage), (storage, []))[1].append(agent_state)
+
+    return groups.values()
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import re
 
-from copy import copy, deepcopy
+from copy import copy
 from collections.abc import Callable
 from datetime import datetime, timezone
 from microsoft.agents.core import TurnContextProtocol
@@ -195,9 +195,11 @@ class TurnContext(TurnContextProtocol):
             activity.id = None
             return activity
 
+        # Shallow copies are enough, only top-level fields of the outgoing activities are
+        # replaced, so the caller's activities and their attachments are left untouched.
         output = [
             activity_validator(
-                TurnContext.apply_conversation_reference(deepcopy(act), ref)
+                TurnContext.apply_conversation_reference(act.model_copy(), ref)
             )
             for act in activities
         ]
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import AsyncMock
 from microsoft.agents.builder import ActivityHandler, TurnContext
+from microsoft.agents.builder.activity_handler import route_to
 from microsoft.agents.core.models import (
     ActivityTypes,
     ChannelAccount,
@@ -153,3 +154,34 @@ class TestActivityHandler:
         response = await handler.on_invoke_activity(turn_context)
 
         assert response.status == 501
+
+    @pytest.mark.asyncio
+    async def test_registered_routes_apply_to_derived_class_only(
+        self, turn_context: TurnContext
+    ):
+        class _Handler(ActivityHandler):
+            async def on_custom_activity(self, turn_context):
+                self.custom_activity = turn_context
+
+            async def on_custom_invoke(self, turn_context):
+                return MessageReaction(type="like")
+
+        _Handler.register_activity_route("custom", route_to("on_custom_activity"))
+        _Handler.register_invoke_route(
+            "custom/invoke",
+            lambda handler, turn_context: handler.on_custom_invoke(turn_context),
+        )
+        handler = _Handler()
+
+        turn_context.activity.type = "custom"
+        await handler.on_turn(turn_context)
+        assert handler.custom_activity is turn_context
+
+        turn_context.activity.name = "custom/invoke"
+        response = await handler.on_invoke_activity(turn_context)
+        assert response.status == 200
+        assert response.body == {"type": "like"}
+
+        base_response = await ActivityHandler().on_invoke_activity(turn_context)
+        assert base_response.status == 501
+        assert "custom" not in ActivityHandler._activity_routes
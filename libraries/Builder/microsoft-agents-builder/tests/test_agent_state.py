@@ -0,0 +1,148 @@
+import pytest
+from unittest.mock import Mock
+
+from microsoft.agents.builder import TurnContext
+from microsoft.agents.builder.state import UserState
+from microsoft.agents.core.models import Activity, ChannelAccount
+from microsoft.agents.storage import ETagConflictError, MemoryStorage
+
+
+class _CountingStorage(MemoryStorage):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    async def write(self, changes):
+        self.writes += 1
+        await super().write(changes)
+
+
+def _create_turn_context() -> TurnContext:
+    return TurnContext(
+        Mock(),
+        Activity(
+            type="message",
+            channel_id="test",
+            from_property=ChannelAccount(id="user"),
+        ),
+    )
+
+
+class TestAgentState:
+    @pytest.fixture
+    def storage(self):
+        return _CountingStorage()
+
+    @pytest.mark.asyncio
+    async def test_save_changes_skips_unchanged_state(self, storage):
+        user_state = UserState(storage)
+        turn_context = _create_turn_context()
+
+        await user_state.load(turn_context)
+        await user_state.save_changes(turn_context)
+
+        assert storage.writes == 0
+
+    @pytest.mark.asyncio
+    async def test_save_changes_writes_after_set_and_delete(self, storage):
+        user_state = UserState(storage)
+        accessor = user_state.create_property("profile")
+        turn_context = _create_turn_context()
+
+        await accessor.set(turn_context, {"name": "a"})
+        await user_state.save_changes(turn_context)
+        await user_state.save_changes(turn_context)
+        assert storage.writes == 1
+
+        await accessor.delete(turn_context)
+        await user_state.save_changes(turn_context)
+        assert storage.writes == 2
+
+    @pytest.mark.asyncio
+    async def test_save_changes_detects_in_place_mutation(self, storage):
+        user_state = UserState(storage)
+        accessor = user_state.create_property("profile")
+        turn_context = _create_turn_context()
+        await accessor.set(turn_context, {"name": "a"})
+        await user_state.save_changes(turn_context)
+
+        turn_context = _create_turn_context()
+        profile = await accessor.get(turn_context)
+        await user_state.save_changes(turn_context)
+        assert storage.writes == 1
+
+        profile["name"] = "b"
+        await user_state.save_changes(turn_context)
+        assert storage.writes == 2
+
+        turn_context = _create_turn_context()
+        await user_state.load(turn_context)
+        user_state.get(turn_context)["other"] = "c"
+        await user_state.save_changes(turn_context)
+        assert storage.writes == 3
+
+    @pytest.mark.asyncio
+    async def test_save_changes_ignores_references_held_to_nested_values(self, storage):
+        user_state = UserState(storage)
+        accessor = user_state.create_property("profile")
+        turn_context = _create_turn_context()
+        await accessor.set(turn_context, {"tags": ["a"], "address": {"city": "b"}})
+        await user_state.save_changes(turn_context)
+
+        turn_context = _create_turn_context()
+        profile = await accessor.get(turn_context)
+        tags, address = profile["tags"], profile["address"]
+        await user_state.save_changes(turn_context)
+
+        assert storage.writes == 1
+        assert tags == ["a"] and address == {"city": "b"}
+
+    @pytest.mark.asyncio
+    async def test_clear_state_forces_save(self, storage):
+        user_state = UserState(storage)
+        turn_context = _create_turn_context()
+
+        await user_state.clear_state(turn_context)
+        await user_state.save_changes(turn_context)
+
+        assert storage.writes == 1
+
+    @pytest.mark.asyncio
+    async def test_save_changes_reapplies_changes_after_conflict(self, storage):
+        user_state = UserState(storage)
+        name = user_state.create_property("name")
+        count = user_state.create_property("count")
+        turn_context = _create_turn_context()
+        await name.set(turn_context, "a")
+        await count.set(turn_context, 1)
+        await user_state.save_changes(turn_context)
+
+        first_context = _create_turn_context()
+        second_context = _create_turn_context()
+        await name.set(first_context, "b")
+        await count.set(second_context, 2)
+        await user_state.save_changes(first_context)
+        await user_state.save_changes(second_context)
+
+        turn_context = _create_turn_context()
+        assert await name.get(turn_context) == "b"
+        assert await count.get(turn_context) == 2
+        assert await count.get(second_context) == 2
+        assert await name.get(second_context) == "b"
+
+    @pytest.mark.asyncio
+    async def test_save_changes_gives_up_after_max_attempts(self, storage):
+        class _ConflictingStorage(_CountingStorage):
+            async def write(self, changes):
+                self.writes += 1
+                raise ETagConflictError("key", "1", "2")
+
+        storage = _ConflictingStorage()
+        user_state = UserState(storage)
+        turn_context = _create_turn_context()
+        await user_state.create_property("name").set(turn_context, "a")
+
+        with pytest.raises(ETagConflictError):
+            await user_state.save_changes(turn_context)
+
+        assert storage.writes == UserState.MAX_SAVE_ATTEMPTS
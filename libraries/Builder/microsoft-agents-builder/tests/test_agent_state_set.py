@@ -0,0 +1,119 @@
+import pytest
+from unittest.mock import Mock
+
+from microsoft.agents.builder import TurnContext
+from microsoft.agents.builder.state import AgentState, AgentStateSet, UserState
+from microsoft.agents.core.models import Activity, ChannelAccount
+from microsoft.agents.storage import MemoryStorage
+
+
+class _ConversationState(AgentState):
+    def __init__(self, storage):
+        super().__init__(storage, "Internal.ConversationState")
+
+    def get_storage_key(self, turn_context: TurnContext) -> str:
+        return f"{turn_context.activity.channel_id}/conversations/conversation"
+
+
+class _CountingStorage(MemoryStorage):
+    def __init__(self):
+        super().__init__()
+        self.reads = []
+        self.writes = []
+
+    async def read(self, keys, **kwargs):
+        self.reads.append(keys)
+        return await super().read(keys, **kwargs)
+
+    async def write(self, changes):
+        self.writes.append(list(changes))
+        await super().write(changes)
+
+
+def _create_turn_context() -> TurnContext:
+    return TurnContext(
+        Mock(),
+        Activity(
+            type="message",
+            channel_id="test",
+            from_property=ChannelAccount(id="user"),
+        ),
+    )
+
+
+class TestAgentStateSet:
+    @pytest.fixture
+    def storage(self):
+        return _CountingStorage()
+
+    @pytest.mark.asyncio
+    async def test_load_all_reads_all_scopes_at_once(self, storage):
+        user_state = UserState(storage)
+        conversation_state = _ConversationState(storage)
+        state_set = AgentStateSet(user_state, conversation_state)
+        turn_context = _create_turn_context()
+
+        await state_set.load_all(turn_context)
+        await state_set.load_all(turn_context)
+
+        assert storage.reads == [["test/users/user", "test/conversations/conversation"]]
+        assert user_state.get_cached_state(turn_context) is not None
+        assert conversation_state.get_cached_state(turn_context) is not None
+
+    @pytest.mark.asyncio
+    async def test_save_all_changes_writes_only_changed_scopes(self, storage):
+        user_state = UserState(storage)
+        conversation_state = _ConversationState(storage)
+        state_set = AgentStateSet(user_state, conversation_state)
+        turn_context = _create_turn_context()
+
+        await state_set.load_all(turn_context)
+        await state_set.save_all_changes(turn_context)
+        assert storage.writes == []
+
+        await user_state.create_property("name").set(turn_context, "a")
+        await conversation_state.create_property("count").set(turn_context, 1)
+        await state_set.save_all_changes(turn_context)
+        assert storage.writes == [
+            ["test/users/user", "test/conversations/conversation"]
+        ]
+
+        await conversation_state.create_property("count").set(turn_context, 2)
+        await state_set.save_all_changes(turn_context)
+        assert storage.writes[-1] == ["test/conversations/conversation"]
+
+        turn_context = _create_turn_context()
+        await state_set.load_all(turn_context)
+        assert await conversation_state.create_property("count").get(turn_context) == 2
+
+    @pytest.mark.asyncio
+    async def test_scopes_are_grouped_by_storage(self, storage):
+        other_storage = _CountingStorage()
+        state_set = AgentStateSet().add(UserState(storage))
+        state_set.add(_ConversationState(other_storage))
+
+        await state_set.load_all(_create_turn_context())
+
+        assert storage.reads == [["test/users/user"]]
+        assert other_storage.reads == [["test/conversations/conversation"]]
+
+    @pytest.mark.asyncio
+    async def test_save_all_changes_retries_scopes_after_conflict(self, storage):
+        user_state = UserState(storage)
+        conversation_state = _ConversationState(storage)
+        state_set = AgentStateSet(user_state, conversation_state)
+        first_context = _create_turn_context()
+        second_context = _create_turn_context()
+        await state_set.load_all(first_context)
+        await state_set.load_all(second_context)
+
+        await user_state.create_property("name").set(first_context, "a")
+        await state_set.save_all_changes(first_context)
+        await user_state.create_property("count").set(second_context, 1)
+        await conversation_state.create_property("topic").set(second_context, "b")
+        await state_set.save_all_changes(second_context)
+
+        turn_context = _create_turn_context()
+        await state_set.load_all(turn_context)
+        assert user_state.get(turn_context) == {"name": "a", "count": 1}
+        assert conversation_state.get(turn_context) == {"topic": "b"}
@@ -0,0 +1,311 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from microsoft.agents.builder import (
+    ChannelServiceAdapter,
+    ConversationTurnScheduler,
+    TurnContext,
+)
+from microsoft.agents.core.models import (
+    Activity,
+    ActivityTypes,
+    ChannelAccount,
+    ConversationAccount,
+    ConversationReference,
+    ResourceResponse,
+)
+
+
+class _Adapter(ChannelServiceAdapter):
+    pass
+
+
+class _Conversations:
+    def __init__(self):
+        self.events = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def send_to_conversation(self, conversation_id: str, activity: Activity):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.events.append(("start", activity.text))
+        await asyncio.sleep(0.01)
+        self.events.append(("end", activity.text))
+        self.in_flight -= 1
+        return ResourceResponse(id=activity.text)
+
+
+def create_message(conversation_id: str, text: str) -> Activity:
+    return Activity(
+        type=ActivityTypes.message,
+        channel_id="msteams",
+        conversation=ConversationAccount(id=conversation_id),
+        text=text,
+    )
+
+
+class TestChannelServiceAdapter:
+    @pytest.fixture
+    def conversations(self):
+        return _Conversations()
+
+    def create_context(self, adapter: ChannelServiceAdapter, conversations):
+        context = TurnContext(adapter, create_message("c1", "incoming"))
+        connector_client = MagicMock()
+        connector_client.conversations = conversations
+        context.turn_state[adapter._AGENT_CONNECTOR_CLIENT_KEY] = connector_client
+        return context
+
+    @pytest.mark.asyncio
+    async def test_send_activities_sequential(self, conversations):
+        adapter = _Adapter(None)
+        context = self.create_context(adapter, conversations)
+        responses = await adapter.send_activities(
+            context, [create_message("c1", "a"), create_message("c2", "b")]
+        )
+
+        assert [response.id for response in responses] == ["a", "b"]
+        assert conversations.max_in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_send_activities_pipelined_overlaps_conversations(
+        self, conversations
+    ):
+        adapter = _Adapter(None, pipelined_delivery=True)
+        context = self.create_context(adapter, conversations)
+        responses = await adapter.send_activities(
+            context, [create_message("c1", "a"), create_message("c2", "b")]
+        )
+
+        assert [response.id for response in responses] == ["a", "b"]
+        assert conversations.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_send_activities_pipelined_keeps_conversation_order(
+        self, conversations
+    ):
+        adapter = _Adapter(None, pipelined_delivery=True)
+        context = self.create_context(adapter, conversations)
+        await adapter.send_activities(
+            context, [create_message("c1", "a"), create_message("c1", "b")]
+        )
+
+        assert conversations.events == [
+            ("start", "a"),
+            ("end", "a"),
+            ("start", "b"),
+            ("end", "b"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_send_activities_pipelined_unordered_channel(self, conversations):
+        adapter = _Adapter(
+            None, pipelined_delivery=True, unordered_channels=["msteams"]
+        )
+        context = self.create_context(adapter, conversations)
+        await adapter.send_activities(
+            context, [create_message("c1", "a"), create_message("c1", "b")]
+        )
+
+        assert conversations.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_send_activities_pipelined_overlaps_unordered_sends(
+        self, conversations
+    ):
+        adapter = _Adapter(
+            None,
+            pipelined_delivery=True,
+            max_concurrent_sends=4,
+            unordered_channels=["msteams"],
+        )
+        context = self.create_context(adapter, conversations)
+        texts = ["a", "b", "c", "d"]
+        responses = await adapter.send_activities(
+            context, [create_message("c1", text) for text in texts]
+        )
+
+        assert [response.id for response in responses] == texts
+        assert conversations.max_in_flight == 4
+        assert conversations.events[:4] == [("start", text) for text in texts]
+
+    @pytest.mark.asyncio
+    async def test_send_activities_pipelined_single_ordered_conversation_is_sequential(
+        self, conversations
+    ):
+        adapter = _Adapter(None, pipelined_delivery=True)
+        adapter._send_activities_pipelined = AsyncMock()
+        context = self.create_context(adapter, conversations)
+        responses = await adapter.send_activities(
+            context, [create_message("c1", "a"), create_message("c1", "b")]
+        )
+
+        assert [response.id for response in responses] == ["a", "b"]
+        adapter._send_activities_pipelined.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_send_activities_pipelined_delay_is_a_barrier(self, conversations):
+        adapter = _Adapter(None, pipelined_delivery=True)
+        context = self.create_context(adapter, conversations)
+        delay = Activity(type="delay", value=10)
+        await adapter.send_activities(
+            context,
+            [create_message("c1", "a"), delay, create_message("c2", "b")],
+        )
+
+        assert conversations.events == [
+            ("start", "a"),
+            ("end", "a"),
+            ("start", "b"),
+            ("end", "b"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_process_activity_serializes_turns_per_conversation(self):
+        adapter = _Adapter(None, turn_scheduler=ConversationTurnScheduler())
+        events = []
+
+        async def prepare_activity_turn(claims_identity, activity, callback):
+            async def turn():
+                events.append(("start", activity.text))
+                await asyncio.sleep(0.01)
+                events.append(("end", activity.text))
+
+            return turn
+
+        adapter._prepare_activity_turn = prepare_activity_turn
+        await asyncio.gather(
+            adapter.process_activity(None, create_message("c1", "a"), None),
+            adapter.process_activity(None, create_message("c2", "b"), None),
+            adapter.process_activity(None, create_message("c1", "c"), None),
+        )
+
+        assert events.index(("end", "a")) < events.index(("start", "c"))
+        assert events.index(("start", "b")) < events.index(("end", "a"))
+
+
+class _RateLimitedError(Exception):
+    def __init__(self, retry_after: str):
+        super().__init__("Too Many Requests")
+        self.status = 429
+        self.headers = {"Retry-After": retry_after}
+
+
+class _ClientFactory:
+    def __init__(self, send=None):
+        self.created = []
+        self.closed = 0
+        self.send = send or AsyncMock()
+
+    async def create_connector_client(self, claims_identity, service_url, audience):
+        self.created.append(service_url)
+        client = MagicMock()
+        client.close = self.close
+        client.conversations.send_to_conversation = self.send
+        client.conversations.reply_to_activity = self.send
+        return client
+
+    async def create_user_token_client(self, claims_identity):
+        raise AssertionError("not used")
+
+    async def close(self):
+        self.closed += 1
+
+
+def create_reference(service_url: str, conversation_id: str) -> ConversationReference:
+    return ConversationReference(
+        service_url=service_url,
+        channel_id="msteams",
+        conversation=ConversationAccount(id=conversation_id),
+        agent=ChannelAccount(id="agent"),
+        user=ChannelAccount(id="user"),
+    )
+
+
+class TestContinueConversations:
+    @pytest.mark.asyncio
+    async def test_gets_a_client_per_turn_and_reports_each_reference(self):
+        factory = _ClientFactory()
+        adapter = _Adapter(factory)
+        visited = []
+
+        async def callback(context: TurnContext):
+            visited.append(context.activity.conversation.id)
+            if context.activity.conversation.id == "bad":
+                raise ValueError("turn failed")
+
+        async def references():
+            for index in range(10):
+                yield create_reference(f"https://service{index % 2}/", f"c{index}")
+            yield create_reference("https://service0/", "bad")
+
+        results = [
+            result
+            async for result in adapter.continue_conversations(
+                "app", references(), callback, max_concurrency=4
+            )
+        ]
+
+        assert sorted(visited) == sorted([f"c{index}" for index in range(10)] + ["bad"])
+        assert len(factory.created) == 11
+        assert factory.closed == 11
+        failed = [result for result in results if not result.succeeded]
+        assert len(results) == 11
+        assert [result.reference.conversation.id for result in failed] == ["bad"]
+        assert isinstance(failed[0].error, ValueError)
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limited_sends_without_running_the_turn_again(self):
+        attempts = []
+
+        async def send(*args):
+            attempts.append(asyncio.get_running_loop().time())
+            if len(attempts) == 1:
+                raise _RateLimitedError("0.05")
+            return ResourceResponse(id=str(len(attempts)))
+
+        adapter = _Adapter(_ClientFactory(send))
+        turns = []
+
+        async def callback(context: TurnContext):
+            turns.append(context.activity.conversation.id)
+            await context.send_activity("first")
+            await context.send_activity("second")
+
+        results = [
+            result
+            async for result in adapter.continue_conversations(
+                "app", [create_reference("https://service/", "c1")], callback
+            )
+        ]
+
+        assert results[0].succeeded
+        assert results[0].retries == 1
+        assert turns == ["c1"]
+        assert len(attempts) == 3
+        assert attempts[1] - attempts[0] >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self):
+        send = AsyncMock(side_effect=_RateLimitedError("0"))
+        adapter = _Adapter(_ClientFactory(send))
+
+        async def callback(context: TurnContext):
+            await context.send_activity("hello")
+
+        results = [
+            result
+            async for result in adapter.continue_conversations(
+                "app",
+                [create_reference("https://service/", "c1")],
+                callback,
+                max_attempts=2,
+            )
+        ]
+
+        assert send.await_count == 2
+        assert results[0].retries == 1
+        assert isinstance(results[0].error, _RateLimitedError)
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from microsoft.agents.builder import ConversationTurnScheduler
+
+
+class TestConversationTurnScheduler:
+    @pytest.mark.asyncio
+    async def test_turns_of_a_conversation_run_in_order(self):
+        scheduler = ConversationTurnScheduler()
+        events = []
+
+        async def turn(name: str, delay: float):
+            events.append(f"{name} start")
+            await asyncio.sleep(delay)
+            events.append(f"{name} end")
+            return name
+
+        results = await asyncio.gather(
+            scheduler.run("c1", lambda: turn("first", 0.02)),
+            scheduler.run("c1", lambda: turn("second", 0)),
+        )
+
+        assert results == ["first", "second"]
+        assert events == ["first start", "first end", "second start", "second end"]
+        assert scheduler.conversation_count == 0
+
+    @pytest.mark.asyncio
+    async def test_conversations_run_concurrently_up_to_limit(self):
+        scheduler = ConversationTurnScheduler(max_concurrency=2)
+        running = 0
+        max_running = 0
+
+        async def turn():
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        await asyncio.gather(
+            *(scheduler.run(f"c{index}", turn) for index in range(5)),
+            scheduler.run(None, turn),
+        )
+
+        assert max_running == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_turn_does_not_block_conversation(self):
+        scheduler = ConversationTurnScheduler()
+
+        async def failing_turn():
+            raise ValueError("turn failed")
+
+        async def turn():
+            return "ok"
+
+        results = await asyncio.gather(
+            scheduler.run("c1", failing_turn),
+            scheduler.run("c1", turn),
+            return_exceptions=True,
+        )
+
+        assert isinstance(results[0], ValueError)
+        assert results[1] == "ok"
+        assert scheduler.conversation_count == 0
+
+    def test_scheduler_can_be_created_outside_the_running_loop(self):
+        scheduler = ConversationTurnScheduler(max_concurrency=2)
+        running = 0
+        max_running = 0
+
+        async def turn():
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        async def run_turns():
+            await asyncio.gather(
+                *(scheduler.run(f"c{index}", turn) for index in range(5))
+            )
+
+        asyncio.run(run_turns())
+
+        assert max_running == 2
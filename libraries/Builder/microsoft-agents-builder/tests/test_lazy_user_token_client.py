@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from microsoft.agents.builder import LazyUserTokenClient
+
+
+class TestLazyUserTokenClient:
+    @pytest.fixture
+    def client(self):
+        client = MagicMock()
+        client.user_token.get_token = AsyncMock(return_value="token")
+        client.close = AsyncMock()
+        return client
+
+    @pytest.mark.asyncio
+    async def test_client_is_not_created_until_used(self, client):
+        create_client = AsyncMock(return_value=client)
+        lazy_client = LazyUserTokenClient(create_client)
+        await lazy_client.close()
+
+        assert not lazy_client.is_created
+        create_client.assert_not_called()
+        client.close.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_client_is_created_once_on_first_use(self, client):
+        create_client = AsyncMock(return_value=client)
+        lazy_client = LazyUserTokenClient(create_client)
+
+        assert await lazy_client.user_token.get_token(user_id="user") == "token"
+        assert await lazy_client.user_token.get_token(user_id="user") == "token"
+        await lazy_client.close()
+
+        create_client.assert_called_once()
+        client.user_token.get_token.assert_called_with(user_id="user")
+        client.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_creation_is_retried(self, client):
+        create_client = AsyncMock(side_effect=[ValueError("failed"), client])
+        lazy_client = LazyUserTokenClient(create_client)
+
+        with pytest.raises(ValueError):
+            await lazy_client.get_client()
+        assert await lazy_client.get_client() is client
+
+    @pytest.mark.asyncio
+    async def test_cancelled_creation_is_retried_by_waiting_callers(self, client):
+        started = asyncio.Event()
+        creations = []
+
+        async def create_client():
+            creations.append(len(creations))
+            if len(creations) == 1:
+                started.set()
+                await asyncio.sleep(10)
+            return client
+
+        lazy_client = LazyUserTokenClient(create_client)
+        creator = asyncio.ensure_future(lazy_client.get_client())
+        await started.wait()
+        waiter = asyncio.ensure_future(lazy_client.get_client())
+        await asyncio.sleep(0)
+
+        creator.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await creator
+
+        assert await asyncio.wait_for(waiter, 1) is client
+        assert await lazy_client.get_client() is client
+        assert len(creations) == 2
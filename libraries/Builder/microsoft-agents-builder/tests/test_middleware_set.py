@@ -0,0 +1,87 @@
+import pytest
+from unittest.mock import Mock
+
+from microsoft.agents.builder import Middleware
+from microsoft.agents.builder.middleware_set import MiddlewareSet
+
+
+class _RecordingMiddleware(Middleware):
+    def __init__(self, name: str, events: list, call_next: bool = True):
+        self.name = name
+        self.events = events
+        self.call_next = call_next
+
+    async def on_turn(self, context, logic):
+        self.events.append(f"{self.name} before")
+        if self.call_next:
+            await logic()
+        self.events.append(f"{self.name} after")
+
+
+class TestMiddlewareSet:
+    @pytest.mark.asyncio
+    async def test_runs_middleware_in_order_around_callback(self):
+        events = []
+        middleware_set = MiddlewareSet().use(
+            _RecordingMiddleware("first", events),
+            _RecordingMiddleware("second", events),
+        )
+        context = Mock()
+
+        async def callback(turn_context):
+            assert turn_context is context
+            events.append("callback")
+            return "result"
+
+        await middleware_set.receive_activity_with_status(context, callback)
+        assert events == [
+            "first before",
+            "second before",
+            "callback",
+            "second after",
+            "first after",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_middleware_can_short_circuit_the_turn(self):
+        events = []
+        middleware_set = MiddlewareSet().use(
+            _RecordingMiddleware("first", events, call_next=False)
+        )
+        middleware_set.use(_RecordingMiddleware("second", events))
+
+        async def callback(turn_context):
+            events.append("callback")
+
+        await middleware_set.receive_activity_with_status(Mock(), callback)
+        assert events == ["first before", "first after"]
+
+    @pytest.mark.asyncio
+    async def test_nested_set_and_empty_set(self):
+        events = []
+        inner = MiddlewareSet().use(_RecordingMiddleware("inner", events))
+        outer = MiddlewareSet().use(inner, _RecordingMiddleware("outer", events))
+
+        async def callback(turn_context):
+            events.append("callback")
+
+        await outer.receive_activity_with_status(Mock(), callback)
+        assert events == [
+            "inner before",
+            "inner after",
+            "outer before",
+            "callback",
+            "outer after",
+        ]
+        assert await MiddlewareSet().receive_activity_with_status(Mock(), None) is None
+        assert (
+            await MiddlewareSet().receive_activity_with_status(Mock(), callback) is None
+        )
+        assert events[-1] == "callback"
+
+    def test_use_rejects_invalid_middleware(self):
+        middleware_set = MiddlewareSet()
+
+        with pytest.raises(TypeError):
+            middleware_set.use(_RecordingMiddleware("valid", []), object())
+        assert middleware_set._middleware == []
@@ -0,0 +1,91 @@
+import time
+
+import jwt
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from microsoft.agents.authorization import ClaimsIdentity
+from microsoft.agents.builder import RestChannelServiceClientFactory
+
+SERVICE_URL = "https://smba.trafficmanager.net/amer/"
+AUDIENCE = "https://api.botframework.com"
+
+
+def create_token(expires_in: float) -> str:
+    return jwt.encode({"exp": int(time.time() + expires_in)}, "s" * 32)
+
+
+class TestRestChannelServiceClientFactory:
+    @pytest.fixture
+    def token_provider(self):
+        token_provider = MagicMock()
+        token_provider.get_access_token = AsyncMock(return_value=create_token(3600))
+        return token_provider
+
+    @pytest.fixture
+    def factory(self, token_provider):
+        connections = MagicMock()
+        connections.get_token_provider.return_value = token_provider
+        return RestChannelServiceClientFactory(None, connections, cache_clients=True)
+
+    @pytest.fixture
+    def claims_identity(self):
+        return ClaimsIdentity({"aud": "app-id"}, True)
+
+    @pytest.mark.asyncio
+    async def test_connector_client_is_cached(
+        self, factory, token_provider, claims_identity
+    ):
+        first = await factory.create_connector_client(
+            claims_identity, SERVICE_URL, AUDIENCE
+        )
+        second = await factory.create_connector_client(
+            claims_identity, SERVICE_URL, AUDIENCE
+        )
+        assert first is second
+        token_provider.get_access_token.assert_called_once()
+        await factory.close()
+
+    @pytest.mark.asyncio
+    async def test_user_token_client_is_cached(
+        self, factory, token_provider, claims_identity
+    ):
+        first = await factory.create_user_token_client(claims_identity)
+        await first.close()
+        second = await factory.create_user_token_client(claims_identity)
+        assert first is second
+        assert not second.client.closed
+        token_provider.get_access_token.assert_called_once()
+        await factory.close()
+
+    @pytest.mark.asyncio
+    async def test_client_is_rebuilt_when_token_nears_expiry(
+        self, factory, token_provider, claims_identity
+    ):
+        token_provider.get_access_token.return_value = create_token(60)
+        first = await factory.create_connector_client(
+            claims_identity, SERVICE_URL, AUDIENCE
+        )
+        second = await factory.create_connector_client(
+            claims_identity, SERVICE_URL, AUDIENCE
+        )
+        assert first is not second
+        assert token_provider.get_access_token.call_count == 2
+        await factory.close()
+
+    @pytest.mark.asyncio
+    async def test_clients_are_not_cached_by_default(
+        self, token_provider, claims_identity
+    ):
+        connections = MagicMock()
+        connections.get_token_provider.return_value = token_provider
+        factory = RestChannelServiceClientFactory(None, connections)
+        first = await factory.create_connector_client(
+            claims_identity, SERVICE_URL, AUDIENCE
+        )
+        second = await factory.create_connector_client(
+            claims_identity, SERVICE_URL, AUDIENCE
+        )
+        assert first is not second
+        await first.close()
+        await second.close()
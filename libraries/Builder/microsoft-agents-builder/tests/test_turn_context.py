@@ -0,0 +1,66 @@
+import pytest
+
+from microsoft.agents.builder import ChannelAdapter, TurnContext
+from microsoft.agents.core.models import (
+    Activity,
+    ActivityTypes,
+    Attachment,
+    ChannelAccount,
+    ConversationAccount,
+    ResourceResponse,
+)
+
+
+class _Adapter(ChannelAdapter):
+    def __init__(self):
+        super().__init__()
+        self.sent = []
+
+    async def send_activities(self, context, activities):
+        self.sent.extend(activities)
+        return [ResourceResponse(id=str(len(self.sent))) for _ in activities]
+
+    async def update_activity(self, context, activity):
+        pass
+
+    async def delete_activity(self, context, reference):
+        pass
+
+
+class TestTurnContext:
+    @pytest.mark.asyncio
+    async def test_send_activities_leaves_caller_activity_untouched(self):
+        adapter = _Adapter()
+        context = TurnContext(
+            adapter,
+            Activity(
+                type=ActivityTypes.message,
+                id="incoming",
+                channel_id="msteams",
+                service_url="https://service.example.com",
+                conversation=ConversationAccount(id="conversation"),
+                from_property=ChannelAccount(id="user"),
+                recipient=ChannelAccount(id="agent"),
+            ),
+        )
+        card = {"type": "AdaptiveCard", "body": [{"type": "TextBlock"}]}
+        activity = Activity(
+            type=ActivityTypes.message,
+            id="outgoing",
+            attachments=[Attachment(content_type="card", content=card)],
+        )
+
+        await context.send_activities([activity])
+
+        sent = adapter.sent[0]
+        assert sent is not activity
+        assert sent.id is None
+        assert sent.reply_to_id == "incoming"
+        assert sent.conversation.id == "conversation"
+        assert sent.recipient.id == "user"
+        assert sent.attachments[0].content == card
+
+        assert activity.id == "outgoing"
+        assert activity.conversation is None
+        assert activity.recipient is None
+        assert activity.input_hint is None
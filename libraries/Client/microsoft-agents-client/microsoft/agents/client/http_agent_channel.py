@@ -1,4 +1,4 @@
-from copy import deepcopy, copy
+from copy import copy
 
 from aiohttp import ClientSession
 from microsoft.agents.authorization import AccessTokenProviderBase
@@ -42,20 +42,21 @@ class HttpAgentChannel(ChannelProtocol):
         if not activity:
             raise ValueError("HttpAgentChannel.post_activity: Activity is required")
 
-        activity_copy = deepcopy(activity)
-
-        # TODO: should conversation should be a deep copy instead of shallow?
+        # Only the fields changed below are copied, attachments and other large values are
+        # shared with the caller's activity, which is left untouched.
+        activity_copy = activity.model_copy()
         activity_copy.relates_to = ConversationReference(
             service_url=service_url,
-            activity_id=activity_copy.id,
-            channel_id=activity_copy.channel_id,
-            locale=activity_copy.locale,
-            conversation=copy(activity_copy.conversation),
+            activity_id=activity.id,
+            channel_id=activity.channel_id,
+            locale=activity.locale,
+            conversation=copy(activity.conversation),
         )
 
+        activity_copy.conversation = copy(activity.conversation)
         activity_copy.conversation.id = conversation_id
         activity_copy.service_url = service_url
-        activity_copy.recipient = activity_copy.recipient or ChannelAccount()
+        activity_copy.recipient = copy(activity.recipient) or ChannelAccount()
         activity_copy.recipient.role = RoleTypes.skill
 
         token_result = await self._token_access.get_access_token(
@@ -2,11 +2,14 @@ from .user_token_client_base import UserTokenClientBase
 from .connector_client_base import ConnectorClientBase
 from .client.connector_client import ConnectorClient
 from .client.user_token_client import UserTokenClient
+from .client.client_session_pool import ClientSessionPool, PooledClientSession
 from .get_product_info import get_product_info
 
 __all__ = [
     "ConnectorClient",
     "UserTokenClient",
+    "ClientSessionPool",
+    "PooledClientSession",
     "UserTokenClientBase",
     "ConnectorClientBase",
     "get_product_info",
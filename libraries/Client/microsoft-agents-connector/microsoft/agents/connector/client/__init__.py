@@ -1,4 +1,10 @@
+from .client_session_pool import ClientSessionPool, PooledClientSession
 from .connector_client import ConnectorClient
 from .user_token_client import UserTokenClient
 
-__all__ = ["ConnectorClient", "UserTokenClient"]
+__all__ = [
+    "ClientSessionPool",
+    "ConnectorClient",
+    "PooledClientSession",
+    "UserTokenClient",
+]
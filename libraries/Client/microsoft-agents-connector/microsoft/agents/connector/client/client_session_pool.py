@@ -0,0 +1,137 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+"""Long-lived aiohttp sessions shared by connector and user token clients."""
+
+from typing import Any, Optional
+
+from aiohttp import ClientSession, TCPConnector
+from yarl import URL
+
+from ..get_product_info import get_product_info
+
+
+class PooledClientSession:
+    """
+    A lightweight view over a shared ClientSession with its own default headers.
+
+    Clients update ``headers`` with their bearer token as they would on a ClientSession,
+    and the headers are added to every request instead of being set on the shared
+    session. Closing it leaves the shared session open.
+    """
+
+    def __init__(self, session: ClientSession):
+        self._session = session
+        self.headers: dict[str, str] = {}
+
+    @property
+    def _base_url(self) -> Optional[URL]:
+        return self._session._base_url
+
+    @property
+    def closed(self) -> bool:
+        return self._session.closed
+
+    def request(self, method: str, url: str, **kwargs: Any):
+        headers = kwargs.pop("headers", None)
+        if self.headers:
+            headers = {**self.headers, **headers} if headers else self.headers
+
+        return self._session.request(method, url, headers=headers, **kwargs)
+
+    def get(self, url: str, **kwargs: Any):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any):
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: str, **kwargs: Any):
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any):
+        return self.request("DELETE", url, **kwargs)
+
+    async def close(self) -> None:
+        """The shared session is owned by the ClientSessionPool, nothing to close."""
+
+
+class ClientSessionPool:
+    """
+    Holds one long-lived ClientSession per base URL, all sharing a single TCPConnector
+    with keep-alive and DNS caching, so that turns reuse established connections.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 20,
+        keepalive_timeout: float = 60,
+        ttl_dns_cache: int = 300,
+    ):
+        """
+        :param limit: Maximum number of simultaneous connections.
+        :param limit_per_host: Maximum number of simultaneous connections to the same host.
+        :param keepalive_timeout: Seconds an idle connection is kept open for reuse.
+        :param ttl_dns_cache: Seconds a DNS resolution is cached for.
+        """
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._ttl_dns_cache = ttl_dns_cache
+        self._connector: Optional[TCPConnector] = None
+        self._sessions: dict[str, ClientSession] = {}
+
+    def get_session(self, base_url: str) -> PooledClientSession:
+        """
+        Gets a client view over the shared session for the base URL.
+
+        Must be called from within the running event loop.
+
+        :param base_url: The service URL the session sends requests to.
+        :return: A session view to hand to a single client.
+        """
+        if not base_url.endswith("/"):
+            base_url += "/"
+
+        session = self._sessions.get(base_url)
+        if session is None or session.closed:
+            session = ClientSession(
+                base_url=base_url,
+                connector=self._get_connector(),
+                connector_owner=False,
+                headers={
+                    "Accept": "application/json",
+                    "Content-Type": "application/json",
+                    "User-Agent": get_product_info(),
+                },
+            )
+            self._sessions[base_url] = session
+
+        return PooledClientSession(session)
+
+    async def close(self) -> None:
+        """
+        Closes all sessions and their connections.
+        """
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:
+            await session.close()
+
+        if self._connector is not None:
+            await self._connector.close()
+            self._connector = None
+
+    def _get_connector(self) -> TCPConnector:
+        if self._connector is None or self._connector.closed:
+            self._connector = TCPConnector(
+                limit=self._limit,
+                limit_per_host=self._limit_per_host,
+                keepalive_timeout=self._keepalive_timeout,
+                ttl_dns_cache=self._ttl_dns_cache,
+            )
+
+        return self._connector
@@ -0,0 +1,61 @@
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from microsoft.agents.core.models import Activity
+from microsoft.agents.connector import ClientSessionPool, ConnectorClient
+
+
+class TestClientSessionPool:
+    @pytest_asyncio.fixture
+    async def server(self):
+        async def echo_authorization(request: web.Request):
+            return web.json_response(
+                {"id": request.headers.get("Authorization", "")}, status=200
+            )
+
+        app = web.Application()
+        app.router.add_post(
+            "/v3/conversations/{conversation_id}/activities", echo_authorization
+        )
+        server = TestServer(app)
+        await server.start_server()
+        yield server
+        await server.close()
+
+    @pytest.mark.asyncio
+    async def test_sessions_are_shared_per_base_url(self):
+        pool = ClientSessionPool()
+        first = pool.get_session("https://smba.trafficmanager.net/amer")
+        second = pool.get_session("https://smba.trafficmanager.net/amer/")
+        other = pool.get_session("https://smba.trafficmanager.net/emea/")
+
+        assert first._session is second._session
+        assert first._session is not other._session
+        assert first._session.connector is other._session.connector
+
+        await pool.close()
+        assert first.closed
+
+    @pytest.mark.asyncio
+    async def test_clients_send_their_own_token(self, server: TestServer):
+        pool = ClientSessionPool()
+        endpoint = str(server.make_url("/"))
+        client1 = ConnectorClient(
+            endpoint, "token1", session=pool.get_session(endpoint)
+        )
+        client2 = ConnectorClient(
+            endpoint, "token2", session=pool.get_session(endpoint)
+        )
+
+        activity = Activity(type="message", text="hi")
+        response1 = await client1.conversations.send_to_conversation("c1", activity)
+        response2 = await client2.conversations.send_to_conversation("c1", activity)
+        await client1.close()
+
+        assert response1.id == "Bearer token1"
+        assert response2.id == "Bearer token2"
+        assert not client2.client.closed
+
+        await pool.close()
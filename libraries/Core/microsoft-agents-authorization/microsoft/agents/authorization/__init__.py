@@ -4,7 +4,9 @@ from .anonymous_token_provider import AnonymousTokenProvider
 from .connections import Connections
 from .agent_auth_configuration import AgentAuthConfiguration
 from .claims_identity import ClaimsIdentity
+from .jwks_key_store import JwksKeyStore
 from .jwt_token_validator import JwtTokenValidator
+from .validated_token_cache import ValidatedTokenCache
 
 __all__ = [
     "AccessTokenProviderBase",
@@ -13,5 +15,7 @@ __all__ = [
     "Connections",
     "AgentAuthConfiguration",
     "ClaimsIdentity",
+    "JwksKeyStore",
     "JwtTokenValidator",
+    "ValidatedTokenCache",
 ]
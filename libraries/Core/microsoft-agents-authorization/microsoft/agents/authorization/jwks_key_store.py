@@ -0,0 +1,223 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from asyncio import Task, get_running_loop, shield
+from threading import Lock, Thread
+from time import monotonic
+from typing import Optional
+
+from jwt import PyJWK, PyJWKClient, PyJWKSet
+
+try:
+    from aiohttp import ClientSession, ClientTimeout
+except ImportError:
+    ClientSession = None
+
+
+class _JwksEntry:
+    def __init__(self, keys: dict[str, PyJWK], fetched_at: float):
+        self.keys = keys
+        self.fetched_at = fetched_at
+
+
+class JwksKeyStore:
+    """
+    Caches the signing keys published at JWKS endpoints, keyed by the endpoint and the key id.
+
+    Keys are served from memory for ``ttl`` seconds. Once an entry is older than
+    ``ttl - refresh_before`` seconds it keeps being served while a refresh runs in the
+    background. An unknown ``kid`` triggers a single refetch of the endpoint, at most once
+    every ``min_refetch_interval`` seconds per endpoint.
+    """
+
+    _default: Optional["JwksKeyStore"] = None
+    _default_lock = Lock()
+
+    def __init__(
+        self,
+        ttl: float = 24 * 60 * 60,
+        refresh_before: float = 60 * 60,
+        min_refetch_interval: float = 5 * 60,
+        timeout: float = 30,
+    ):
+        """
+        :param ttl: Seconds a fetched key set may be used for.
+        :param refresh_before: Seconds before expiry at which a background refresh is started.
+        :param min_refetch_interval: Minimum seconds between refetches caused by an unknown kid.
+        :param timeout: Timeout in seconds for the HTTP request to the JWKS endpoint.
+        """
+        if refresh_before >= ttl:
+            raise ValueError("JwksKeyStore: refresh_before must be lower than ttl")
+
+        self.ttl = ttl
+        self.refresh_before = refresh_before
+        self.min_refetch_interval = min_refetch_interval
+        self.timeout = timeout
+        self._entries: dict[str, _JwksEntry] = {}
+        self._locks: dict[str, Lock] = {}
+        self._locks_guard = Lock()
+        self._refreshing: set[str] = set()
+        self._fetch_tasks: dict[str, Task] = {}
+
+    @classmethod
+    def get_default(cls) -> "JwksKeyStore":
+        """
+        Gets the process-wide key store shared by all validators that are not given their own.
+        """
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = cls()
+        return cls._default
+
+    def get_signing_key(self, jwks_uri: str, kid: str) -> PyJWK:
+        """
+        Gets the signing key with the given key id published at the JWKS endpoint.
+
+        :param jwks_uri: The JWKS endpoint of the token issuer.
+        :param kid: The key id from the token header.
+        :return: The matching signing key.
+        :raises ValueError: If no key with the given id is published at the endpoint.
+        """
+        now = monotonic()
+        entry = self._entries.get(jwks_uri)
+
+        if entry is None or now - entry.fetched_at >= self.ttl:
+            entry = self._refresh(jwks_uri, entry)
+        elif now - entry.fetched_at >= self.ttl - self.refresh_before:
+            self._refresh_in_background(jwks_uri)
+
+        key = entry.keys.get(kid)
+        if key is None and now - entry.fetched_at >= self.min_refetch_interval:
+            # The issuer may have rolled its keys, refetch once.
+            entry = self._refresh(jwks_uri, entry)
+            key = entry.keys.get(kid)
+
+        if key is None:
+            raise ValueError(f"Unable to find a signing key that matches kid '{kid}'.")
+
+        return key
+
+    async def get_signing_key_async(self, jwks_uri: str, kid: str) -> PyJWK:
+        """
+        Gets the signing key with the given key id without blocking the event loop.
+
+        Concurrent fetches of the same endpoint are coalesced into a single request.
+
+        :param jwks_uri: The JWKS endpoint of the token issuer.
+        :param kid: The key id from the token header.
+        :return: The matching signing key.
+        :raises ValueError: If no key with the given id is published at the endpoint.
+        """
+        now = monotonic()
+        entry = self._entries.get(jwks_uri)
+
+        if entry is None or now - entry.fetched_at >= self.ttl:
+            entry = await self._refresh_async(jwks_uri, entry)
+        elif now - entry.fetched_at >= self.ttl - self.refresh_before:
+            self._get_fetch_task(jwks_uri)
+
+        key = entry.keys.get(kid)
+        if key is None and now - entry.fetched_at >= self.min_refetch_interval:
+            # The issuer may have rolled its keys, refetch once.
+            entry = await self._refresh_async(jwks_uri, entry)
+            key = entry.keys.get(kid)
+
+        if key is None:
+            raise ValueError(f"Unable to find a signing key that matches kid '{kid}'.")
+
+        return key
+
+    def clear(self) -> None:
+        """
+        Removes all cached key sets.
+        """
+        self._entries.clear()
+
+    def _fetch(self, jwks_uri: str) -> _JwksEntry:
+        jwks_client = PyJWKClient(jwks_uri, cache_jwk_set=False, timeout=self.timeout)
+        return self._create_entry(jwks_client.fetch_data())
+
+    async def _fetch_async(self, jwks_uri: str) -> _JwksEntry:
+        if ClientSession is None:
+            entry = await get_running_loop().run_in_executor(
+                None, self._fetch, jwks_uri
+            )
+        else:
+            async with ClientSession(
+                timeout=ClientTimeout(total=self.timeout)
+            ) as session:
+                async with session.get(jwks_uri) as response:
+                    response.raise_for_status()
+                    entry = self._create_entry(await response.json(content_type=None))
+
+        self._entries[jwks_uri] = entry
+        return entry
+
+    @staticmethod
+    def _create_entry(jwk_set_data: dict) -> _JwksEntry:
+        jwk_set = PyJWKSet.from_dict(jwk_set_data)
+        keys = {key.key_id: key for key in jwk_set.keys if key.key_id}
+        return _JwksEntry(keys, monotonic())
+
+    def _get_lock(self, jwks_uri: str) -> Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(jwks_uri, Lock())
+
+    def _refresh(self, jwks_uri: str, stale: Optional[_JwksEntry]) -> _JwksEntry:
+        with self._get_lock(jwks_uri):
+            # Another caller may have refreshed the entry while we waited for the lock.
+            current = self._entries.get(jwks_uri)
+            if current is not None and current is not stale:
+                return current
+
+            entry = self._fetch(jwks_uri)
+            self._entries[jwks_uri] = entry
+            return entry
+
+    async def _refresh_async(
+        self, jwks_uri: str, stale: Optional[_JwksEntry]
+    ) -> _JwksEntry:
+        current = self._entries.get(jwks_uri)
+        if current is not None and current is not stale:
+            return current
+
+        # Shielded so that a cancelled request does not cancel the fetch shared with others.
+        return await shield(self._get_fetch_task(jwks_uri))
+
+    def _get_fetch_task(self, jwks_uri: str) -> Task:
+        loop = get_running_loop()
+        task = self._fetch_tasks.get(jwks_uri)
+        if task is not None and task.get_loop() is loop:
+            return task
+
+        task = loop.create_task(self._fetch_async(jwks_uri))
+        self._fetch_tasks[jwks_uri] = task
+
+        def on_done(done: Task):
+            if self._fetch_tasks.get(jwks_uri) is done:
+                del self._fetch_tasks[jwks_uri]
+            if not done.cancelled():
+                # Retrieve the exception so background refreshes do not log it as unhandled.
+                done.exception()
+
+        task.add_done_callback(on_done)
+        return task
+
+    def _refresh_in_background(self, jwks_uri: str) -> None:
+        with self._locks_guard:
+            if jwks_uri in self._refreshing:
+                return
+            self._refreshing.add(jwks_uri)
+
+        def refresh():
+            try:
+                self._refresh(jwks_uri, self._entries.get(jwks_uri))
+            except Exception:  # pylint: disable=broad-except
+                # The stale entry keeps being served until it expires.
+                pass
+            finally:
+                with self._locks_guard:
+                    self._refreshing.discard(jwks_uri)
+
+        Thread(target=refresh, daemon=True).start()
@@ -1,17 +1,87 @@
+from asyncio import get_running_loop
+from concurrent.futures import Executor
+from typing import Optional
+
 import jwt
 
-from jwt import PyJWKClient, PyJWK, decode, get_unverified_header
+from jwt import PyJWK, decode, get_unverified_header
 
 from .agent_auth_configuration import AgentAuthConfiguration
 from .claims_identity import ClaimsIdentity
+from .jwks_key_store import JwksKeyStore
+from .validated_token_cache import ValidatedTokenCache
 
 
 class JwtTokenValidator:
-    def __init__(self, configuration: AgentAuthConfiguration):
+    def __init__(
+        self,
+        configuration: AgentAuthConfiguration,
+        key_store: Optional[JwksKeyStore] = None,
+        executor: Optional[Executor] = None,
+        offload_threshold: int = 8,
+        token_cache: Optional[ValidatedTokenCache] = None,
+    ):
+        """
+        :param configuration: The agent authentication configuration.
+        :param key_store: The signing key cache to use, defaults to the process-wide store.
+        :param executor: The executor used by validate_token_async to verify signatures,
+        defaults to the event loop's default executor.
+        :param offload_threshold: Number of concurrent validate_token_async calls above which
+        signature verification is moved off the event loop to the executor.
+        :param token_cache: The cache of already validated tokens, defaults to a new cache
+        owned by this validator.
+        """
         self.configuration = configuration
+        self.key_store = key_store or JwksKeyStore.get_default()
+        self.executor = executor
+        self.offload_threshold = offload_threshold
+        self.token_cache = (
+            token_cache if token_cache is not None else ValidatedTokenCache()
+        )
+        self._validations_in_flight = 0
 
     def validate_token(self, token: str) -> ClaimsIdentity:
+        identity = self.token_cache.get(token)
+        if identity:
+            return identity
+
         key = self._get_public_key_or_secret(token)
+        return self._verify_token(token, key)
+
+    async def validate_token_async(self, token: str) -> ClaimsIdentity:
+        """
+        Validates the token without blocking the event loop.
+
+        Signing keys are fetched asynchronously and, under load, the signature is verified
+        on the executor.
+        """
+        identity = self.token_cache.get(token)
+        if identity:
+            return identity
+
+        self._validations_in_flight += 1
+        try:
+            header = get_unverified_header(token)
+            unverified_payload: dict = decode(
+                token, options={"verify_signature": False}
+            )
+            key = await self.key_store.get_signing_key_async(
+                self._get_jwks_uri(unverified_payload), header["kid"]
+            )
+
+            if self._validations_in_flight > self.offload_threshold:
+                return await get_running_loop().run_in_executor(
+                    self.executor, self._verify_token, token, key
+                )
+
+            return self._verify_token(token, key)
+        finally:
+            self._validations_in_flight -= 1
+
+    def get_anonymous_claims(self) -> ClaimsIdentity:
+        return ClaimsIdentity({}, False, authentication_type="Anonymous")
+
+    def _verify_token(self, token: str, key: PyJWK) -> ClaimsIdentity:
         decoded_token = jwt.decode(
             token,
             key=key,
@@ -23,22 +93,22 @@ class JwtTokenValidator:
             raise ValueError("Invalid audience.")
 
         # This probably should return a ClaimsIdentity
-        return ClaimsIdentity(decoded_token, True)
-
-    def get_anonymous_claims(self) -> ClaimsIdentity:
-        return ClaimsIdentity({}, False, authentication_type="Anonymous")
+        identity = ClaimsIdentity(decoded_token, True)
+        self.token_cache.set(token, identity)
+        return identity
 
     def _get_public_key_or_secret(self, token: str) -> PyJWK:
         header = get_unverified_header(token)
         unverified_payload: dict = decode(token, options={"verify_signature": False})
 
-        jwksUri = (
+        key = self.key_store.get_signing_key(
+            self._get_jwks_uri(unverified_payload), header["kid"]
+        )
+        return key
+
+    def _get_jwks_uri(self, unverified_payload: dict) -> str:
+        return (
             "https://login.botframework.com/v1/.well-known/keys"
             if unverified_payload.get("iss") == "https://api.botframework.com"
             else f"https://login.microsoftonline.com/{self.configuration.TENANT_ID}/discovery/v2.0/keys"
         )
-
-        jwks_client = PyJWKClient(jwksUri)
-
-        key = jwks_client.get_signing_key(header["kid"])
-        return key
@@ -0,0 +1,94 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from collections import OrderedDict
+from hashlib import sha256
+from threading import Lock
+from time import time
+from typing import Optional
+
+from .claims_identity import ClaimsIdentity
+
+
+class ValidatedTokenCache:
+    """
+    A bounded LRU cache of validated tokens, keyed by the SHA-256 digest of the raw token.
+
+    Entries expire ``leeway`` seconds before the token's ``exp`` claim, tokens without
+    an ``exp`` claim are never cached.
+    """
+
+    def __init__(self, max_size: int = 1024, leeway: float = 5.0):
+        """
+        :param max_size: Maximum number of tokens kept, least recently used ones are evicted first.
+        :param leeway: Seconds before the token expiry at which its entry stops being served.
+        """
+        if max_size <= 0:
+            raise ValueError("ValidatedTokenCache: max_size must be greater than 0")
+
+        self.max_size = max_size
+        self.leeway = leeway
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, tuple[float, ClaimsIdentity]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, token: str) -> Optional[ClaimsIdentity]:
+        """
+        Gets the identity of a previously validated token.
+
+        :param token: The raw token.
+        :return: The cached identity, or None if the token is unknown or about to expire.
+        """
+        key = self._get_key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, identity = entry
+                if time() < expires_at:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return identity
+
+                del self._entries[key]
+
+            self.misses += 1
+            return None
+
+    def set(self, token: str, identity: ClaimsIdentity) -> None:
+        """
+        Caches the identity of a validated token until the token is about to expire.
+
+        :param token: The raw token.
+        :param identity: The identity built from the validated token.
+        """
+        expiration = identity.get_claim_value("exp")
+        if not expiration:
+            return
+
+        expires_at = float(expiration) - self.leeway
+        if time() >= expires_at:
+            return
+
+        key = self._get_key(token)
+        with self._lock:
+            self._entries[key] = (expires_at, identity)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes all cached tokens and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _get_key(token: str) -> bytes:
+        return sha256(token.encode("utf-8")).digest()
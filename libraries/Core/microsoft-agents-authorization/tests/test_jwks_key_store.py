@@ -0,0 +1,45 @@
+import pytest
+from unittest.mock import MagicMock
+
+from microsoft.agents.authorization import JwksKeyStore
+
+JWKS_URI = "https://login.botframework.com/v1/.well-known/keys"
+
+
+class TestJwksKeyStore:
+    @pytest.fixture
+    def key_store(self):
+        store = JwksKeyStore(min_refetch_interval=0)
+        store._fetch = MagicMock(
+            side_effect=lambda uri: JwksKeyStore._create_entry(
+                {"keys": [{"kty": "oct", "k": "c2VjcmV0", "kid": "key1"}]}
+            )
+        )
+        return store
+
+    def test_get_signing_key_is_cached(self, key_store: JwksKeyStore):
+        first = key_store.get_signing_key(JWKS_URI, "key1")
+        second = key_store.get_signing_key(JWKS_URI, "key1")
+        assert first is second
+        key_store._fetch.assert_called_once_with(JWKS_URI)
+
+    def test_get_signing_key_unknown_kid_refetches_once(self, key_store: JwksKeyStore):
+        key_store.get_signing_key(JWKS_URI, "key1")
+        with pytest.raises(ValueError):
+            key_store.get_signing_key(JWKS_URI, "key2")
+        assert key_store._fetch.call_count == 2
+
+    def test_get_signing_key_unknown_kid_respects_refetch_interval(
+        self, key_store: JwksKeyStore
+    ):
+        key_store.min_refetch_interval = 60
+        key_store.get_signing_key(JWKS_URI, "key1")
+        with pytest.raises(ValueError):
+            key_store.get_signing_key(JWKS_URI, "key2")
+        key_store._fetch.assert_called_once()
+
+    def test_get_signing_key_expired_entry_is_refetched(self, key_store: JwksKeyStore):
+        key_store.get_signing_key(JWKS_URI, "key1")
+        key_store._entries[JWKS_URI].fetched_at -= key_store.ttl
+        key_store.get_signing_key(JWKS_URI, "key1")
+        assert key_store._fetch.call_count == 2
@@ -0,0 +1,146 @@
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from microsoft.agents.authorization import JwksKeyStore, JwtTokenValidator
+
+CLIENT_ID = "client-id"
+JWKS_URI = "https://login.botframework.com/v1/.well-known/keys"
+
+
+class _Configuration:
+    TENANT_ID = "tenant-id"
+    CLIENT_ID = CLIENT_ID
+
+
+class _JwksSession:
+    """
+    Stands in for aiohttp's ClientSession, counting the requests to the JWKS endpoint.
+    """
+
+    def __init__(self, jwks: dict):
+        self.jwks = jwks
+        self.requests = 0
+
+    def __call__(self, **kwargs):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    def get(self, url: str):
+        assert url == JWKS_URI
+        self.requests += 1
+        return self
+
+    def raise_for_status(self):
+        pass
+
+    async def json(self, **kwargs) -> dict:
+        await asyncio.sleep(0.01)
+        return self.jwks
+
+
+class TestJwtTokenValidator:
+    @pytest.fixture
+    def private_key(self):
+        return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    @pytest.fixture
+    def jwks(self, private_key):
+        jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+        jwk.update({"kid": "key1", "alg": "RS256"})
+        return {"keys": [jwk]}
+
+    @pytest.fixture
+    def validator(self, jwks):
+        key_store = JwksKeyStore()
+        key_store._entries[JWKS_URI] = JwksKeyStore._create_entry(jwks)
+        return JwtTokenValidator(_Configuration(), key_store=key_store)
+
+    def create_token(
+        self, private_key, audience: str = CLIENT_ID, expires_in: int = 3600
+    ) -> str:
+        claims = {
+            "iss": "https://api.botframework.com",
+            "aud": audience,
+            "exp": int(time.time()) + expires_in,
+        }
+        return jwt.encode(
+            claims, private_key, algorithm="RS256", headers={"kid": "key1"}
+        )
+
+    def test_validate_token(self, validator: JwtTokenValidator, private_key):
+        identity = validator.validate_token(self.create_token(private_key))
+        assert identity.is_authenticated
+        assert identity.get_app_id() == CLIENT_ID
+
+    @pytest.mark.asyncio
+    async def test_validate_token_async(
+        self, validator: JwtTokenValidator, private_key
+    ):
+        identity = await validator.validate_token_async(self.create_token(private_key))
+        assert identity.is_authenticated
+        assert identity.get_app_id() == CLIENT_ID
+
+    @pytest.mark.asyncio
+    async def test_validate_token_async_offloaded(
+        self, validator: JwtTokenValidator, private_key
+    ):
+        validator.offload_threshold = 0
+        identity = await validator.validate_token_async(self.create_token(private_key))
+        assert identity.is_authenticated
+
+    @pytest.mark.asyncio
+    async def test_validate_token_async_invalid_audience(
+        self, validator: JwtTokenValidator, private_key
+    ):
+        with pytest.raises(ValueError):
+            await validator.validate_token_async(
+                self.create_token(private_key, audience="other")
+            )
+
+    @pytest.mark.asyncio
+    async def test_concurrent_validations_fetch_the_keys_once(self, jwks, private_key):
+        session = _JwksSession(jwks)
+        validator = JwtTokenValidator(_Configuration(), key_store=JwksKeyStore())
+        tokens = [
+            self.create_token(private_key, expires_in=3600 + index)
+            for index in range(10)
+        ]
+
+        with patch(
+            "microsoft.agents.authorization.jwks_key_store.ClientSession", session
+        ):
+            identities = await asyncio.gather(
+                *(validator.validate_token_async(token) for token in tokens)
+            )
+
+        assert all(identity.is_authenticated for identity in identities)
+        assert session.requests == 1
+
+    def test_validate_token_cached(self, validator: JwtTokenValidator, private_key):
+        token = self.create_token(private_key)
+        first = validator.validate_token(token)
+        second = validator.validate_token(token)
+        assert first is second
+        assert validator.token_cache.hits == 1
+        assert validator.token_cache.misses == 1
+
+    def test_validate_token_invalid_audience_not_cached(
+        self, validator: JwtTokenValidator, private_key
+    ):
+        token = self.create_token(private_key, audience="other")
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                validator.validate_token(token)
+        assert len(validator.token_cache) == 0
@@ -0,0 +1,45 @@
+import time
+
+from microsoft.agents.authorization import ClaimsIdentity, ValidatedTokenCache
+
+
+def create_identity(expires_in: float) -> ClaimsIdentity:
+    return ClaimsIdentity({"exp": int(time.time() + expires_in)}, True)
+
+
+def test_get_unknown_token():
+    cache = ValidatedTokenCache()
+    assert cache.get("token") is None
+    assert cache.misses == 1
+
+
+def test_set_and_get():
+    cache = ValidatedTokenCache()
+    identity = create_identity(3600)
+    cache.set("token", identity)
+    assert cache.get("token") is identity
+    assert cache.hits == 1
+
+
+def test_token_expiring_within_leeway_is_not_served():
+    cache = ValidatedTokenCache(leeway=60)
+    cache.set("token", create_identity(30))
+    assert cache.get("token") is None
+    assert len(cache) == 0
+
+
+def test_token_without_expiration_is_not_cached():
+    cache = ValidatedTokenCache()
+    cache.set("token", ClaimsIdentity({}, True))
+    assert len(cache) == 0
+
+
+def test_least_recently_used_token_is_evicted():
+    cache = ValidatedTokenCache(max_size=2)
+    cache.set("token1", create_identity(3600))
+    cache.set("token2", create_identity(3600))
+    cache.get("token1")
+    cache.set("token3", create_identity(3600))
+    assert cache.get("token1") is not None
+    assert cache.get("token2") is None
+    assert cache.get("token3") is not None
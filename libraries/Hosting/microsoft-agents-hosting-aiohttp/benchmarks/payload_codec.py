@@ -0,0 +1,115 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+Benchmark of parsing incoming activities and encoding response models, for a Teams message
+and for activities carrying Adaptive Cards of increasing size.
+
+Compares parsing through a dict (request.json() then model_validate) with model_validate_json,
+and encoding through a dict (model_dump then json.dumps) with model_dump_json.
+
+Run with: python benchmarks/payload_codec.py
+"""
+
+import json
+from timeit import timeit
+
+from microsoft.agents.core.models import Activity
+
+CARD_ELEMENTS = [0, 10, 100]
+ITERATIONS = 2000
+
+
+def create_activity_body(elements: int) -> bytes:
+    activity = {
+        "type": "message",
+        "id": "1485983408511",
+        "timestamp": "2025-01-01T10:00:00.000Z",
+        "localTimestamp": "2025-01-01T11:00:00.000+01:00",
+        "serviceUrl": "https://smba.trafficmanager.net/amer/",
+        "channelId": "msteams",
+        "from": {
+            "id": "29:1XJKJMvc5GBtc2JwZq0oj8tHZmzrQgFmB39ATiQWA85gQtHieVkKilBZ9XHoq",
+            "name": "Megan Bowen",
+            "aadObjectId": "d5ecd8c7-7b4a-4a2d-b8b5-2dd8cbf6a6b4",
+        },
+        "conversation": {
+            "conversationType": "personal",
+            "tenantId": "72f988bf-86f1-41af-91ab-2d7cd011db47",
+            "id": "a:1Ge8kp3PjQ6OQ8-2l5bQ3pFQ7eJj1ZtXqNnqRZ-9F1mP",
+        },
+        "recipient": {"id": "28:0a1b2c3d-agent", "name": "Agent"},
+        "textFormat": "plain",
+        "locale": "en-US",
+        "text": "Show me my open tasks",
+        "entities": [
+            {
+                "type": "clientInfo",
+                "locale": "en-US",
+                "country": "US",
+                "platform": "Web",
+                "timezone": "Europe/Paris",
+            }
+        ],
+        "channelData": {
+            "tenant": {"id": "72f988bf-86f1-41af-91ab-2d7cd011db47"},
+            "source": {"name": "message"},
+        },
+        "attachments": (
+            [
+                {
+                    "contentType": "application/vnd.microsoft.card.adaptive",
+                    "content": {
+                        "type": "AdaptiveCard",
+                        "version": "1.5",
+                        "body": [
+                            {"type": "TextBlock", "text": f"Item {index}", "wrap": True}
+                            for index in range(elements)
+                        ],
+                    },
+                }
+            ]
+            if elements
+            else []
+        ),
+    }
+    return json.dumps(activity).encode()
+
+
+def main():
+    print(
+        f"{'elements':>10}{'json+validate':>18}{'validate_json':>18}"
+        f"{'dump+dumps':>16}{'dump_json':>16}"
+    )
+    for elements in CARD_ELEMENTS:
+        body = create_activity_body(elements)
+        activity = Activity.model_validate_json(body)
+        timings = [
+            timeit(
+                lambda: Activity.model_validate(json.loads(body)), number=ITERATIONS
+            ),
+            timeit(lambda: Activity.model_validate_json(body), number=ITERATIONS),
+            timeit(
+                lambda: json.dumps(
+                    activity.model_dump(mode="json", exclude_unset=True, by_alias=True)
+                ).encode(),
+                number=ITERATIONS,
+            ),
+            timeit(
+                lambda: activity.model_dump_json(
+                    exclude_unset=True, by_alias=True
+                ).encode(),
+                number=ITERATIONS,
+            ),
+        ]
+        print(
+            f"{elements:>10}"
+            + "".join(
+                f"{timing / ITERATIONS * 1_000_000:>{width}.1f} us"
+                for timing, width in zip(timings, (15, 15, 13, 13))
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 from .agent_http_adapter import AgentHttpAdapter
+from .background_turn_queue import BackgroundTurnQueue
 from .channel_service_route_table import channel_service_route_table
 from .cloud_adapter import CloudAdapter
 from .jwt_authorization_middleware import (
@@ -8,6 +9,7 @@ from .jwt_authorization_middleware import (
 
 __all__ = [
     "AgentHttpAdapter",
+    "BackgroundTurnQueue",
     "CloudAdapter",
     "jwt_authorization_middleware",
     "jwt_authorization_decorator",
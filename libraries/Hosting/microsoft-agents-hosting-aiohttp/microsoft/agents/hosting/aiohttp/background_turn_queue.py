@@ -0,0 +1,135 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+import asyncio
+import logging
+from asyncio import Queue, QueueEmpty, Task, create_task, gather, wait, wait_for
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger("microsoft.agents.hosting.aiohttp.background_turn_queue")
+
+Turn = Callable[[], Awaitable]
+
+
+class BackgroundTurnQueue:
+    """
+    A bounded in-process queue of turns, processed by a fixed number of workers.
+
+    Workers are started with the first turn enqueued, on the running event loop. Once the
+    queue is drained, enqueueing raises RuntimeError.
+    """
+
+    def __init__(self, max_size: int = 1000, max_concurrency: int = 16):
+        """
+        :param max_size: Maximum number of turns waiting to be processed, enqueueing waits
+        for room beyond it.
+        :param max_concurrency: Maximum number of turns processed at the same time.
+        """
+        if max_size <= 0:
+            raise ValueError("BackgroundTurnQueue: max_size must be greater than 0")
+        if max_concurrency <= 0:
+            raise ValueError(
+                "BackgroundTurnQueue: max_concurrency must be greater than 0"
+            )
+
+        self.max_size = max_size
+        self.max_concurrency = max_concurrency
+        self.active_turns = 0
+        self.completed_turns = 0
+        self.failed_turns = 0
+        self.max_observed_depth = 0
+        self.dropped_turns = 0
+        self._queue: Optional[Queue] = None
+        self._workers: list[Task] = []
+        # Turns waiting for room in the full queue, rejected when it is drained.
+        self._pending_puts: set[Task] = set()
+        self._is_closed = False
+
+    @property
+    def depth(self) -> int:
+        """
+        The number of turns waiting to be processed.
+        """
+        return self._queue.qsize() if self._queue else 0
+
+    async def enqueue(self, turn: Turn) -> None:
+        """
+        Adds a turn to the queue, waiting for room when it is full.
+
+        :param turn: Called without arguments by a worker, returns the awaitable running the turn.
+        :raises RuntimeError: When the queue is drained, before or while waiting for room.
+        """
+        if self._is_closed:
+            raise RuntimeError("BackgroundTurnQueue.enqueue(): the queue is closed")
+
+        if self._queue is None:
+            self._queue = Queue(self.max_size)
+            self._workers = [
+                create_task(self._work()) for _ in range(self.max_concurrency)
+            ]
+
+        if self._queue.full():
+            put = create_task(self._queue.put(turn))
+            self._pending_puts.add(put)
+            try:
+                # Waits without cancelling the put, cancelled only by drain() or below.
+                await wait((put,))
+            finally:
+                self._pending_puts.discard(put)
+                put.cancel()
+            if put.cancelled():
+                raise RuntimeError("BackgroundTurnQueue.enqueue(): the queue is closed")
+        else:
+            self._queue.put_nowait(turn)
+
+        self.max_observed_depth = max(self.max_observed_depth, self._queue.qsize())
+
+    async def drain(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops accepting turns, waits for the queued and running ones to complete, then stops
+        the workers. Turns still waiting for room in the queue are rejected.
+
+        :param timeout: Maximum seconds to wait, None to wait for every turn. Turns still
+        running after it are cancelled, and turns still queued are dropped.
+        """
+        self._is_closed = True
+        if self._queue is None:
+            return
+
+        for put in self._pending_puts:
+            put.cancel()
+
+        try:
+            await wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "BackgroundTurnQueue.drain(): dropping %s queued turns and cancelling %s running turns",
+                self._queue.qsize(),
+                self.active_turns,
+            )
+        finally:
+            for worker in self._workers:
+                worker.cancel()
+            await gather(*self._workers, return_exceptions=True)
+            self._workers = []
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except QueueEmpty:
+                    break
+                self._queue.task_done()
+                self.dropped_turns += 1
+
+    async def _work(self) -> None:
+        while True:
+            turn = await self._queue.get()
+            self.active_turns += 1
+            try:
+                await turn()
+                self.completed_turns += 1
+            except Exception:  # pylint: disable=broad-exception-caught
+                # Nobody awaits the turn anymore, its errors can only be logged.
+                self.failed_turns += 1
+                logger.exception("BackgroundTurnQueue: turn failed")
+            finally:
+                self.active_turns -= 1
+                self._queue.task_done()
@@ -1,9 +1,15 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
-import json
 from typing import List, Union, Type
 
-from aiohttp.web import RouteTableDef, Request, Response
+from aiohttp.web import (
+    HTTPBadRequest,
+    HTTPUnsupportedMediaType,
+    RouteTableDef,
+    Request,
+    Response,
+)
+from pydantic import ValidationError
 
 from microsoft.agents.core.models import (
     AgentsModel,
@@ -19,27 +25,33 @@ async def deserialize_from_body(
     request: Request, target_model: Type[AgentsModel]
 ) -> Activity:
     if "application/json" in request.headers["Content-Type"]:
-        body = await request.json()
+        body = await request.read()
     else:
-        return Response(status=415)
+        raise HTTPUnsupportedMediaType()
 
-    return target_model.model_validate(body)
+    # Validated straight from the raw body, without an intermediate dict.
+    try:
+        return target_model.model_validate_json(body)
+    except ValidationError:
+        raise HTTPBadRequest
 
 
 def get_serialized_response(
     model_or_list: Union[AgentsModel, List[AgentsModel]],
 ) -> Response:
     if isinstance(model_or_list, AgentsModel):
-        json_obj = model_or_list.model_dump(
-            mode="json", exclude_unset=True, by_alias=True
-        )
+        body = model_or_list.model_dump_json(exclude_unset=True, by_alias=True)
     else:
-        json_obj = [
-            model.model_dump(mode="json", exclude_unset=True, by_alias=True)
-            for model in model_or_list
-        ]
+        body = (
+            "["
+            + ",".join(
+                model.model_dump_json(exclude_unset=True, by_alias=True)
+                for model in model_or_list
+            )
+            + "]"
+        )
 
-    return Response(body=json.dumps(json_obj), content_type="application/json")
+    return Response(body=body.encode(), content_type="application/json")
 
 
 def channel_service_route_table(
@@ -59,6 +71,18 @@ def channel_service_route_table(
 
         return get_serialized_response(result)
 
+    # Registered before reply_to_activity, whose activity_id would match "history".
+    @routes.post(base_url + "/v3/conversations/{conversation_id}/activities/history")
+    async def send_conversation_history(request: Request):
+        transcript = await deserialize_from_body(request, Transcript)
+        result = await handler.on_send_conversation_history(
+            request.get("claims_identity"),
+            request.match_info["conversation_id"],
+            transcript,
+        )
+
+        return get_serialized_response(result)
+
     @routes.post(
         base_url + "/v3/conversations/{conversation_id}/activities/{activity_id}"
     )
@@ -114,7 +138,9 @@ def channel_service_route_table(
 
     @routes.post(base_url + "/")
     async def create_conversation(request: Request):
-        conversation_parameters = deserialize_from_body(request, ConversationParameters)
+        conversation_parameters = await deserialize_from_body(
+            request, ConversationParameters
+        )
         result = await handler.on_create_conversation(
             request.get("claims_identity"), conversation_parameters
         )
@@ -169,20 +195,9 @@ def channel_service_route_table(
 
         return get_serialized_response(result)
 
-    @routes.post(base_url + "/v3/conversations/{conversation_id}/activities/history")
-    async def send_conversation_history(request: Request):
-        transcript = deserialize_from_body(request, Transcript)
-        result = await handler.on_send_conversation_history(
-            request.get("claims_identity"),
-            request.match_info["conversation_id"],
-            transcript,
-        )
-
-        return get_serialized_response(result)
-
     @routes.post(base_url + "/v3/conversations/{conversation_id}/attachments")
     async def upload_attachment(request: Request):
-        attachment_data = deserialize_from_body(request, AttachmentData)
+        attachment_data = await deserialize_from_body(request, AttachmentData)
         result = await handler.on_upload_attachment(
             request.get("claims_identity"),
             request.match_info["conversation_id"],
@@ -1,14 +1,16 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
+from functools import partial
 from traceback import format_exc
 from typing import Optional
 
 from aiohttp.web import (
+    Application,
     Request,
     Response,
-    json_response,
     HTTPBadRequest,
     HTTPMethodNotAllowed,
+    HTTPServiceUnavailable,
     HTTPUnauthorized,
     HTTPUnsupportedMediaType,
 )
@@ -17,6 +19,8 @@ from microsoft.agents.core.models import (
     Activity,
     DeliveryModes,
 )
+from pydantic import ValidationError
+
 from microsoft.agents.builder import (
     Agent,
     ChannelServiceAdapter,
@@ -26,19 +30,37 @@ from microsoft.agents.builder import (
 )
 
 from .agent_http_adapter import AgentHttpAdapter
+from .background_turn_queue import BackgroundTurnQueue
+from .json_codec import JsonDumps, json_dumps
 
 
 class CloudAdapter(ChannelServiceAdapter, AgentHttpAdapter):
     def __init__(
         self,
         channel_service_client_factory: ChannelServiceClientFactoryBase,
+        *,
+        invoke_json_dumps: JsonDumps = json_dumps,
+        background_turn_queue: Optional[BackgroundTurnQueue] = None,
+        drain_timeout: Optional[float] = 30.0,
+        **kwargs,
     ):
         """
         Initializes a new instance of the CloudAdapter class.
 
         :param channel_service_client_factory: The factory to use to create the channel service client.
+        :param invoke_json_dumps: Encodes the bodies of invoke responses to UTF-8 JSON, defaults to orjson
+        when it is installed.
+        :param background_turn_queue: Opts in to acknowledging activities with 202 before their
+        turn runs, the turns are then processed from this queue. Invoke and expect replies
+        activities are always processed before responding, as their response depends on the turn.
+        Activities received while the queue is drained are rejected with 503.
+        :param drain_timeout: Maximum seconds on_cleanup waits for queued turns to complete.
+        :param kwargs: Delivery options forwarded to ChannelServiceAdapter, such as pipelined_delivery.
         """
-        super().__init__(channel_service_client_factory)
+        super().__init__(channel_service_client_factory, **kwargs)
+        self._json_dumps = invoke_json_dumps
+        self.background_turn_queue = background_turn_queue
+        self._drain_timeout = drain_timeout
 
         async def on_turn_error(context: TurnContext, error: Exception):
             error_message = f"Exception caught : {error}"
@@ -64,13 +86,16 @@ class CloudAdapter(ChannelServiceAdapter, AgentHttpAdapter):
             raise TypeError("CloudAdapter.process: agent can't be None")
 
         if request.method == "POST":
-            # Deserialize the incoming Activity
+            # Deserialize the incoming Activity straight from the raw body, without an intermediate dict
             if "application/json" in request.headers["Content-Type"]:
-                body = await request.json()
+                body = await request.read()
             else:
                 raise HTTPUnsupportedMediaType()
 
-            activity: Activity = Activity.model_validate(body)
+            try:
+                activity: Activity = Activity.model_validate_json(body)
+            except ValidationError:
+                raise HTTPBadRequest
             claims_identity: ClaimsIdentity = request.get("claims_identity")
 
             # A POST request must contain an Activity
@@ -81,6 +106,29 @@ class CloudAdapter(ChannelServiceAdapter, AgentHttpAdapter):
             ):
                 raise HTTPBadRequest
 
+            if self.background_turn_queue and not (
+                activity.type == "invoke"
+                or activity.delivery_mode == DeliveryModes.expect_replies
+            ):
+                # Authenticated before acknowledging, so that rejected requests still get 401.
+                try:
+                    turn = await self._prepare_activity_turn(
+                        claims_identity, activity, agent.on_turn
+                    )
+                except PermissionError:
+                    raise HTTPUnauthorized
+
+                # Acknowledged before the turn runs, so that slow turns do not hold the request open.
+                try:
+                    await self.background_turn_queue.enqueue(
+                        partial(self._run_activity_turn, activity, turn)
+                    )
+                except RuntimeError:
+                    # The application is shutting down, the channel can retry the activity.
+                    await turn.close()
+                    raise HTTPServiceUnavailable
+                return Response(status=202)
+
             try:
                 # Process the inbound activity with the agent
                 invoke_response = await self.process_activity(
@@ -92,8 +140,10 @@ class CloudAdapter(ChannelServiceAdapter, AgentHttpAdapter):
                     or activity.delivery_mode == DeliveryModes.expect_replies
                 ):
                     # Invoke and ExpectReplies cannot be performed async, the response must be written before the calling thread is released.
-                    return json_response(
-                        data=invoke_response.body, status=invoke_response.status
+                    return Response(
+                        body=self._json_dumps(invoke_response.body),
+                        status=invoke_response.status,
+                        content_type="application/json",
                     )
 
                 return Response(status=202)
@@ -101,3 +151,14 @@ class CloudAdapter(ChannelServiceAdapter, AgentHttpAdapter):
                 raise HTTPUnauthorized
         else:
             raise HTTPMethodNotAllowed
+
+    async def on_cleanup(self, app: Application) -> None:
+        """
+        Completes the turns queued in the background, then releases the adapter's shared
+        resources, such as pooled HTTP sessions.
+
+        Register it with the application: ``APP.on_cleanup.append(ADAPTER.on_cleanup)``.
+        """
+        if self.background_turn_queue:
+            await self.background_turn_queue.drain(self._drain_timeout)
+        await self._channel_service_client_factory.close()
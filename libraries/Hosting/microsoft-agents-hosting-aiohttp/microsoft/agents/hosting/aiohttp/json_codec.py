@@ -0,0 +1,28 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JsonDumps = Callable[[Any], bytes]
+
+
+def json_dumps(value: Any) -> bytes:
+    """
+    Encodes a value as UTF-8 JSON, with orjson when it is installed.
+
+    :param value: The JSON-compatible value.
+    :return: The encoded value.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            # Values orjson does not support, such as integers above 64 bits.
+            pass
+
+    return json.dumps(value, separators=(",", ":")).encode()
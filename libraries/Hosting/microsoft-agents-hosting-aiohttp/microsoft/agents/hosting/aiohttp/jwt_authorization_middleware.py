@@ -1,19 +1,41 @@
 import functools
-from aiohttp.web import Request, middleware, json_response
+from weakref import WeakKeyDictionary
+
+from aiohttp.web import Application, Request, middleware, json_response
 
 from microsoft.agents.authorization import AgentAuthConfiguration, JwtTokenValidator
 
+_token_validators: "WeakKeyDictionary[Application, JwtTokenValidator]" = (
+    WeakKeyDictionary()
+)
+
+
+def get_token_validator(app: Application) -> JwtTokenValidator:
+    """
+    Gets the token validator of the application, creating it on first use.
+
+    An application can provide its own validator under the "token_validator" key,
+    otherwise one is built from the "agent_configuration" and reused for every request.
+    """
+    token_validator = app.get("token_validator") or _token_validators.get(app)
+    if token_validator is None:
+        auth_config: AgentAuthConfiguration = app["agent_configuration"]
+        token_validator = JwtTokenValidator(auth_config)
+        _token_validators[app] = token_validator
+
+    return token_validator
+
 
 @middleware
 async def jwt_authorization_middleware(request: Request, handler):
     auth_config: AgentAuthConfiguration = request.app["agent_configuration"]
-    token_validator = JwtTokenValidator(auth_config)
+    token_validator = get_token_validator(request.app)
     auth_header = request.headers.get("Authorization")
     if auth_header:
         # Extract the token from the Authorization header
         token = auth_header.split(" ")[1]
         try:
-            claims = token_validator.validate_token(token)
+            claims = await token_validator.validate_token_async(token)
             request["claims_identity"] = claims
         except ValueError as e:
             print(f"JWT validation error: {e}")
@@ -34,13 +56,13 @@ def jwt_authorization_decorator(func):
     @functools.wraps(func)
     async def wrapper(request):
         auth_config: AgentAuthConfiguration = request.app["agent_configuration"]
-        token_validator = JwtTokenValidator(auth_config)
+        token_validator = get_token_validator(request.app)
         auth_header = request.headers.get("Authorization")
         if auth_header:
             # Extract the token from the Authorization header
             token = auth_header.split(" ")[1]
             try:
-                claims = token_validator.validate_token(token)
+                claims = await token_validator.validate_token_async(token)
                 request["claims_identity"] = claims
             except ValueError as e:
                 print(f"JWT validation error: {e}")
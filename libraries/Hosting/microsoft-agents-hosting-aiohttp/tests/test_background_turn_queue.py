@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from microsoft.agents.hosting.aiohttp import BackgroundTurnQueue
+
+
+class TestBackgroundTurnQueue:
+    @pytest.mark.asyncio
+    async def test_turns_run_up_to_max_concurrency(self):
+        queue = BackgroundTurnQueue(max_concurrency=2)
+        running = 0
+        max_running = 0
+
+        async def turn():
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        for _ in range(5):
+            await queue.enqueue(turn)
+        await queue.drain()
+
+        assert max_running == 2
+        assert queue.completed_turns == 5
+
+    @pytest.mark.asyncio
+    async def test_enqueue_waits_for_room_when_full(self):
+        queue = BackgroundTurnQueue(max_size=1, max_concurrency=1)
+        release = asyncio.Event()
+
+        async def turn():
+            await release.wait()
+
+        await queue.enqueue(turn)
+        await asyncio.sleep(0)
+        await queue.enqueue(turn)
+        pending = asyncio.ensure_future(queue.enqueue(turn))
+        await asyncio.sleep(0.01)
+
+        assert not pending.done()
+        assert queue.depth == 1
+
+        release.set()
+        await pending
+        await queue.drain()
+
+        assert queue.completed_turns == 3
+
+    @pytest.mark.asyncio
+    async def test_drain_rejects_pending_and_new_turns(self):
+        queue = BackgroundTurnQueue(max_size=1, max_concurrency=1)
+        release = asyncio.Event()
+
+        async def turn():
+            await release.wait()
+
+        await queue.enqueue(turn)
+        await asyncio.sleep(0)
+        await queue.enqueue(turn)
+        pending = asyncio.ensure_future(queue.enqueue(turn))
+        await asyncio.sleep(0)
+
+        drain = asyncio.ensure_future(queue.drain())
+        with pytest.raises(RuntimeError):
+            await pending
+        with pytest.raises(RuntimeError):
+            await queue.enqueue(turn)
+
+        release.set()
+        await drain
+        assert queue.completed_turns == 2
+
+    @pytest.mark.asyncio
+    async def test_drain_timeout_cancels_running_and_drops_queued_turns(self, caplog):
+        queue = BackgroundTurnQueue(max_concurrency=1)
+
+        async def turn():
+            await asyncio.sleep(10)
+
+        for _ in range(3):
+            await queue.enqueue(turn)
+        await asyncio.sleep(0)
+        await queue.drain(0.01)
+
+        assert queue.dropped_turns == 2
+        assert queue.active_turns == 0
+        assert queue.depth == 0
+        assert "dropping 2 queued turns and cancelling 1 running turns" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_failed_turn_is_counted(self):
+        queue = BackgroundTurnQueue()
+
+        async def turn():
+            raise ValueError("turn failed")
+
+        await queue.enqueue(turn)
+        await queue.drain()
+
+        assert queue.failed_turns == 1
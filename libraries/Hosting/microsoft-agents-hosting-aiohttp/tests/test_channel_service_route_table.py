@@ -0,0 +1,112 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+from aiohttp.web import Application
+
+from microsoft.agents.core.models import (
+    AttachmentData,
+    ChannelAccount,
+    ConversationParameters,
+    ConversationResourceResponse,
+    ResourceResponse,
+    Transcript,
+)
+from microsoft.agents.hosting.aiohttp import channel_service_route_table
+
+
+def _create_client(handler) -> TestClient:
+    app = Application()
+    app.add_routes(channel_service_route_table(handler, "/api"))
+    return TestClient(TestServer(app))
+
+
+class TestChannelServiceRouteTable:
+    @pytest.mark.asyncio
+    async def test_routes_pass_validated_models_to_the_handler(self):
+        handler = MagicMock()
+        handler.on_create_conversation = AsyncMock(
+            return_value=ConversationResourceResponse(id="c1")
+        )
+        handler.on_send_conversation_history = AsyncMock(
+            return_value=ResourceResponse(id="h1")
+        )
+        handler.on_upload_attachment = AsyncMock(return_value=ResourceResponse(id="a1"))
+
+        async with _create_client(handler) as client:
+            response = await client.post(
+                "/api/", json={"isGroup": True, "topicName": "topic"}
+            )
+            assert await response.json() == {"id": "c1"}
+            response = await client.post(
+                "/api/v3/conversations/c1/activities/history",
+                json={"activities": [{"type": "message", "text": "hi"}]},
+            )
+            assert await response.json() == {"id": "h1"}
+            response = await client.post(
+                "/api/v3/conversations/c1/attachments",
+                json={"type": "image/png", "name": "a.png"},
+            )
+            assert await response.json() == {"id": "a1"}
+
+        parameters = handler.on_create_conversation.await_args.args[1]
+        assert isinstance(parameters, ConversationParameters)
+        assert parameters.is_group and parameters.topic_name == "topic"
+        transcript = handler.on_send_conversation_history.await_args.args[2]
+        assert isinstance(transcript, Transcript)
+        assert transcript.activities[0].text == "hi"
+        attachment_data = handler.on_upload_attachment.await_args.args[2]
+        assert isinstance(attachment_data, AttachmentData)
+        assert attachment_data.name == "a.png"
+
+    @pytest.mark.asyncio
+    async def test_serializes_responses_with_aliases_and_without_unset_fields(self):
+        members = [
+            ChannelAccount(id="u1", name="User", aad_object_id="aad1"),
+            ChannelAccount(id="u2"),
+        ]
+        handler = MagicMock()
+        handler.on_get_conversation_members = AsyncMock(return_value=members)
+        handler.on_get_conversation_member = AsyncMock(return_value=members[0])
+
+        async with _create_client(handler) as client:
+            response = await client.get("/api/v3/conversations/c1/members")
+            assert response.content_type == "application/json"
+            assert await response.json() == [
+                member.model_dump(mode="json", exclude_unset=True, by_alias=True)
+                for member in members
+            ]
+            assert await response.json() == [
+                {"id": "u1", "name": "User", "aadObjectId": "aad1"},
+                {"id": "u2"},
+            ]
+
+            response = await client.get("/api/v3/conversations/c1/members/u1")
+            assert await response.json() == {
+                "id": "u1",
+                "name": "User",
+                "aadObjectId": "aad1",
+            }
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_bodies(self):
+        handler = MagicMock()
+        handler.on_send_to_conversation = AsyncMock()
+
+        async with _create_client(handler) as client:
+            response = await client.post(
+                "/api/v3/conversations/c1/activities", json={"type": 1}
+            )
+            assert response.status == 400
+            response = await client.post(
+                "/api/v3/conversations/c1/activities",
+                data=b"{",
+                headers={"Content-Type": "application/json"},
+            )
+            assert response.status == 400
+            response = await client.post(
+                "/api/v3/conversations/c1/activities", data="text"
+            )
+            assert response.status == 415
+
+        handler.on_send_to_conversation.assert_not_awaited()
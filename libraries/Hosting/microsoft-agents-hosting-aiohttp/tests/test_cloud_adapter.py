@@ -0,0 +1,213 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+from aiohttp.web import Application, middleware
+
+from microsoft.agents.authorization import ClaimsIdentity
+from microsoft.agents.core.models import Activity
+from microsoft.agents.hosting.aiohttp import (
+    BackgroundTurnQueue,
+    CloudAdapter,
+    json_codec,
+)
+
+
+class _ClientFactory:
+    def __init__(self, error: Exception = None):
+        self.error = error
+        self.close = AsyncMock()
+        self.clients = []
+
+    async def create_connector_client(self, *args):
+        if self.error:
+            raise self.error
+        client = MagicMock()
+        client.close = AsyncMock()
+        self.clients.append(client)
+        return client
+
+    async def create_user_token_client(self, *args):
+        return MagicMock(close=AsyncMock())
+
+
+class _Agent:
+    def __init__(self, turn=None):
+        self.turns = []
+        self.turn = turn
+
+    async def on_turn(self, context):
+        self.turns.append(context.activity)
+        if self.turn:
+            await self.turn(context)
+
+
+@middleware
+async def _anonymous_claims(request, handler):
+    request["claims_identity"] = ClaimsIdentity({}, False, "Anonymous")
+    return await handler(request)
+
+
+def _create_client(adapter: CloudAdapter, agent: _Agent) -> TestClient:
+    async def messages(request):
+        return await adapter.process(request, agent)
+
+    app = Application(middlewares=[_anonymous_claims])
+    app.router.add_post("/api/messages", messages)
+    app.on_cleanup.append(adapter.on_cleanup)
+    return TestClient(TestServer(app))
+
+
+def _message(conversation_id: str = "c1", text: str = "hi") -> dict:
+    return {
+        "type": "message",
+        "id": "a1",
+        "text": text,
+        "channelId": "test",
+        "serviceUrl": "https://service/",
+        "conversation": {"id": conversation_id},
+        "from": {"id": "user"},
+        "recipient": {"id": "agent"},
+    }
+
+
+class TestCloudAdapter:
+    @pytest.mark.asyncio
+    async def test_rejects_bodies_that_are_not_activities(self):
+        agent = _Agent()
+        adapter = CloudAdapter(_ClientFactory())
+
+        async with _create_client(adapter, agent) as client:
+            response = await client.post(
+                "/api/messages",
+                data=b"{not json",
+                headers={"Content-Type": "application/json"},
+            )
+            assert response.status == 400
+            response = await client.post("/api/messages", json={"type": 1})
+            assert response.status == 400
+            response = await client.post("/api/messages", data="text")
+            assert response.status == 415
+
+        assert not agent.turns
+
+    @pytest.mark.asyncio
+    async def test_parses_aliased_fields_of_the_activity(self):
+        agent = _Agent()
+        adapter = CloudAdapter(_ClientFactory())
+
+        async with _create_client(adapter, agent) as client:
+            response = await client.post("/api/messages", json=_message())
+            assert response.status == 202
+
+        assert agent.turns[0].from_property.id == "user"
+        assert agent.turns[0].service_url == "https://service/"
+
+    @pytest.mark.asyncio
+    async def test_encodes_invoke_responses_with_json_dumps(self):
+        async def turn(context):
+            await context.send_activity(
+                Activity(
+                    type="invokeResponse",
+                    value={"status": 200, "body": {"text": "héllo"}},
+                )
+            )
+
+        encoded = []
+
+        def json_dumps(value) -> bytes:
+            encoded.append(value)
+            return json_codec.json_dumps(value)
+
+        adapter = CloudAdapter(_ClientFactory(), invoke_json_dumps=json_dumps)
+        activity = {**_message(), "type": "invoke", "name": "test"}
+
+        async with _create_client(adapter, _Agent(turn)) as client:
+            response = await client.post("/api/messages", json=activity)
+
+            assert response.status == 200
+            assert response.content_type == "application/json"
+            assert await response.json() == {"text": "héllo"}
+
+        assert encoded == [{"text": "héllo"}]
+
+
+class TestCloudAdapterBackgroundTurns:
+    @pytest.mark.asyncio
+    async def test_acknowledges_before_turn_runs_and_drains_on_cleanup(self):
+        release = asyncio.Event()
+
+        async def turn(context):
+            await release.wait()
+
+        agent = _Agent(turn)
+        factory = _ClientFactory()
+        queue = BackgroundTurnQueue()
+        adapter = CloudAdapter(factory, background_turn_queue=queue)
+
+        async with _create_client(adapter, agent) as client:
+            response = await client.post("/api/messages", json=_message())
+            assert response.status == 202
+            assert queue.completed_turns == 0
+            release.set()
+
+        assert [activity.text for activity in agent.turns] == ["hi"]
+        assert queue.completed_turns == 1
+        factory.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_waits_for_room_when_queue_is_full(self):
+        release = asyncio.Event()
+
+        async def turn(context):
+            await release.wait()
+
+        queue = BackgroundTurnQueue(max_size=1, max_concurrency=1)
+        adapter = CloudAdapter(_ClientFactory(), background_turn_queue=queue)
+
+        async with _create_client(adapter, _Agent(turn)) as client:
+            for text in ("a", "b"):
+                response = await client.post("/api/messages", json=_message(text=text))
+                assert response.status == 202
+
+            pending = asyncio.ensure_future(
+                client.post("/api/messages", json=_message(text="c"))
+            )
+            await asyncio.sleep(0.05)
+            assert not pending.done()
+
+            release.set()
+            assert (await pending).status == 202
+
+        assert queue.completed_turns == 3
+
+    @pytest.mark.asyncio
+    async def test_rejects_unauthorized_request_before_acknowledging(self):
+        agent = _Agent()
+        queue = BackgroundTurnQueue()
+        adapter = CloudAdapter(
+            _ClientFactory(PermissionError("denied")), background_turn_queue=queue
+        )
+
+        async with _create_client(adapter, agent) as client:
+            response = await client.post("/api/messages", json=_message())
+
+            assert response.status == 401
+            assert queue.depth == 0
+
+        assert not agent.turns
+
+    @pytest.mark.asyncio
+    async def test_rejects_activities_once_drained(self):
+        factory = _ClientFactory()
+        queue = BackgroundTurnQueue()
+        adapter = CloudAdapter(factory, background_turn_queue=queue)
+
+        async with _create_client(adapter, _Agent()) as client:
+            await queue.drain()
+            response = await client.post("/api/messages", json=_message())
+
+            assert response.status == 503
+            assert len(factory.clients) == 1
+            factory.clients[0].close.assert_awaited_once()
@@ -0,0 +1,27 @@
+import json
+
+import pytest
+
+from microsoft.agents.hosting.aiohttp import json_codec
+from microsoft.agents.hosting.aiohttp.json_codec import json_dumps
+
+VALUE = {"status": 200, "body": {"text": "héllo", "items": [1, 2.5, None, True]}}
+
+
+class TestJsonDumps:
+    def test_encodes_compact_utf8_json(self):
+        body = json_dumps(VALUE)
+
+        assert isinstance(body, bytes)
+        assert json.loads(body) == VALUE
+        assert b" " not in body
+
+    def test_encodes_without_orjson(self, monkeypatch):
+        monkeypatch.setattr(json_codec, "orjson", None)
+
+        assert json.loads(json_dumps(VALUE)) == VALUE
+
+    def test_falls_back_for_values_orjson_does_not_support(self):
+        pytest.importorskip("orjson")
+
+        assert json_dumps({"id": 2**70}) == b'{"id":1180591620717411303424}'
@@ -6,7 +6,10 @@ Licensed under the MIT License.
 from http import HTTPStatus
 from typing import Any, List
 
+from pydantic import BaseModel
+
 from microsoft.agents.builder import ActivityHandler, TurnContext
+from microsoft.agents.builder.activity_handler import Route
 from microsoft.agents.core.models import (
     InvokeResponse,
     ChannelAccount,
@@ -40,12 +43,170 @@ from microsoft.agents.core.models.teams import (
 from .teams_info import TeamsInfo
 
 
+def _route_with_value(
+    method_name: str, value_cls: type[BaseModel] = None, *, has_body: bool = True
+) -> Route:
+    # Calls the handler method with the turn context and the activity value, validated into
+    # value_cls when it is given.
+    async def route(handler: ActivityHandler, turn_context: TurnContext):
+        value = turn_context.activity.value
+        if value_cls:
+            value = value_cls.model_validate(value)
+        body = await getattr(handler, method_name)(turn_context, value)
+        return body if has_body else None
+
+    return route
+
+
+def _route_with_team(method_name: str, *, with_channel: bool = False) -> Route:
+    # Calls the handler method with the channel and team of the Teams channel data, followed by
+    # the turn context.
+    async def route(handler: ActivityHandler, turn_context: TurnContext):
+        channel_data = TeamsChannelData.model_validate(
+            turn_context.activity.channel_data
+        )
+        if with_channel:
+            return await getattr(handler, method_name)(
+                channel_data.channel, channel_data.team, turn_context
+            )
+        return await getattr(handler, method_name)(channel_data.team, turn_context)
+
+    return route
+
+
+def _route_with_event_value(method_name: str, value_cls: type[BaseModel]) -> Route:
+    # Calls the handler method with the activity value validated into value_cls, followed by
+    # the turn context.
+    async def route(handler: ActivityHandler, turn_context: TurnContext):
+        value = value_cls.model_validate(turn_context.activity.value or {})
+        return await getattr(handler, method_name)(value, turn_context)
+
+    return route
+
+
 class TeamsActivityHandler(ActivityHandler):
     """
     The TeamsActivityHandler is derived from the ActivityHandler class and adds support for
     Microsoft Teams-specific functionality.
+
+    Teams invoke names, conversation update event types and event names are dispatched with
+    tables built once per class, which derived classes can extend with
+    :meth:`register_invoke_route()`, :meth:`register_conversation_update_route()` and
+    :meth:`register_event_route()`.
     """
 
+    _invoke_routes: dict[str, Route] = {
+        **ActivityHandler._invoke_routes,
+        "config/fetch": _route_with_value("on_teams_config_fetch"),
+        "config/submit": _route_with_value("on_teams_config_submit"),
+        "fileConsent/invoke": _route_with_value(
+            "on_teams_file_consent", FileConsentCardResponse
+        ),
+        "actionableMessage/executeAction": _route_with_value(
+            "on_teams_o365_connector_card_action", has_body=False
+        ),
+        "composeExtension/queryLink": _route_with_value(
+            "on_teams_app_based_link_query"
+        ),
+        "composeExtension/anonymousQueryLink": _route_with_value(
+            "on_teams_anonymous_app_based_link_query"
+        ),
+        "composeExtension/query": _route_with_value(
+            "on_teams_messaging_extension_query", MessagingExtensionQuery
+        ),
+        "composeExtension/selectItem": _route_with_value(
+            "on_teams_messaging_extension_select_item"
+        ),
+        "composeExtension/submitAction": _route_with_value(
+            "on_teams_messaging_extension_submit_action_dispatch"
+        ),
+        "composeExtension/fetchTask": _route_with_value(
+            "on_teams_messaging_extension_fetch_task"
+        ),
+        "composeExtension/querySettingUrl": _route_with_value(
+            "on_teams_messaging_extension_configuration_query_setting_url"
+        ),
+        "composeExtension/setting": _route_with_value(
+            "on_teams_messaging_extension_configuration_setting", has_body=False
+        ),
+        "composeExtension/onCardButtonClicked": _route_with_value(
+            "on_teams_messaging_extension_card_button_clicked", has_body=False
+        ),
+        "task/fetch": _route_with_value(
+            "on_teams_task_module_fetch", TaskModuleRequest
+        ),
+        "task/submit": _route_with_value(
+            "on_teams_task_module_submit", TaskModuleRequest
+        ),
+        "tab/fetch": _route_with_value("on_teams_tab_fetch"),
+        "tab/submit": _route_with_value("on_teams_tab_submit"),
+    }
+
+    _conversation_update_routes: dict[str, Route] = {
+        "channelCreated": _route_with_team(
+            "on_teams_channel_created", with_channel=True
+        ),
+        "channelDeleted": _route_with_team(
+            "on_teams_channel_deleted", with_channel=True
+        ),
+        "channelRenamed": _route_with_team(
+            "on_teams_channel_renamed", with_channel=True
+        ),
+        "teamArchived": _route_with_team("on_teams_team_archived"),
+        "teamDeleted": _route_with_team("on_teams_team_deleted"),
+        "teamHardDeleted": _route_with_team("on_teams_team_hard_deleted"),
+        "channelRestored": _route_with_team(
+            "on_teams_channel_restored", with_channel=True
+        ),
+        "teamRenamed": _route_with_team("on_teams_team_renamed"),
+        "teamRestored": _route_with_team("on_teams_team_restored"),
+        "teamUnarchived": _route_with_team("on_teams_team_unarchived"),
+    }
+
+    _event_routes: dict[str, Route] = {
+        "application/vnd.microsoft.readReceipt": _route_with_event_value(
+            "on_teams_read_receipt", ReadReceiptInfo
+        ),
+        "application/vnd.microsoft.meetingStart": _route_with_event_value(
+            "on_teams_meeting_start", MeetingStartEventDetails
+        ),
+        "application/vnd.microsoft.meetingEnd": _route_with_event_value(
+            "on_teams_meeting_end", MeetingEndEventDetails
+        ),
+        "application/vnd.microsoft.meetingParticipantJoin": _route_with_event_value(
+            "on_teams_meeting_participants_join", MeetingParticipantsEventDetails
+        ),
+        "application/vnd.microsoft.meetingParticipantLeave": _route_with_event_value(
+            "on_teams_meeting_participants_leave", MeetingParticipantsEventDetails
+        ),
+    }
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._conversation_update_routes = dict(cls._conversation_update_routes)
+        cls._event_routes = dict(cls._event_routes)
+
+    @classmethod
+    def register_conversation_update_route(cls, event_type: str, route: Route) -> None:
+        """
+        Routes Teams conversation update activities with an event type to a handler method,
+        replacing any existing route.
+
+        :param event_type: The event type of the Teams channel data.
+        :param route: Called with the handler and the turn context.
+        """
+        cls._conversation_update_routes[event_type] = route
+
+    @classmethod
+    def register_event_route(cls, name: str, route: Route) -> None:
+        """
+        Routes Teams event activities with a name to a handler method, replacing any existing route.
+
+        :param name: The event activity name.
+        :param route: Called with the handler and the turn context.
+        """
+        cls._event_routes[name] = route
+
     async def on_invoke_activity(self, turn_context: TurnContext) -> InvokeResponse:
         """
         Handles invoke activities.
@@ -60,100 +221,8 @@ class TeamsActivityHandler(ActivityHandler):
                 and turn_context.activity.channel_id == "msteams"
             ):
                 return await self.on_teams_card_action_invoke(turn_context)
-            else:
-                name = turn_context.activity.name
-                value = turn_context.activity.value
-
-                if name == "config/fetch":
-                    return self._create_invoke_response(
-                        await self.on_teams_config_fetch(turn_context, value)
-                    )
-                elif name == "config/submit":
-                    return self._create_invoke_response(
-                        await self.on_teams_config_submit(turn_context, value)
-                    )
-                elif name == "fileConsent/invoke":
-                    return self._create_invoke_response(
-                        await self.on_teams_file_consent(turn_context, value)
-                    )
-                elif name == "actionableMessage/executeAction":
-                    await self.on_teams_o365_connector_card_action(turn_context, value)
-                    return self._create_invoke_response()
-                elif name == "composeExtension/queryLink":
-                    return self._create_invoke_response(
-                        await self.on_teams_app_based_link_query(turn_context, value)
-                    )
-                elif name == "composeExtension/anonymousQueryLink":
-                    return self._create_invoke_response(
-                        await self.on_teams_anonymous_app_based_link_query(
-                            turn_context, value
-                        )
-                    )
-                elif name == "composeExtension/query":
-                    query = MessagingExtensionQuery.model_validate(value)
-                    return self._create_invoke_response(
-                        await self.on_teams_messaging_extension_query(
-                            turn_context, query
-                        )
-                    )
-                elif name == "composeExtension/selectItem":
-                    return self._create_invoke_response(
-                        await self.on_teams_messaging_extension_select_item(
-                            turn_context, value
-                        )
-                    )
-                elif name == "composeExtension/submitAction":
-                    return self._create_invoke_response(
-                        await self.on_teams_messaging_extension_submit_action_dispatch(
-                            turn_context, value
-                        )
-                    )
-                elif name == "composeExtension/fetchTask":
-                    return self._create_invoke_response(
-                        await self.on_teams_messaging_extension_fetch_task(
-                            turn_context, value
-                        )
-                    )
-                elif name == "composeExtension/querySettingUrl":
-                    return self._create_invoke_response(
-                        await self.on_teams_messaging_extension_configuration_query_setting_url(
-                            turn_context, value
-                        )
-                    )
-                elif name == "composeExtension/setting":
-                    await self.on_teams_messaging_extension_configuration_setting(
-                        turn_context, value
-                    )
-                    return self._create_invoke_response()
-                elif name == "composeExtension/onCardButtonClicked":
-                    await self.on_teams_messaging_extension_card_button_clicked(
-                        turn_context, value
-                    )
-                    return self._create_invoke_response()
-                elif name == "task/fetch":
-                    task_module_request = TaskModuleRequest.model_validate(value)
-                    return self._create_invoke_response(
-                        await self.on_teams_task_module_fetch(
-                            turn_context, task_module_request
-                        )
-                    )
-                elif name == "task/submit":
-                    task_module_request = TaskModuleRequest.model_validate(value)
-                    return self._create_invoke_response(
-                        await self.on_teams_task_module_submit(
-                            turn_context, task_module_request
-                        )
-                    )
-                elif name == "tab/fetch":
-                    return self._create_invoke_response(
-                        await self.on_teams_tab_fetch(turn_context, value)
-                    )
-                elif name == "tab/submit":
-                    return self._create_invoke_response(
-                        await self.on_teams_tab_submit(turn_context, value)
-                    )
-                else:
-                    return await super().on_invoke_activity(turn_context)
+
+            return await super().on_invoke_activity(turn_context)
         except Exception as err:
             if str(err) == "NotImplemented":
                 return InvokeResponse(status=int(HTTPStatus.NOT_IMPLEMENTED))
@@ -517,33 +586,18 @@ class TeamsActivityHandler(ActivityHandler):
                 turn_context.activity.members_removed
                 and len(turn_context.activity.members_removed) > 0
             ):
-                return await self.on_teams_members_removed(turn_context)
+                return await self.on_teams_members_removed_dispatch(
+                    turn_context.activity.members_removed,
+                    channel_data.team if channel_data else None,
+                    turn_context,
+                )
 
             if not channel_data or not channel_data.event_type:
                 return await super().on_conversation_update_activity(turn_context)
 
-            event_type = channel_data.event_type
-
-            if event_type == "channelCreated":
-                return await self.on_teams_channel_created(turn_context)
-            elif event_type == "channelDeleted":
-                return await self.on_teams_channel_deleted(turn_context)
-            elif event_type == "channelRenamed":
-                return await self.on_teams_channel_renamed(turn_context)
-            elif event_type == "teamArchived":
-                return await self.on_teams_team_archived(turn_context)
-            elif event_type == "teamDeleted":
-                return await self.on_teams_team_deleted(turn_context)
-            elif event_type == "teamHardDeleted":
-                return await self.on_teams_team_hard_deleted(turn_context)
-            elif event_type == "channelRestored":
-                return await self.on_teams_channel_restored(turn_context)
-            elif event_type == "teamRenamed":
-                return await self.on_teams_team_renamed(turn_context)
-            elif event_type == "teamRestored":
-                return await self.on_teams_team_restored(turn_context)
-            elif event_type == "teamUnarchived":
-                return await self.on_teams_team_unarchived(turn_context)
+            route = self._conversation_update_routes.get(channel_data.event_type)
+            if route:
+                return await route(self, turn_context)
 
         return await super().on_conversation_update_activity(turn_context)
 
@@ -835,22 +889,9 @@ class TeamsActivityHandler(ActivityHandler):
         :return: None
         """
         if turn_context.activity.channel_id == "msteams":
-            if turn_context.activity.name == "application/vnd.microsoft.readReceipt":
-                return await self.on_teams_read_receipt(turn_context)
-            elif turn_context.activity.name == "application/vnd.microsoft.meetingStart":
-                return await self.on_teams_meeting_start(turn_context)
-            elif turn_context.activity.name == "application/vnd.microsoft.meetingEnd":
-                return await self.on_teams_meeting_end(turn_context)
-            elif (
-                turn_context.activity.name
-                == "application/vnd.microsoft.meetingParticipantJoin"
-            ):
-                return await self.on_teams_meeting_participants_join(turn_context)
-            elif (
-                turn_context.activity.name
-                == "application/vnd.microsoft.meetingParticipantLeave"
-            ):
-                return await self.on_teams_meeting_participants_leave(turn_context)
+            route = self._event_routes.get(turn_context.activity.name)
+            if route:
+                return await route(self, turn_context)
 
         return await super().on_event_activity(turn_context)
 
@@ -0,0 +1,265 @@
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from microsoft.agents.builder import TurnContext
+from microsoft.agents.core.models import Activity, ActivityTypes, ChannelAccount
+from microsoft.agents.core.models.teams import (
+    ChannelInfo,
+    FileConsentCardResponse,
+    MeetingEndEventDetails,
+    MeetingParticipantsEventDetails,
+    MeetingStartEventDetails,
+    MessagingExtensionQuery,
+    ReadReceiptInfo,
+    TaskModuleRequest,
+    TaskModuleResponse,
+    TeamInfo,
+)
+from microsoft.agents.hosting.teams import TeamsActivityHandler
+
+
+def _create_turn_context(**kwargs) -> TurnContext:
+    return TurnContext(
+        Mock(),
+        Activity(
+            channel_id="msteams",
+            from_property=ChannelAccount(id="user"),
+            recipient=ChannelAccount(id="agent"),
+            **kwargs,
+        ),
+    )
+
+
+class TestTeamsActivityHandlerInvokes:
+    @pytest.mark.asyncio
+    async def test_task_fetch_validates_the_task_module_request(self):
+        handler = TeamsActivityHandler()
+        handler.on_teams_task_module_fetch = AsyncMock(
+            return_value=TaskModuleResponse(task={"type": "message"})
+        )
+        turn_context = _create_turn_context(
+            type=ActivityTypes.invoke,
+            name="task/fetch",
+            value={"data": {"id": 1}, "context": {"theme": "dark"}},
+        )
+
+        response = await handler.on_invoke_activity(turn_context)
+
+        assert response.status == 200
+        assert response.body == {"task": {"type": "message"}}
+        request = handler.on_teams_task_module_fetch.await_args.args[1]
+        assert isinstance(request, TaskModuleRequest)
+        assert request.data == {"id": 1} and request.context.theme == "dark"
+
+    @pytest.mark.asyncio
+    async def test_messaging_extension_query_validates_the_query(self):
+        handler = TeamsActivityHandler()
+        handler.on_teams_messaging_extension_query = AsyncMock(return_value=None)
+        turn_context = _create_turn_context(
+            type=ActivityTypes.invoke,
+            name="composeExtension/query",
+            value={"commandId": "search", "parameters": [{"name": "q"}]},
+        )
+
+        response = await handler.on_invoke_activity(turn_context)
+
+        assert response.status == 200
+        query = handler.on_teams_messaging_extension_query.await_args.args[1]
+        assert isinstance(query, MessagingExtensionQuery)
+        assert query.command_id == "search"
+
+    @pytest.mark.asyncio
+    async def test_file_consent_dispatches_on_the_action(self):
+        handler = TeamsActivityHandler()
+        handler.on_teams_file_consent_accept = AsyncMock(return_value=None)
+        turn_context = _create_turn_context(
+            type=ActivityTypes.invoke,
+            name="fileConsent/invoke",
+            value={"action": "accept", "context": {"file": "a"}, "uploadInfo": None},
+        )
+
+        response = await handler.on_invoke_activity(turn_context)
+
+        assert response.status == 200
+        consent = handler.on_teams_file_consent_accept.await_args.args[1]
+        assert isinstance(consent, FileConsentCardResponse)
+        assert consent.context == {"file": "a"}
+
+    @pytest.mark.asyncio
+    async def test_routes_without_body_respond_with_empty_invoke_response(self):
+        handler = TeamsActivityHandler()
+        handler.on_teams_o365_connector_card_action = AsyncMock(return_value="body")
+        turn_context = _create_turn_context(
+            type=ActivityTypes.invoke,
+            name="actionableMessage/executeAction",
+            value={"body": "b"},
+        )
+
+        response = await handler.on_invoke_activity(turn_context)
+
+        assert response.status == 200
+        assert response.body is None
+        handler.on_teams_o365_connector_card_action.assert_awaited_once_with(
+            turn_context, {"body": "b"}
+        )
+
+    @pytest.mark.asyncio
+    async def test_handlers_not_implemented_respond_with_501(self):
+        handler = TeamsActivityHandler()
+        turn_context = _create_turn_context(
+            type=ActivityTypes.invoke, name="tab/fetch", value={}
+        )
+
+        response = await handler.on_invoke_activity(turn_context)
+
+        assert response.status == 501
+
+
+class TestTeamsActivityHandlerConversationUpdates:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "event_type, method_name, with_channel",
+        [
+            ("channelCreated", "on_teams_channel_created", True),
+            ("channelDeleted", "on_teams_channel_deleted", True),
+            ("channelRenamed", "on_teams_channel_renamed", True),
+            ("channelRestored", "on_teams_channel_restored", True),
+            ("teamArchived", "on_teams_team_archived", False),
+            ("teamDeleted", "on_teams_team_deleted", False),
+            ("teamHardDeleted", "on_teams_team_hard_deleted", False),
+            ("teamRenamed", "on_teams_team_renamed", False),
+            ("teamRestored", "on_teams_team_restored", False),
+            ("teamUnarchived", "on_teams_team_unarchived", False),
+        ],
+    )
+    async def test_event_types_route_with_channel_and_team(
+        self, event_type: str, method_name: str, with_channel: bool
+    ):
+        handler = TeamsActivityHandler()
+        setattr(handler, method_name, AsyncMock())
+        turn_context = _create_turn_context(
+            type=ActivityTypes.conversation_update,
+            channel_data={
+                "eventType": event_type,
+                "channel": {"id": "channel", "name": "General"},
+                "team": {"id": "team", "name": "Team"},
+            },
+        )
+
+        await handler.on_turn(turn_context)
+
+        team = TeamInfo(id="team", name="Team")
+        expected = (
+            (ChannelInfo(id="channel", name="General"), team, turn_context)
+            if with_channel
+            else (team, turn_context)
+        )
+        getattr(handler, method_name).assert_awaited_once_with(*expected)
+
+    @pytest.mark.asyncio
+    async def test_members_removed_are_dispatched_with_team(self):
+        handler = TeamsActivityHandler()
+        handler.on_teams_members_removed = AsyncMock()
+        turn_context = _create_turn_context(
+            type=ActivityTypes.conversation_update,
+            members_removed=[ChannelAccount(id="member")],
+            channel_data={"team": {"id": "team"}},
+        )
+
+        await handler.on_turn(turn_context)
+
+        members, team, context = handler.on_teams_members_removed.await_args.args
+        assert [member.id for member in members] == ["member"]
+        assert team == TeamInfo(id="team") and context is turn_context
+
+
+class TestTeamsActivityHandlerEvents:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "name, method_name, value, expected",
+        [
+            (
+                "application/vnd.microsoft.meetingStart",
+                "on_teams_meeting_start",
+                {"startTime": "2025-01-01T10:00:00Z"},
+                MeetingStartEventDetails(start_time="2025-01-01T10:00:00Z"),
+            ),
+            (
+                "application/vnd.microsoft.meetingEnd",
+                "on_teams_meeting_end",
+                {"endTime": "2025-01-01T11:00:00Z"},
+                MeetingEndEventDetails(end_time="2025-01-01T11:00:00Z"),
+            ),
+            (
+                "application/vnd.microsoft.readReceipt",
+                "on_teams_read_receipt",
+                {"lastReadMessageId": "m1"},
+                ReadReceiptInfo(last_read_message_id="m1"),
+            ),
+            (
+                "application/vnd.microsoft.meetingParticipantJoin",
+                "on_teams_meeting_participants_join",
+                {"members": []},
+                MeetingParticipantsEventDetails(members=[]),
+            ),
+        ],
+    )
+    async def test_events_route_with_their_details(
+        self, name: str, method_name: str, value: dict, expected
+    ):
+        handler = TeamsActivityHandler()
+        setattr(handler, method_name, AsyncMock())
+        turn_context = _create_turn_context(
+            type=ActivityTypes.event, name=name, value=value
+        )
+
+        await handler.on_turn(turn_context)
+
+        getattr(handler, method_name).assert_awaited_once_with(expected, turn_context)
+
+
+class TestTeamsActivityHandlerSubclasses:
+    @pytest.mark.asyncio
+    async def test_overrides_and_registered_routes_apply_to_subclasses_only(self):
+        calls = []
+
+        class MeetingHandler(TeamsActivityHandler):
+            async def on_teams_meeting_start(self, meeting, turn_context):
+                calls.append(("start", meeting.start_time))
+
+            async def on_custom_event(self, turn_context):
+                calls.append(("custom", turn_context.activity.value))
+
+            async def on_teams_task_module_submit(self, turn_context, request):
+                return TaskModuleResponse(task={"type": request.data})
+
+        MeetingHandler.register_event_route(
+            "application/vnd.test.custom",
+            lambda handler, turn_context: handler.on_custom_event(turn_context),
+        )
+
+        handler = MeetingHandler()
+        await handler.on_turn(
+            _create_turn_context(
+                type=ActivityTypes.event,
+                name="application/vnd.microsoft.meetingStart",
+                value={"startTime": "now"},
+            )
+        )
+        await handler.on_turn(
+            _create_turn_context(
+                type=ActivityTypes.event, name="application/vnd.test.custom", value=1
+            )
+        )
+        response = await handler.on_invoke_activity(
+            _create_turn_context(
+                type=ActivityTypes.invoke,
+                name="task/submit",
+                value={"data": "d", "context": None},
+            )
+        )
+
+        assert calls == [("start", "now"), ("custom", 1)]
+        assert response.body == {"task": {"type": "d"}}
+        assert "application/vnd.test.custom" not in TeamsActivityHandler._event_routes
+        assert "application/vnd.test.custom" in MeetingHandler._event_routes
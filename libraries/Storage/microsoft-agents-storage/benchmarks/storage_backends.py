@@ -0,0 +1,81 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+Benchmark of SqliteStorage against MemoryStorage, with and without a serializer, for typical
+AgentState payload sizes.
+
+Each turn reads a conversation and a user state item with one multi-key read, then writes
+both back with one conditional write, as AgentStateSet does.
+
+Run with: python benchmarks/storage_backends.py
+"""
+
+import asyncio
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from microsoft.agents.storage import (
+    JsonSerializer,
+    MemoryStorage,
+    SqliteStorage,
+    StoreItem,
+    VersionedSerializer,
+)
+
+SIZES = [1024, 4 * 1024, 16 * 1024, 64 * 1024]
+TURNS = 500
+KEYS = ["test/conversations/conversation", "test/users/user"]
+
+
+class StateItem(StoreItem):
+    def __init__(self, state: dict):
+        self.state = state
+
+    def store_item_to_json(self) -> dict:
+        return self.state
+
+    @staticmethod
+    def from_json_to_store_item(json_data: dict) -> "StoreItem":
+        return StateItem(json_data)
+
+
+def create_state(size: int) -> dict:
+    return {
+        "profile": {"name": "user", "locale": "en-us"},
+        "history": [f"message {index:08}" for index in range(size // 24)],
+    }
+
+
+async def run_turns(storage, size: int) -> float:
+    await storage.write({key: StateItem(create_state(size)) for key in KEYS})
+    start = perf_counter()
+    for turn in range(TURNS):
+        items = await storage.read(KEYS, target_cls=StateItem)
+        for item in items.values():
+            item.state["profile"]["turn"] = turn
+        await storage.write(items)
+
+    return (perf_counter() - start) / TURNS * 1_000_000
+
+
+async def main():
+    print(f"{'size':>8}{'MemoryStorage':>18}{'serialized':>18}{'SqliteStorage':>18}")
+    for size in SIZES:
+        memory = await run_turns(MemoryStorage(), size)
+        serialized = await run_turns(
+            MemoryStorage(serializer=VersionedSerializer(JsonSerializer())), size
+        )
+        with TemporaryDirectory() as directory:
+            sqlite_storage = SqliteStorage(f"{directory}/state.db")
+            sqlite = await run_turns(sqlite_storage, size)
+            await sqlite_storage.close()
+
+        print(
+            f"{size // 1024:>5} KB{memory:>12.1f} us/turn{serialized:>12.1f} us/turn"
+            f"{sqlite:>12.1f} us/turn"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,5 +1,30 @@
 from .store_item import StoreItem
 from .storage import Storage
-from .memory_storage import MemoryStorage
+from .memory_storage import AsyncMemoryStorage, MemoryStorage
+from .sharded_memory_storage import ShardedMemoryStorage
+from .file_storage import FileStorage
+from .sqlite_storage import SqliteStorage
+from .caching_storage import CachingStorage
+from .serializer import (
+    JsonSerializer,
+    MsgPackSerializer,
+    Serializer,
+    VersionedSerializer,
+)
+from .etag_conflict_error import ETagConflictError
 
-__all__ = ["StoreItem", "Storage", "MemoryStorage"]
+__all__ = [
+    "StoreItem",
+    "Storage",
+    "MemoryStorage",
+    "AsyncMemoryStorage",
+    "ShardedMemoryStorage",
+    "FileStorage",
+    "SqliteStorage",
+    "CachingStorage",
+    "Serializer",
+    "JsonSerializer",
+    "MsgPackSerializer",
+    "VersionedSerializer",
+    "ETagConflictError",
+]
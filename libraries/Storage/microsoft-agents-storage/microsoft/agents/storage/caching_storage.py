@@ -0,0 +1,229 @@
+from asyncio import Task, current_task, get_running_loop, shield
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, NamedTuple, Optional, TypeVar
+
+from .etag_conflict_error import ETagConflictError
+from .memory_storage import _from_snapshot, _to_snapshot
+from .serializer import Serializer
+from .storage import Storage
+from .store_item import StoreItem
+
+StoreItemT = TypeVar("StoreItemT", bound=StoreItem)
+
+# Marks keys known not to be stored.
+_MISSING = object()
+
+
+class _Entry(NamedTuple):
+    value: Any
+    e_tag: Optional[str]
+    expires_at: float
+    # False when the e_tag of the stored item is unknown, such entries are not served to typed
+    # reads, whose writes would otherwise be unconditional.
+    has_e_tag: bool = True
+
+
+class _Fetch(NamedTuple):
+    task: Task
+    has_e_tag: bool
+
+
+class CachingStorage(Storage):
+    """
+    Serves reads of another storage from a bounded in-process cache.
+
+    Writes go through to the backing storage and then update the cache, deletes invalidate it.
+    Keys found missing are cached as well, for a shorter time. Concurrent reads missing the
+    cache for the same key share a single read of the backing storage.
+
+    Reads without target_cls do not learn the e_tag of the stored items, so the items they
+    cache are read again by the first read with a target_cls.
+
+    Must be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        storage: Storage,
+        *,
+        max_entries: int = 1024,
+        ttl: float = 60.0,
+        negative_ttl: float = 10.0,
+        serializer: Optional[Serializer] = None,
+    ):
+        """
+        :param storage: The backing storage.
+        :param max_entries: Maximum number of keys cached, least recently used ones are evicted first.
+        :param ttl: Seconds a stored item is served from the cache, bounding how stale it can
+        be when other processes write to the backing storage.
+        :param negative_ttl: Seconds a missing key is served from the cache.
+        :param serializer: Caches items serialized instead of as copies of their JSON, which
+        is cheaper for large JSON-compatible items.
+        """
+        if not storage:
+            raise ValueError("CachingStorage.__init__(): storage cannot be None")
+        if max_entries <= 0:
+            raise ValueError("CachingStorage: max_entries must be greater than 0")
+
+        self.storage = storage
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._serializer = serializer
+        self.hits = 0
+        self.misses = 0
+        # Reads of keys that missed the cache, served by a backing read already in flight.
+        self.coalesced_reads = 0
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._fetches: dict[str, _Fetch] = {}
+        # Keys written while a read of them was in flight, whose result is stale.
+        self._stale_fetch_keys: set[str] = set()
+
+    async def read(
+        self, keys: list[str], *, target_cls: StoreItemT = None, **kwargs
+    ) -> dict[str, StoreItemT]:
+        now = monotonic()
+        needs_e_tag = target_cls is not None
+        entries: dict[str, _Entry] = {}
+        fetches: dict[str, Task] = {}
+        to_fetch: list[str] = []
+        for key in dict.fromkeys(keys):
+            entry = self._get_entry(key, now)
+            if entry is not None and (entry.has_e_tag or not needs_e_tag):
+                self.hits += 1
+                entries[key] = entry
+                continue
+
+            fetch = self._fetches.get(key)
+            if fetch is not None and (fetch.has_e_tag or not needs_e_tag):
+                self.coalesced_reads += 1
+                fetches[key] = fetch.task
+            else:
+                self.misses += 1
+                to_fetch.append(key)
+
+        if to_fetch:
+            task = get_running_loop().create_task(
+                self._fetch(to_fetch, target_cls, kwargs)
+            )
+            for key in to_fetch:
+                self._fetches[key] = _Fetch(task, needs_e_tag)
+                fetches[key] = task
+            task.add_done_callback(lambda done: self._on_fetched(to_fetch, done))
+
+        for key, task in fetches.items():
+            # Shielded, so that a cancelled reader does not cancel the read others wait for.
+            entries[key] = (await shield(task))[key]
+
+        return {
+            key: _from_snapshot(
+                entry.value, entry.e_tag, target_cls, self, self._serializer
+            )
+            for key, entry in entries.items()
+            if entry.value is not _MISSING
+        }
+
+    async def write(self, changes: dict[str, StoreItem], **kwargs) -> None:
+        if not changes:
+            raise ValueError("CachingStorage.write(): changes cannot be None")
+
+        snapshots = {
+            key: _to_snapshot(item, self._serializer) for key, item in changes.items()
+        }
+        self._invalidate(changes)
+        try:
+            await self.storage.write(changes, **kwargs)
+        except ETagConflictError:
+            # The cached item is older than the stored one.
+            self._invalidate(changes)
+            raise
+
+        # Reads started before the write completed may have fetched the previous items.
+        self._invalidate(changes)
+        expires_at = monotonic() + self.ttl
+        for key, item in changes.items():
+            e_tag = getattr(item, "e_tag", None)
+            self._set_entry(
+                key, _Entry(snapshots[key], e_tag, expires_at, e_tag is not None)
+            )
+
+    async def delete(self, keys: list[str]) -> None:
+        self._invalidate(keys)
+        await self.storage.delete(keys)
+        self._invalidate(keys)
+
+    def clear(self) -> None:
+        """
+        Removes all cached keys and resets the counters.
+        """
+        self._invalidate(list(self._entries) + list(self._fetches))
+        self.hits = 0
+        self.misses = 0
+        self.coalesced_reads = 0
+
+    async def _fetch(
+        self, keys: list[str], target_cls: Optional[type], kwargs: dict
+    ) -> dict[str, _Entry]:
+        task = current_task()
+        items = await self.storage.read(keys, target_cls=target_cls, **kwargs)
+        now = monotonic()
+        entries = {}
+        for key in keys:
+            if key in items:
+                item = items[key]
+                # The fetched item is not handed out, readers get copies of its JSON.
+                value = item.store_item_to_json() if target_cls else item
+                entries[key] = _Entry(
+                    self._serializer.serialize(value) if self._serializer else value,
+                    getattr(item, "e_tag", None) if target_cls else None,
+                    now + self.ttl,
+                    target_cls is not None,
+                )
+            else:
+                entries[key] = _Entry(_MISSING, None, now + self.negative_ttl)
+
+            # A read with a target_cls may have taken over the key while this one was in flight.
+            fetch = self._fetches.get(key)
+            if (
+                fetch is not None
+                and fetch.task is task
+                and key not in self._stale_fetch_keys
+            ):
+                self._set_entry(key, entries[key])
+
+        return entries
+
+    def _on_fetched(self, keys: list[str], done: Task) -> None:
+        for key in keys:
+            fetch = self._fetches.get(key)
+            if fetch is not None and fetch.task is done:
+                del self._fetches[key]
+                self._stale_fetch_keys.discard(key)
+        if not done.cancelled():
+            # Marks the error as retrieved, the readers awaiting the read raise it.
+            done.exception()
+
+    def _get_entry(self, key: str, now: float) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry.expires_at <= now:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    def _set_entry(self, key: str, entry: _Entry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _invalidate(self, keys) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+            if key in self._fetches:
+                self._stale_fetch_keys.add(key)
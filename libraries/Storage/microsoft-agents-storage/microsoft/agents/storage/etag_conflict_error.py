@@ -0,0 +1,20 @@
+from typing import Optional
+
+
+class ETagConflictError(ValueError):
+    """
+    Raised when a conditional write finds that the stored item has changed since it was read.
+    """
+
+    def __init__(self, key: str, expected: str, actual: Optional[str]):
+        """
+        :param key: The key of the conflicting item.
+        :param expected: The e_tag the write was conditioned on.
+        :param actual: The e_tag of the stored item, None if it was deleted.
+        """
+        super().__init__(
+            f"ETag conflict on '{key}': expected '{expected}' but found '{actual}'"
+        )
+        self.key = key
+        self.expected = expected
+        self.actual = actual
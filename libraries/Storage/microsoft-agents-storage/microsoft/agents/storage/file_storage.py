@@ -0,0 +1,258 @@
+import os
+from asyncio import get_running_loop
+from itertools import count
+from json import dumps, loads
+from threading import Lock
+from typing import NamedTuple, Optional, TypeVar
+
+from ._type_aliases import JSON
+from .memory_storage import _check_e_tag, _deserialize, _set_e_tag
+from .storage import Storage
+from .store_item import StoreItem
+
+StoreItemT = TypeVar("StoreItemT", bound=StoreItem)
+
+
+class _IndexEntry(NamedTuple):
+    offset: int
+    length: int
+    e_tag: str
+
+
+class FileStorage(Storage):
+    """
+    Stores items durably in a local directory.
+
+    Writes and deletes are appended to a log file, one JSON record per line, and flushed to
+    disk with a single fsync per call. An in-memory index maps every key to its latest record,
+    so reads are a single positioned read. Once enough of the log is made of overwritten or
+    deleted records, it is compacted into a new log holding only the live ones.
+
+    Requires a POSIX system, items must serialize to JSON.
+    """
+
+    LOG_FILE_NAME = "storage.log"
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        fsync: bool = True,
+        compaction_threshold: float = 0.5,
+        min_compaction_size: int = 1024 * 1024,
+    ):
+        """
+        :param directory: The directory holding the log, created if it does not exist.
+        :param fsync: False to leave flushing writes to disk to the operating system.
+        :param compaction_threshold: Fraction of the log made of stale records above which
+        it is compacted.
+        :param min_compaction_size: Size in bytes of stale records below which the log is
+        never compacted.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._path = os.path.join(directory, self.LOG_FILE_NAME)
+        self.fsync = fsync
+        self.compaction_threshold = compaction_threshold
+        self.min_compaction_size = min_compaction_size
+
+        # Writers are serialized by the write lock, which is held while syncing to disk.
+        # Readers only take the index lock, which is never held across disk syncs.
+        self._write_lock = Lock()
+        self._index_lock = Lock()
+        self._index: dict[str, _IndexEntry] = {}
+        self._size = 0
+        self._live_size = 0
+        self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o600)
+        self._e_tag_counter = count(self._load() + 1)
+
+    @property
+    def log_size(self) -> int:
+        """
+        The size of the log in bytes, including stale records.
+        """
+        return self._size
+
+    async def read(
+        self, keys: list[str], *, target_cls: StoreItemT = None, **kwargs
+    ) -> dict[str, StoreItemT]:
+        records = {}
+        with self._index_lock:
+            for key in keys:
+                entry = self._index.get(key)
+                if entry is not None:
+                    records[key] = (
+                        os.pread(self._fd, entry.length, entry.offset),
+                        entry,
+                    )
+
+        return {
+            key: _deserialize(loads(record)[2], entry.e_tag, target_cls, self)
+            for key, (record, entry) in records.items()
+        }
+
+    async def write(self, changes: dict[str, StoreItem]):
+        if not changes:
+            raise ValueError("FileStorage.write(): changes cannot be None")
+
+        records = {}
+        for key, item in changes.items():
+            e_tag = str(next(self._e_tag_counter))
+            records[key] = (
+                e_tag,
+                (dumps([key, e_tag, item.store_item_to_json()]) + "\n").encode(),
+            )
+
+        await get_running_loop().run_in_executor(None, self._append, changes, records)
+
+    async def delete(self, keys: list[str]):
+        await get_running_loop().run_in_executor(None, self._remove, keys)
+
+    async def compact(self) -> None:
+        """
+        Rewrites the log with only the latest record of every stored key.
+        """
+        await get_running_loop().run_in_executor(None, self._compact_locked)
+
+    async def close(self) -> None:
+        """
+        Closes the log file, once the write in progress if any has completed.
+        """
+        await get_running_loop().run_in_executor(None, self._close)
+
+    def _compact_locked(self) -> None:
+        with self._write_lock:
+            self._compact()
+
+    def _close(self) -> None:
+        with self._write_lock, self._index_lock:
+            if self._fd >= 0:
+                os.close(self._fd)
+                self._fd = -1
+
+    def _append(self, changes: dict[str, StoreItem], records: dict) -> None:
+        with self._write_lock:
+            # Conditions are checked for every item first, so that a batch is written entirely or not at all.
+            for key, item in changes.items():
+                entry = self._index.get(key)
+                _check_e_tag(key, item, entry.e_tag if entry else None)
+
+            offset = self._size
+            entries = {}
+            for key, (e_tag, record) in records.items():
+                entries[key] = _IndexEntry(offset, len(record), e_tag)
+                offset += len(record)
+
+            self._write(b"".join(record for _, record in records.values()))
+            self._update_index(entries, [])
+            for key, item in changes.items():
+                _set_e_tag(item, entries[key].e_tag)
+
+            self._compact_if_needed()
+
+    def _remove(self, keys: list[str]) -> None:
+        with self._write_lock:
+            keys = [key for key in keys if key in self._index]
+            if not keys:
+                return
+
+            self._write(b"".join((dumps([key]) + "\n").encode() for key in keys))
+            self._update_index({}, keys)
+            self._compact_if_needed()
+
+    def _write(self, data: bytes) -> None:
+        view = memoryview(data)
+        try:
+            while view:
+                view = view[os.write(self._fd, view) :]
+            if self.fsync:
+                os.fsync(self._fd)
+        except OSError:
+            # Drops what was written of the failed call, so that the offsets of later records
+            # still match the index.
+            try:
+                os.ftruncate(self._fd, self._size)
+            except OSError:
+                self._size = os.fstat(self._fd).st_size
+            raise
+        self._size += len(data)
+
+    def _update_index(self, entries: dict[str, _IndexEntry], deleted_keys: list[str]):
+        with self._index_lock:
+            for key in deleted_keys:
+                self._live_size -= self._index.pop(key).length
+            for key, entry in entries.items():
+                previous = self._index.get(key)
+                self._live_size += entry.length - (previous.length if previous else 0)
+                self._index[key] = entry
+
+    def _compact_if_needed(self) -> None:
+        stale_size = self._size - self._live_size
+        if (
+            stale_size >= self.min_compaction_size
+            and stale_size >= self._size * self.compaction_threshold
+        ):
+            self._compact()
+
+    def _compact(self) -> None:
+        compacted_path = self._path + ".compact"
+        index: dict[str, _IndexEntry] = {}
+        offset = 0
+        with open(compacted_path, "wb") as compacted:
+            for key, entry in self._index.items():
+                compacted.write(os.pread(self._fd, entry.length, entry.offset))
+                index[key] = entry._replace(offset=offset)
+                offset += entry.length
+            compacted.flush()
+            os.fsync(compacted.fileno())
+
+        os.replace(compacted_path, self._path)
+        self._sync_directory()
+        fd = os.open(self._path, os.O_RDWR | os.O_APPEND)
+        with self._index_lock:
+            os.close(self._fd)
+            self._fd = fd
+            self._index = index
+            self._size = self._live_size = offset
+
+    def _load(self) -> int:
+        """
+        Rebuilds the index from the log, dropping a trailing record left incomplete by a crash.
+
+        :return: The highest e_tag found.
+        """
+        last_e_tag = 0
+        offset = 0
+        with open(self._path, "rb") as log:
+            for record in log:
+                try:
+                    if not record.endswith(b"\n"):
+                        raise ValueError("incomplete record")
+                    fields = loads(record)
+                except ValueError:
+                    break
+
+                if len(fields) == 1:
+                    deleted = self._index.pop(fields[0], None)
+                    self._live_size -= deleted.length if deleted else 0
+                else:
+                    key, e_tag = fields[0], fields[1]
+                    previous = self._index.get(key)
+                    self._live_size += len(record) - (
+                        previous.length if previous else 0
+                    )
+                    self._index[key] = _IndexEntry(offset, len(record), e_tag)
+                    last_e_tag = max(last_e_tag, int(e_tag))
+                offset += len(record)
+
+        if offset < os.path.getsize(self._path):
+            os.truncate(self._path, offset)
+        self._size = offset
+        return last_e_tag
+
+    def _sync_directory(self) -> None:
+        fd = os.open(self._directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
@@ -1,49 +1,308 @@
-from threading import Lock
-from typing import TypeVar
+from asyncio import get_running_loop
+from collections import OrderedDict
+from contextlib import nullcontext
+from copy import deepcopy
+from heapq import heapify, heappop, heappush
+from itertools import count
+from json import dumps
+from threading import Lock, Thread
+from time import monotonic, sleep
+from typing import Optional, TypeVar, Union
+from weakref import ref
 
 from ._type_aliases import JSON
+from .etag_conflict_error import ETagConflictError
+from .serializer import Serializer
 from .storage import Storage
 from .store_item import StoreItem
 
-
 StoreItemT = TypeVar("StoreItemT", bound=StoreItem)
 
 
 class MemoryStorage(Storage):
-    def __init__(self, state: dict[str, JSON] = None):
-        self._memory: dict[str, JSON] = state or {}
+    """
+    Stores items in memory.
+
+    Items can optionally expire after a time to live, and the least recently used items can be
+    evicted to stay within a maximum number of entries or an approximate size in bytes.
+    Expired items are swept in the background.
+    """
+
+    def __init__(
+        self,
+        state: dict[str, JSON] = None,
+        *,
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        sweep_interval: float = 60.0,
+        serializer: Optional[Serializer] = None,
+    ):
+        """
+        :param state: The initial items.
+        :param ttl: Seconds after their last write at which items expire, None to keep them.
+        :param max_entries: Maximum number of items kept, None for no limit.
+        :param max_bytes: Approximate maximum size in bytes of the items kept, as JSON or
+        serialized, None for no limit.
+        :param sweep_interval: Seconds between two background sweeps of expired items.
+        :param serializer: Keeps items serialized instead of as copies of their JSON, which
+        is cheaper for large JSON-compatible items.
+        """
+        self._serializer = serializer
+        self._memory: OrderedDict[str, JSON] = OrderedDict(
+            (key, serializer.serialize(value) if serializer else value)
+            for key, value in (state or {}).items()
+        )
+        self._e_tag_counter = count(1)
+        self._e_tags: dict[str, str] = {key: self._next_e_tag() for key in self._memory}
         self._lock = Lock()
 
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
+        self._expires_at: dict[str, float] = {}
+        # Deadlines to sweep, including outdated ones of items rewritten or removed since, which
+        # are dropped when they outnumber the current ones.
+        self._expirations: list[tuple[float, str]] = []
+        self._sizes: dict[str, int] = {}
+        self._is_sweeping = False
+
+        self.size_in_bytes = 0
+        self.evictions = 0
+        self.expirations = 0
+        if max_bytes is not None:
+            for key, value in self._memory.items():
+                self._sizes[key] = _estimate_size(value)
+                self.size_in_bytes += self._sizes[key]
+
+    @property
+    def entry_count(self) -> int:
+        """
+        The number of items kept, including expired ones not swept yet.
+        """
+        return len(self._memory)
+
     async def read(
         self, keys: list[str], *, target_cls: StoreItemT = None, **kwargs
     ) -> dict[str, StoreItemT]:
-        result: dict[str, StoreItem] = {}
+        now = monotonic()
         with self._lock:
+            entries = {}
             for key in keys:
-                if key in self._memory:
-                    if not target_cls:
-                        result[key] = self._memory[key]
-                    else:
-                        try:
-                            result[key] = target_cls.from_json_to_store_item(
-                                self._memory[key]
-                            )
-                        except AttributeError as error:
-                            raise TypeError(
-                                f"MemoryStorage.read(): could not deserialize in-memory item into {target_cls} class. Error: {error}"
-                            )
-            return result
-
-    async def write(self, changes: dict[str, StoreItem]):
+                if key in self._memory and not self._remove_if_expired(key, now):
+                    entries[key] = (self._memory[key], self._e_tags[key])
+                    self._memory.move_to_end(key)
+
+        # Stored values are never changed in place, so they are copied and deserialized outside the lock.
+        return {
+            key: _from_snapshot(value, e_tag, target_cls, self, self._serializer)
+            for key, (value, e_tag) in entries.items()
+        }
+
+    async def write(
+        self, changes: dict[str, StoreItem], *, ttl: Optional[float] = None
+    ):
+        """
+        Writes the items, see :meth:`Storage.write`.
+
+        :param ttl: Seconds after which these items expire, overriding the storage's ttl.
+        """
         if not changes:
-            raise ValueError("MemoryStorage.write(): changes cannot be None")
+            raise ValueError(f"{type(self).__name__}.write(): changes cannot be None")
 
+        ttl = ttl if ttl is not None else self.ttl
+        snapshots = {
+            key: _to_snapshot(item, self._serializer) for key, item in changes.items()
+        }
+        sizes = (
+            {key: _estimate_size(snapshot) for key, snapshot in snapshots.items()}
+            if self.max_bytes is not None
+            else {}
+        )
+        now = monotonic()
         with self._lock:
-            for key in changes:
-                self._memory[key] = changes[key].store_item_to_json()
+            # Conditions are checked for every item first, so that a batch is written entirely or not at all.
+            for key, item in changes.items():
+                self._remove_if_expired(key, now)
+                _check_e_tag(key, item, self._e_tags.get(key))
+
+            for key, item in changes.items():
+                self._memory[key] = snapshots[key]
+                self._memory.move_to_end(key)
+                self._e_tags[key] = self._next_e_tag()
+                _set_e_tag(item, self._e_tags[key])
+
+                if key in sizes:
+                    self.size_in_bytes += sizes[key] - self._sizes.get(key, 0)
+                    self._sizes[key] = sizes[key]
+
+                if ttl is not None:
+                    self._expires_at[key] = now + ttl
+                    heappush(self._expirations, (now + ttl, key))
+                else:
+                    self._expires_at.pop(key, None)
+
+            self._evict(changes)
+            if len(self._expirations) > 2 * len(self._expires_at) + 16:
+                self._expirations = [
+                    (expires_at, key) for key, expires_at in self._expires_at.items()
+                ]
+                heapify(self._expirations)
+
+        if ttl is not None and not self._is_sweeping:
+            self._is_sweeping = True
+            self._start_sweeping()
 
     async def delete(self, keys: list[str]):
         with self._lock:
             for key in keys:
                 if key in self._memory:
-                    del self._memory[key]
+                    self._remove(key)
+
+    def sweep(self) -> int:
+        """
+        Removes the expired items.
+
+        :return: The number of items removed.
+        """
+        now = monotonic()
+        swept = 0
+        with self._lock:
+            while self._expirations and self._expirations[0][0] <= now:
+                _, key = heappop(self._expirations)
+                if self._remove_if_expired(key, now):
+                    swept += 1
+
+        return swept
+
+    def _start_sweeping(self) -> None:
+        Thread(
+            target=_sweep_periodically,
+            args=(ref(self), self.sweep_interval),
+            name="MemoryStorage.sweep",
+            daemon=True,
+        ).start()
+
+    def _remove_if_expired(self, key: str, now: float) -> bool:
+        expires_at = self._expires_at.get(key)
+        if expires_at is None or expires_at > now:
+            return False
+
+        self._remove(key)
+        self.expirations += 1
+        return True
+
+    def _evict(self, protected_keys) -> None:
+        # The least recently used items are evicted first, never the ones just written.
+        while (
+            self.max_entries is not None and len(self._memory) > self.max_entries
+        ) or (self.max_bytes is not None and self.size_in_bytes > self.max_bytes):
+            key = next(iter(self._memory))
+            if key in protected_keys:
+                return
+
+            self._remove(key)
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        del self._memory[key]
+        del self._e_tags[key]
+        self._expires_at.pop(key, None)
+        self.size_in_bytes -= self._sizes.pop(key, 0)
+
+    def _next_e_tag(self) -> str:
+        return str(next(self._e_tag_counter))
+
+
+class AsyncMemoryStorage(MemoryStorage):
+    """
+    A MemoryStorage for use from a single event loop, which takes no thread locks.
+
+    Its operations do not await while they access the memory, so the event loop already
+    runs them one at a time, and expired items are swept from the event loop.
+    """
+
+    def __init__(self, state: dict[str, JSON] = None, **kwargs):
+        super().__init__(state, **kwargs)
+        self._lock = nullcontext()
+
+    def _start_sweeping(self) -> None:
+        get_running_loop().call_later(
+            self.sweep_interval, _sweep_on_loop, ref(self), self.sweep_interval
+        )
+
+
+def _sweep_periodically(storage_ref: "ref[MemoryStorage]", interval: float) -> None:
+    # Only a weak reference is held, so that the thread ends once the storage is collected.
+    while True:
+        sleep(interval)
+        storage = storage_ref()
+        if storage is None:
+            return
+        storage.sweep()
+        del storage
+
+
+def _sweep_on_loop(storage_ref: "ref[MemoryStorage]", interval: float) -> None:
+    storage = storage_ref()
+    if storage is not None:
+        storage.sweep()
+        get_running_loop().call_later(interval, _sweep_on_loop, storage_ref, interval)
+
+
+def _estimate_size(value: Union[JSON, bytes]) -> int:
+    if isinstance(value, bytes):
+        return len(value)
+
+    return len(dumps(value, default=str))
+
+
+def _to_snapshot(
+    item: StoreItem, serializer: Optional[Serializer] = None
+) -> Union[JSON, bytes]:
+    # Items are copied so that later changes to them are only stored by a write.
+    value = item.store_item_to_json()
+    return serializer.serialize(value) if serializer else deepcopy(value)
+
+
+def _from_snapshot(
+    value: Union[JSON, bytes],
+    e_tag: str,
+    target_cls: Optional[type],
+    storage: Storage,
+    serializer: Optional[Serializer] = None,
+) -> StoreItem:
+    value = serializer.deserialize(value) if serializer else deepcopy(value)
+    return _deserialize(value, e_tag, target_cls, storage)
+
+
+def _deserialize(
+    value: JSON, e_tag: str, target_cls: Optional[type], storage: Storage
+) -> StoreItem:
+    if not target_cls:
+        return value
+
+    try:
+        item = target_cls.from_json_to_store_item(value)
+        _set_e_tag(item, e_tag)
+        return item
+    except AttributeError as error:
+        raise TypeError(
+            f"{type(storage).__name__}.read(): could not deserialize stored item into {target_cls} class. Error: {error}"
+        )
+
+
+def _check_e_tag(key: str, item: StoreItem, current_e_tag: Optional[str]) -> None:
+    e_tag = getattr(item, "e_tag", None)
+    if e_tag not in (None, "*") and e_tag != (current_e_tag or ""):
+        raise ETagConflictError(key, e_tag, current_e_tag)
+
+
+def _set_e_tag(item: StoreItem, e_tag: str) -> None:
+    # Items that cannot hold an e_tag, such as pydantic models without an e_tag field,
+    # are simply written unconditionally.
+    try:
+        item.e_tag = e_tag
+    except (AttributeError, ValueError):
+        pass
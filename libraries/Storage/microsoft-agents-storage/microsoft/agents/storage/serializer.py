@@ -0,0 +1,154 @@
+import json
+import zlib
+from abc import abstractmethod
+from typing import Optional, Protocol
+
+from ._type_aliases import JSON
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class Serializer(Protocol):
+    """
+    Converts the JSON of store items to bytes and back.
+    """
+
+    @abstractmethod
+    def serialize(self, value: JSON) -> bytes:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def deserialize(self, data: bytes) -> JSON:
+        raise NotImplementedError()
+
+
+class JsonSerializer(Serializer):
+    """
+    Encodes values as compact UTF-8 JSON, with orjson when it is installed.
+    """
+
+    CODEC_ID = 1
+
+    def serialize(self, value: JSON) -> bytes:
+        if orjson is not None:
+            try:
+                return orjson.dumps(value)
+            except TypeError:
+                # Values orjson does not support, such as integers above 64 bits.
+                pass
+
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def deserialize(self, data: bytes) -> JSON:
+        if orjson is not None:
+            return orjson.loads(data)
+
+        return json.loads(data)
+
+
+class MsgPackSerializer(Serializer):
+    """
+    Encodes values as MessagePack, requires the msgpack package.
+    """
+
+    CODEC_ID = 2
+
+    def __init__(self):
+        if msgpack is None:
+            raise ImportError("MsgPackSerializer requires the msgpack package")
+
+    def serialize(self, value: JSON) -> bytes:
+        return msgpack.packb(value, use_bin_type=True)
+
+    def deserialize(self, data: bytes) -> JSON:
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+class VersionedSerializer(Serializer):
+    """
+    Encodes values with a codec, compresses large payloads, and prefixes them with a header
+    naming the format version, codec and compression.
+
+    Data written with any known codec or compression setting stays readable, and bytes without
+    the header are read as plain JSON.
+    """
+
+    MAGIC = b"\xa7S"
+    VERSION = 1
+    _COMPRESSED = 0x01
+
+    def __init__(
+        self,
+        codec: Optional[Serializer] = None,
+        *,
+        compression_threshold: Optional[int] = 4096,
+        compression_level: int = 6,
+    ):
+        """
+        :param codec: The codec encoding values, defaults to MessagePack when msgpack is
+        installed and to JSON otherwise.
+        :param compression_threshold: Size in bytes of encoded values above which they are
+        compressed with zlib, None to never compress.
+        :param compression_level: The zlib compression level.
+        """
+        if codec is None:
+            codec = MsgPackSerializer() if msgpack is not None else JsonSerializer()
+        if not 0 < getattr(codec, "CODEC_ID", 0) < 256:
+            raise ValueError(
+                "VersionedSerializer: codec must define a CODEC_ID between 1 and 255"
+            )
+
+        self.codec = codec
+        self.compression_threshold = compression_threshold
+        self.compression_level = compression_level
+        self._codecs: dict[int, Serializer] = {codec.CODEC_ID: codec}
+
+    def serialize(self, value: JSON) -> bytes:
+        payload = self.codec.serialize(value)
+        flags = 0
+        if (
+            self.compression_threshold is not None
+            and len(payload) > self.compression_threshold
+        ):
+            payload = zlib.compress(payload, self.compression_level)
+            flags |= self._COMPRESSED
+
+        return self.MAGIC + bytes((self.VERSION, self.codec.CODEC_ID, flags)) + payload
+
+    def deserialize(self, data: bytes) -> JSON:
+        if not data.startswith(self.MAGIC):
+            return json.loads(data)
+
+        version, codec_id, flags = data[2], data[3], data[4]
+        if version != self.VERSION:
+            raise ValueError(
+                f"VersionedSerializer.deserialize(): unsupported format version {version}"
+            )
+
+        payload = memoryview(data)[5:]
+        if flags & self._COMPRESSED:
+            payload = zlib.decompress(payload)
+
+        return self._get_codec(codec_id).deserialize(bytes(payload))
+
+    def _get_codec(self, codec_id: int) -> Serializer:
+        codec = self._codecs.get(codec_id)
+        if codec is None:
+            for codec_cls in (JsonSerializer, MsgPackSerializer):
+                if codec_cls.CODEC_ID == codec_id:
+                    codec = self._codecs[codec_id] = codec_cls()
+                    break
+            else:
+                raise ValueError(
+                    f"VersionedSerializer.deserialize(): unknown codec {codec_id}"
+                )
+
+        return codec
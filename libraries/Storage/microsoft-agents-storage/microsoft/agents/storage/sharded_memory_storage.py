@@ -0,0 +1,114 @@
+from contextlib import ExitStack
+from itertools import count
+from threading import Lock
+from typing import Optional, TypeVar
+
+from ._type_aliases import JSON
+from .memory_storage import _check_e_tag, _from_snapshot, _set_e_tag, _to_snapshot
+from .serializer import Serializer
+from .storage import Storage
+from .store_item import StoreItem
+
+StoreItemT = TypeVar("StoreItemT", bound=StoreItem)
+
+
+class _Shard:
+    __slots__ = ("index", "memory", "e_tags", "lock")
+
+    def __init__(self, index: int):
+        self.index = index
+        self.memory: dict[str, JSON] = {}
+        self.e_tags: dict[str, str] = {}
+        self.lock = Lock()
+
+
+class ShardedMemoryStorage(Storage):
+    """
+    An in-memory storage whose keys are spread over shards, each guarded by its own lock,
+    so that turns running on different threads rarely wait on each other.
+
+    Items are copied and deserialized outside of the locks. A write spanning several shards
+    locks them in a fixed order and is still applied entirely or not at all.
+    """
+
+    def __init__(
+        self,
+        state: dict[str, JSON] = None,
+        shard_count: int = 16,
+        serializer: Optional[Serializer] = None,
+    ):
+        """
+        :param state: The initial items.
+        :param shard_count: The number of shards the keys are spread over.
+        :param serializer: Keeps items serialized instead of as copies of their JSON, which
+        is cheaper for large JSON-compatible items.
+        """
+        if shard_count <= 0:
+            raise ValueError("ShardedMemoryStorage: shard_count must be greater than 0")
+
+        self._shards = [_Shard(index) for index in range(shard_count)]
+        self._e_tag_counter = count(1)
+        self._serializer = serializer
+        for key, value in (state or {}).items():
+            shard = self._get_shard(key)
+            shard.memory[key] = serializer.serialize(value) if serializer else value
+            shard.e_tags[key] = self._next_e_tag()
+
+    async def read(
+        self, keys: list[str], *, target_cls: StoreItemT = None, **kwargs
+    ) -> dict[str, StoreItemT]:
+        entries: dict[str, tuple[JSON, str]] = {}
+        for shard, shard_keys in self._group_by_shard(keys).items():
+            with shard.lock:
+                for key in shard_keys:
+                    if key in shard.memory:
+                        entries[key] = (shard.memory[key], shard.e_tags[key])
+
+        return {
+            key: _from_snapshot(value, e_tag, target_cls, self, self._serializer)
+            for key, (value, e_tag) in entries.items()
+        }
+
+    async def write(self, changes: dict[str, StoreItem]):
+        if not changes:
+            raise ValueError("ShardedMemoryStorage.write(): changes cannot be None")
+
+        snapshots = {
+            key: _to_snapshot(item, self._serializer) for key, item in changes.items()
+        }
+        groups = self._group_by_shard(changes)
+        with ExitStack() as stack:
+            # Shards are always locked in the same order, so that concurrent batches cannot deadlock.
+            for shard in sorted(groups, key=lambda shard: shard.index):
+                stack.enter_context(shard.lock)
+
+            for shard, shard_keys in groups.items():
+                for key in shard_keys:
+                    _check_e_tag(key, changes[key], shard.e_tags.get(key))
+
+            for shard, shard_keys in groups.items():
+                for key in shard_keys:
+                    shard.memory[key] = snapshots[key]
+                    shard.e_tags[key] = self._next_e_tag()
+                    _set_e_tag(changes[key], shard.e_tags[key])
+
+    async def delete(self, keys: list[str]):
+        for shard, shard_keys in self._group_by_shard(keys).items():
+            with shard.lock:
+                for key in shard_keys:
+                    if key in shard.memory:
+                        del shard.memory[key]
+                        del shard.e_tags[key]
+
+    def _get_shard(self, key: str) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def _group_by_shard(self, keys) -> dict[_Shard, list[str]]:
+        groups: dict[_Shard, list[str]] = {}
+        for key in keys:
+            groups.setdefault(self._get_shard(key), []).append(key)
+
+        return groups
+
+    def _next_e_tag(self) -> str:
+        return str(next(self._e_tag_counter))
@@ -0,0 +1,219 @@
+import sqlite3
+from asyncio import get_running_loop
+from concurrent.futures import ThreadPoolExecutor
+from json import dumps, loads
+from time import time
+from typing import Optional, TypeVar
+from uuid import uuid4
+
+from .memory_storage import _check_e_tag, _deserialize, _set_e_tag
+from .serializer import Serializer, VersionedSerializer
+from .storage import Storage
+from .store_item import StoreItem
+
+StoreItemT = TypeVar("StoreItemT", bound=StoreItem)
+
+# Stays below the default limit of variables in a single SQLite statement.
+_MAX_KEYS_PER_STATEMENT = 500
+
+
+class SqliteStorage(Storage):
+    """
+    Stores items in a SQLite database in WAL mode.
+
+    Every call runs as a single transaction on a dedicated thread owning the connection, so
+    the event loop never blocks on the database. Items can optionally expire after a time to
+    live, expired items are removed by later writes.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        ttl: Optional[float] = None,
+        sweep_interval: float = 60.0,
+        synchronous: str = "NORMAL",
+        serializer: Optional[Serializer] = None,
+    ):
+        """
+        :param path: The database file, created if it does not exist.
+        :param ttl: Seconds after their last write at which items expire, None to keep them.
+        :param sweep_interval: Minimum seconds between two removals of expired items.
+        :param synchronous: The SQLite synchronous setting, FULL to also survive power loss
+        at the cost of slower writes.
+        :param serializer: Stores items as serialized blobs instead of JSON text. Rows written
+        either way stay readable.
+        """
+        if synchronous.upper() not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+            raise ValueError(
+                f"SqliteStorage: synchronous must be OFF, NORMAL, FULL or EXTRA, not {synchronous}"
+            )
+
+        self.ttl = ttl
+        self.sweep_interval = sweep_interval
+        self._path = path
+        self._synchronous = synchronous
+        self._serializer = serializer or VersionedSerializer()
+        self._serialize = serializer.serialize if serializer else dumps
+        self._next_sweep_at = 0.0
+        self._connection: Optional[sqlite3.Connection] = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="SqliteStorage"
+        )
+        self._executor.submit(self._connect).result()
+
+    async def read(
+        self, keys: list[str], *, target_cls: StoreItemT = None, **kwargs
+    ) -> dict[str, StoreItemT]:
+        rows = await self._run(self._read, list(keys))
+        return {
+            key: _deserialize(self._decode(value), e_tag, target_cls, self)
+            for key, value, e_tag in rows
+        }
+
+    async def write(
+        self, changes: dict[str, StoreItem], *, ttl: Optional[float] = None
+    ) -> None:
+        """
+        Writes the items, see :meth:`Storage.write`.
+
+        :param ttl: Seconds after which these items expire, overriding the storage's ttl.
+        """
+        if not changes:
+            raise ValueError("SqliteStorage.write(): changes cannot be None")
+
+        ttl = ttl if ttl is not None else self.ttl
+        rows = [
+            (key, self._serialize(item.store_item_to_json()), uuid4().hex)
+            for key, item in changes.items()
+        ]
+        await self._run(self._write, changes, rows, ttl)
+        for key, _, e_tag in rows:
+            _set_e_tag(changes[key], e_tag)
+
+    async def delete(self, keys: list[str]) -> None:
+        await self._run(self._delete, list(keys))
+
+    async def sweep(self) -> int:
+        """
+        Removes the expired items.
+
+        :return: The number of items removed.
+        """
+        return await self._run(self._sweep)
+
+    async def close(self) -> None:
+        """
+        Closes the database connection and stops the storage thread.
+        """
+        await self._run(self._connection.close)
+        self._executor.shutdown()
+
+    def _decode(self, value):
+        # Serialized items are stored as blobs, JSON ones as text.
+        if isinstance(value, bytes):
+            return self._serializer.deserialize(value)
+
+        return loads(value)
+
+    async def _run(self, function, *args):
+        return await get_running_loop().run_in_executor(self._executor, function, *args)
+
+    def _connect(self) -> None:
+        self._connection = sqlite3.connect(self._path, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(f"PRAGMA synchronous={self._synchronous}")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS items ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, e_tag TEXT NOT NULL, expires_at REAL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS items_expires_at ON items (expires_at) "
+            "WHERE expires_at IS NOT NULL"
+        )
+
+    def _read(self, keys: list[str]) -> list[tuple[str, str, str]]:
+        now = time()
+        rows = []
+        self._connection.execute("BEGIN")
+        try:
+            for chunk in _chunks(keys):
+                rows.extend(
+                    self._connection.execute(
+                        "SELECT key, value, e_tag FROM items WHERE key IN "
+                        f"({','.join('?' * len(chunk))}) "
+                        "AND (expires_at IS NULL OR expires_at > ?)",
+                        (*chunk, now),
+                    )
+                )
+        finally:
+            self._connection.execute("COMMIT")
+
+        return rows
+
+    def _write(
+        self,
+        changes: dict[str, StoreItem],
+        rows: list[tuple[str, str, str]],
+        ttl: Optional[float],
+    ) -> None:
+        now = time()
+        expires_at = now + ttl if ttl is not None else None
+        # Takes the write lock up front, so that the conditions still hold when the rows are written.
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            conditional_keys = [
+                key
+                for key, item in changes.items()
+                if getattr(item, "e_tag", None) not in (None, "*")
+            ]
+            current_e_tags = {}
+            for chunk in _chunks(conditional_keys):
+                current_e_tags.update(
+                    self._connection.execute(
+                        "SELECT key, e_tag FROM items WHERE key IN "
+                        f"({','.join('?' * len(chunk))}) "
+                        "AND (expires_at IS NULL OR expires_at > ?)",
+                        (*chunk, now),
+                    )
+                )
+            for key in conditional_keys:
+                _check_e_tag(key, changes[key], current_e_tags.get(key))
+
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO items (key, value, e_tag, expires_at) VALUES (?, ?, ?, ?)",
+                [(key, value, e_tag, expires_at) for key, value, e_tag in rows],
+            )
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+
+        self._connection.execute("COMMIT")
+        if now >= self._next_sweep_at:
+            self._sweep()
+
+    def _delete(self, keys: list[str]) -> None:
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            for chunk in _chunks(keys):
+                self._connection.execute(
+                    f"DELETE FROM items WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+
+        self._connection.execute("COMMIT")
+
+    def _sweep(self) -> int:
+        now = time()
+        self._next_sweep_at = now + self.sweep_interval
+        return self._connection.execute(
+            "DELETE FROM items WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,)
+        ).rowcount
+
+
+def _chunks(keys: list[str]):
+    for start in range(0, len(keys), _MAX_KEYS_PER_STATEMENT):
+        yield keys[start : start + _MAX_KEYS_PER_STATEMENT]
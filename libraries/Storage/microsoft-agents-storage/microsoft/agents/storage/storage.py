@@ -3,7 +3,6 @@ from typing import Protocol, TypeVar, Type
 from ._type_aliases import JSON
 from .store_item import StoreItem
 
-
 StoreItemT = TypeVar("StoreItemT", bound=StoreItem)
 
 
@@ -11,9 +10,19 @@ class Storage(Protocol):
     async def read(
         self, keys: list[str], *, target_cls: Type[StoreItemT] = None, **kwargs
     ) -> dict[str, StoreItemT]:
+        """
+        Reads the items with the given keys, items read into a target_cls carry their e_tag.
+        """
         pass
 
     async def write(self, changes: dict[str, StoreItemT]) -> None:
+        """
+        Writes the items, setting their new e_tag.
+
+        Items with an e_tag other than "*" are only written if the stored item still has that
+        e_tag, otherwise ETagConflictError is raised. Items with an empty e_tag are only written
+        if no item is stored under their key.
+        """
         pass
 
     async def delete(self, keys: list[str]) -> None:
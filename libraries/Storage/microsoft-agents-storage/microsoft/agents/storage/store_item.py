@@ -5,6 +5,12 @@ from ._type_aliases import JSON
 
 
 class StoreItem(ABC):
+    # The version of the item in storage, set by the storage when the item is read or written.
+    # Writing an item with an e_tag only succeeds if the stored item still has that version,
+    # with an empty e_tag only if no item is stored yet. None or "*" overwrite unconditionally.
+    # Left unannotated so that pydantic models do not make it a field.
+    e_tag = None
+
     def store_item_to_json(self) -> JSON:
         pass
 
@@ -0,0 +1,175 @@
+import asyncio
+
+import pytest
+
+from microsoft.agents.storage import (
+    CachingStorage,
+    ETagConflictError,
+    MemoryStorage,
+    StoreItem,
+)
+
+
+class _Item(StoreItem):
+    def __init__(self, value=0):
+        self.value = value
+
+    def store_item_to_json(self) -> dict:
+        return {"value": self.value}
+
+    @staticmethod
+    def from_json_to_store_item(json_data: dict) -> "StoreItem":
+        return _Item(json_data["value"])
+
+
+class _CountingStorage(MemoryStorage):
+    def __init__(self):
+        super().__init__()
+        self.reads = []
+        self.read_delay = 0
+
+    async def read(self, keys, **kwargs):
+        self.reads.append(list(keys))
+        await asyncio.sleep(self.read_delay)
+        return await super().read(keys, **kwargs)
+
+
+class TestCachingStorage:
+    @pytest.fixture
+    def backing(self):
+        return _CountingStorage()
+
+    @pytest.mark.asyncio
+    async def test_reads_are_served_from_cache(self, backing):
+        await backing.write({"key": _Item(1)})
+        storage = CachingStorage(backing)
+
+        first = (await storage.read(["key", "missing"], target_cls=_Item))["key"]
+        first.value = 2
+        second = await storage.read(["key", "missing"], target_cls=_Item)
+
+        assert backing.reads == [["key", "missing"]]
+        assert list(second) == ["key"]
+        assert second["key"].value == 1
+        assert second["key"].e_tag == first.e_tag
+        assert (storage.hits, storage.misses) == (2, 2)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_share_one_backing_read(self, backing):
+        await backing.write({"key": _Item(1)})
+        backing.read_delay = 0.01
+        storage = CachingStorage(backing)
+
+        results = await asyncio.gather(
+            *(storage.read(["key"], target_cls=_Item) for _ in range(10))
+        )
+
+        assert backing.reads == [["key"]]
+        assert {result["key"].value for result in results} == {1}
+        assert len({id(result["key"]) for result in results}) == 10
+        assert (storage.hits, storage.misses, storage.coalesced_reads) == (0, 1, 9)
+
+    @pytest.mark.asyncio
+    async def test_typed_reads_do_not_use_entries_of_raw_reads(self, backing):
+        await backing.write({"key": _Item(1)})
+        storage = CachingStorage(backing)
+
+        assert await storage.read(["key"]) == {"key": {"value": 1}}
+        stale = (await storage.read(["key"], target_cls=_Item))["key"]
+        assert len(backing.reads) == 2
+        assert stale.e_tag is not None
+
+        current = (await backing.read(["key"], target_cls=_Item))["key"]
+        current.value = 2
+        await backing.write({"key": current})
+        stale.value = 3
+        with pytest.raises(ETagConflictError):
+            await storage.write({"key": stale})
+
+    @pytest.mark.asyncio
+    async def test_typed_reads_do_not_share_raw_backing_reads(self, backing):
+        await backing.write({"key": _Item(1)})
+        backing.read_delay = 0.01
+        storage = CachingStorage(backing)
+
+        raw, typed = await asyncio.gather(
+            storage.read(["key"]), storage.read(["key"], target_cls=_Item)
+        )
+
+        assert raw == {"key": {"value": 1}}
+        assert typed["key"].e_tag is not None
+        assert len(backing.reads) == 2
+        cached = (await storage.read(["key"], target_cls=_Item))["key"]
+        assert cached.e_tag == typed["key"].e_tag
+        assert len(backing.reads) == 2
+
+    @pytest.mark.asyncio
+    async def test_writes_go_through_and_update_cache(self, backing):
+        storage = CachingStorage(backing)
+        assert await storage.read(["key"]) == {}
+
+        item = _Item(1)
+        await storage.write({"key": item})
+
+        assert (await backing.read(["key"], target_cls=_Item))["key"].value == 1
+        cached = (await storage.read(["key"], target_cls=_Item))["key"]
+        assert cached.value == 1 and cached.e_tag == item.e_tag
+        assert len(backing.reads) == 2
+
+    @pytest.mark.asyncio
+    async def test_delete_invalidates_cache(self, backing):
+        storage = CachingStorage(backing)
+        await storage.write({"key": _Item(1)})
+
+        await storage.delete(["key"])
+
+        assert await storage.read(["key"]) == {}
+        assert await backing.read(["key"]) == {}
+
+    @pytest.mark.asyncio
+    async def test_conflict_invalidates_stale_entry(self, backing):
+        storage = CachingStorage(backing)
+        await storage.write({"key": _Item(1)})
+        stale = (await storage.read(["key"], target_cls=_Item))["key"]
+        await backing.write(
+            {"key": (await backing.read(["key"], target_cls=_Item))["key"]}
+        )
+
+        with pytest.raises(ETagConflictError):
+            await storage.write({"key": stale})
+
+        fresh = (await storage.read(["key"], target_cls=_Item))["key"]
+        fresh.value = 2
+        await storage.write({"key": fresh})
+
+    @pytest.mark.asyncio
+    async def test_write_during_read_is_not_overwritten_by_stale_read(self, backing):
+        await backing.write({"key": _Item(1)})
+        backing.read_delay = 0.01
+        storage = CachingStorage(backing)
+
+        read = asyncio.ensure_future(storage.read(["key"], target_cls=_Item))
+        await asyncio.sleep(0)
+        await storage.write({"key": _Item(2)})
+        await read
+
+        assert (await storage.read(["key"], target_cls=_Item))["key"].value == 2
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_and_are_bounded(self, backing, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(
+            "microsoft.agents.storage.caching_storage.monotonic", lambda: now[0]
+        )
+        storage = CachingStorage(backing, max_entries=2, negative_ttl=5)
+
+        await storage.read(["a", "b", "c"])
+        await storage.read(["c"])
+        assert len(backing.reads) == 1
+
+        await storage.read(["a"])
+        assert backing.reads[-1] == ["a"]
+
+        now[0] += 10
+        await storage.read(["c"])
+        assert backing.reads[-1] == ["c"]
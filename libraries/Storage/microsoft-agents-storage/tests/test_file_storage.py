@@ -0,0 +1,116 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from microsoft.agents.storage import ETagConflictError, FileStorage, StoreItem
+
+
+class _Item(StoreItem):
+    def __init__(self, value=0):
+        self.value = value
+
+    def store_item_to_json(self) -> dict:
+        return {"value": self.value}
+
+    @staticmethod
+    def from_json_to_store_item(json_data: dict) -> "StoreItem":
+        return _Item(json_data["value"])
+
+
+class TestFileStorage:
+    @pytest.fixture
+    def directory(self, tmp_path):
+        return str(tmp_path / "state")
+
+    @pytest.mark.asyncio
+    async def test_items_survive_reopening(self, directory):
+        storage = FileStorage(directory)
+        await storage.write({"a": _Item(1), "b": _Item(2)})
+        await storage.write({"a": _Item(3)})
+        await storage.delete(["b"])
+        await storage.close()
+
+        storage = FileStorage(directory)
+        items = await storage.read(["a", "b"], target_cls=_Item)
+
+        assert list(items) == ["a"]
+        assert items["a"].value == 3
+        await storage.write({"c": _Item(4)})
+        assert int((await storage.read(["c"], target_cls=_Item))["c"].e_tag) > int(
+            items["a"].e_tag
+        )
+        await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_write_with_stale_e_tag_raises_conflict(self, directory):
+        storage = FileStorage(directory)
+        await storage.write({"key": _Item(1)})
+        first = (await storage.read(["key"], target_cls=_Item))["key"]
+        second = (await storage.read(["key"], target_cls=_Item))["key"]
+
+        await storage.write({"key": first})
+        with pytest.raises(ETagConflictError):
+            await storage.write({"key": second})
+
+        new = _Item(2)
+        new.e_tag = ""
+        with pytest.raises(ETagConflictError):
+            await storage.write({"key": new})
+        await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_incomplete_trailing_record_is_dropped(self, directory):
+        storage = FileStorage(directory)
+        await storage.write({"a": _Item(1)})
+        await storage.close()
+        with open(f"{directory}/{FileStorage.LOG_FILE_NAME}", "ab") as log:
+            log.write(b'["b", "9", {"val')
+
+        storage = FileStorage(directory)
+        await storage.write({"c": _Item(2)})
+
+        assert sorted(await storage.read(["a", "b", "c"])) == ["a", "c"]
+        await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_log_is_compacted(self, directory):
+        storage = FileStorage(directory, fsync=False, min_compaction_size=1024)
+        for value in range(200):
+            await storage.write({"a": _Item(value), "b": _Item(-value)})
+        await storage.delete(["b"])
+
+        assert storage.log_size < 2048
+        items = await storage.read(["a", "b"], target_cls=_Item)
+        assert list(items) == ["a"] and items["a"].value == 199
+
+        await storage.compact()
+        await storage.close()
+        storage = FileStorage(directory)
+        assert (await storage.read(["a"], target_cls=_Item))["a"].value == 199
+        await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_write_is_truncated(self, directory):
+        storage = FileStorage(directory)
+        await storage.write({"a": _Item(1)})
+        size = storage.log_size
+        write = os.write
+
+        def write_partially(fd, data):
+            write(fd, bytes(data[:10]))
+            raise OSError("No space left on device")
+
+        with patch("os.write", write_partially):
+            with pytest.raises(OSError):
+                await storage.write({"b": _Item(2)})
+
+        assert os.path.getsize(f"{directory}/{FileStorage.LOG_FILE_NAME}") == size
+        await storage.write({"c": _Item(3)})
+        items = await storage.read(["a", "b", "c"], target_cls=_Item)
+        assert sorted(items) == ["a", "c"] and items["c"].value == 3
+        await storage.close()
+
+        storage = FileStorage(directory)
+        assert sorted(await storage.read(["a", "b", "c"])) == ["a", "c"]
+        await storage.close()
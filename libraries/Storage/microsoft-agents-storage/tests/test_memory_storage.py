@@ -0,0 +1,207 @@
+import pytest
+
+from microsoft.agents.storage import (
+    AsyncMemoryStorage,
+    ETagConflictError,
+    MemoryStorage,
+    ShardedMemoryStorage,
+    StoreItem,
+)
+
+
+class _Item(StoreItem):
+    def __init__(self, value: int = 0):
+        self.value = value
+
+    def store_item_to_json(self) -> dict:
+        return {"value": self.value}
+
+    @staticmethod
+    def from_json_to_store_item(json_data: dict) -> "StoreItem":
+        return _Item(json_data["value"])
+
+
+class _SlottedItem:
+    __slots__ = ("value",)
+
+    def __init__(self, value: int = 0):
+        self.value = value
+
+    def store_item_to_json(self) -> dict:
+        return {"value": self.value}
+
+    @classmethod
+    def from_json_to_store_item(cls, json_data: dict) -> "_SlottedItem":
+        return cls(json_data["value"])
+
+
+@pytest.fixture(
+    params=[
+        MemoryStorage,
+        AsyncMemoryStorage,
+        lambda: ShardedMemoryStorage(shard_count=4),
+    ]
+)
+def storage(request):
+    return request.param()
+
+
+class TestMemoryStorage:
+    @pytest.mark.asyncio
+    async def test_write_sets_e_tag_and_read_returns_it(self, storage):
+        item = _Item(1)
+
+        await storage.write({"key": item})
+        items = await storage.read(["key"], target_cls=_Item)
+
+        assert item.e_tag is not None
+        assert items["key"].e_tag == item.e_tag
+        assert items["key"].value == 1
+
+    @pytest.mark.asyncio
+    async def test_write_with_stale_e_tag_raises_conflict(self, storage):
+        await storage.write({"key": _Item(1)})
+        first = (await storage.read(["key"], target_cls=_Item))["key"]
+        second = (await storage.read(["key"], target_cls=_Item))["key"]
+
+        first.value = 2
+        await storage.write({"key": first})
+        second.value = 3
+        with pytest.raises(ETagConflictError) as error:
+            await storage.write({"key": second})
+
+        assert error.value.key == "key"
+        assert error.value.actual == first.e_tag
+        assert (await storage.read(["key"], target_cls=_Item))["key"].value == 2
+
+    @pytest.mark.asyncio
+    async def test_wildcard_e_tag_overwrites(self, storage):
+        await storage.write({"key": _Item(1)})
+        item = _Item(2)
+        item.e_tag = "*"
+
+        await storage.write({"key": item})
+
+        assert (await storage.read(["key"], target_cls=_Item))["key"].value == 2
+
+    @pytest.mark.asyncio
+    async def test_conflicting_batch_writes_nothing(self, storage):
+        stale = _Item(1)
+        stale.e_tag = "stale"
+        await storage.write({"key": _Item(1)})
+
+        with pytest.raises(ETagConflictError):
+            await storage.write({"other": _Item(2), "key": stale})
+
+        assert await storage.read(["other"]) == {}
+
+    @pytest.mark.asyncio
+    async def test_read_returns_copies(self, storage):
+        await storage.write({"key": _Item(1)})
+
+        (await storage.read(["key"]))["key"]["value"] = 2
+
+        assert (await storage.read(["key"]))["key"] == {"value": 1}
+
+    @pytest.mark.asyncio
+    async def test_read_and_delete_many_keys(self, storage):
+        keys = [f"key{index}" for index in range(32)]
+        await storage.write({key: _Item(index) for index, key in enumerate(keys)})
+
+        items = await storage.read(keys + ["missing"], target_cls=_Item)
+        await storage.delete(keys[:16])
+
+        assert [items[key].value for key in keys] == list(range(32))
+        assert sorted(await storage.read(keys)) == sorted(keys[16:])
+
+    @pytest.mark.asyncio
+    async def test_items_without_e_tag_are_written_unconditionally(self, storage):
+        await storage.write({"key": _SlottedItem(1)})
+        await storage.write({"key": _SlottedItem(2)})
+
+        assert (await storage.read(["key"], target_cls=_SlottedItem))["key"].value == 2
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestMemoryStorageEviction:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        clock = _Clock()
+        monkeypatch.setattr("microsoft.agents.storage.memory_storage.monotonic", clock)
+        return clock
+
+    @pytest.mark.asyncio
+    async def test_items_expire_after_ttl(self, clock):
+        storage = MemoryStorage(ttl=10, sweep_interval=3600)
+        await storage.write({"default": _Item(1)})
+        await storage.write({"longer": _Item(2)}, ttl=20)
+
+        clock.now += 15
+        assert list(await storage.read(["default", "longer"])) == ["longer"]
+        assert storage.expirations == 1
+
+        clock.now += 10
+        assert storage.sweep() == 1
+        assert storage.entry_count == 0
+
+    @pytest.mark.asyncio
+    async def test_expired_item_can_be_created_again(self, clock):
+        storage = AsyncMemoryStorage(ttl=10, sweep_interval=3600)
+        await storage.write({"key": _Item(1)})
+
+        clock.now += 15
+        item = _Item(2)
+        item.e_tag = ""
+        await storage.write({"key": item})
+
+        assert (await storage.read(["key"], target_cls=_Item))["key"].value == 2
+
+    @pytest.mark.asyncio
+    async def test_expiration_heap_is_bounded_by_live_items(self):
+        storage = AsyncMemoryStorage(ttl=3600, max_entries=10, sweep_interval=3600)
+        for _ in range(1000):
+            await storage.write({f"key{index}": _Item(index) for index in range(5)})
+        assert len(storage._expirations) <= 2 * storage.entry_count + 16
+
+        for index in range(1000):
+            await storage.write({f"other{index}": _Item(index)})
+        assert storage.evictions == 995
+        assert len(storage._expirations) <= 2 * storage.entry_count + 16
+
+        await storage.delete([f"other{index}" for index in range(1000)])
+        await storage.write({"last": _Item(0)})
+        assert len(storage._expirations) <= 2 * storage.entry_count + 16
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_items_are_evicted(self):
+        storage = MemoryStorage(max_entries=2)
+        await storage.write({"a": _Item(1), "b": _Item(2)})
+        await storage.read(["a"])
+
+        await storage.write({"c": _Item(3)})
+
+        assert sorted(await storage.read(["a", "b", "c"])) == ["a", "c"]
+        assert storage.evictions == 1
+        assert storage.entry_count == 2
+
+    @pytest.mark.asyncio
+    async def test_items_are_evicted_to_stay_within_byte_budget(self):
+        storage = MemoryStorage(max_bytes=100)
+        await storage.write({f"key{index}": _Item(index) for index in range(5)})
+        size = storage.size_in_bytes
+
+        await storage.write({"large": _Item(10**80)})
+
+        assert storage.size_in_bytes <= 100
+        assert storage.evictions > 0
+        assert "large" in await storage.read(["large"])
+
+        await storage.delete(["large"])
+        assert storage.size_in_bytes < size
@@ -0,0 +1,150 @@
+import json
+
+import pytest
+
+from microsoft.agents.storage import (
+    CachingStorage,
+    JsonSerializer,
+    MemoryStorage,
+    MsgPackSerializer,
+    ShardedMemoryStorage,
+    SqliteStorage,
+    StoreItem,
+    VersionedSerializer,
+)
+from microsoft.agents.storage import serializer as serializer_module
+
+VALUE = {"name": "user", "count": 3, "ratio": 0.5, "tags": ["a", "é"], "none": None}
+
+
+class _Item(StoreItem):
+    def __init__(self, value=None):
+        self.value = value
+
+    def store_item_to_json(self) -> dict:
+        return {"value": self.value}
+
+    @staticmethod
+    def from_json_to_store_item(json_data: dict) -> "StoreItem":
+        return _Item(json_data["value"])
+
+
+class TestVersionedSerializer:
+    def test_round_trip(self):
+        serializer = VersionedSerializer(JsonSerializer())
+        data = serializer.serialize(VALUE)
+
+        assert data[:5] == VersionedSerializer.MAGIC + bytes((1, 1, 0))
+        assert serializer.deserialize(data) == VALUE
+
+    def test_compresses_above_threshold(self):
+        serializer = VersionedSerializer(JsonSerializer(), compression_threshold=64)
+        value = {"history": ["message"] * 100}
+        data = serializer.serialize(value)
+
+        assert data[4] == 0x01
+        assert len(data) < len(json.dumps(value))
+        assert serializer.deserialize(data) == value
+
+    def test_reads_other_settings_and_plain_json(self):
+        compressed = VersionedSerializer(JsonSerializer(), compression_threshold=0)
+        serializer = VersionedSerializer(JsonSerializer(), compression_threshold=None)
+
+        assert serializer.deserialize(compressed.serialize(VALUE)) == VALUE
+        assert serializer.deserialize(json.dumps(VALUE).encode()) == VALUE
+
+    def test_unsupported_version_raises(self):
+        data = VersionedSerializer.MAGIC + bytes((99, 1, 0)) + b"{}"
+
+        with pytest.raises(ValueError):
+            VersionedSerializer(JsonSerializer()).deserialize(data)
+
+    def test_unknown_codec_raises(self):
+        data = VersionedSerializer.MAGIC + bytes((1, 200, 0)) + b"{}"
+
+        with pytest.raises(ValueError):
+            VersionedSerializer(JsonSerializer()).deserialize(data)
+
+    def test_json_serializer_without_orjson(self, monkeypatch):
+        monkeypatch.setattr(serializer_module, "orjson", None)
+        serializer = JsonSerializer()
+
+        assert serializer.deserialize(serializer.serialize(VALUE)) == VALUE
+
+    def test_msgpack_round_trip(self):
+        pytest.importorskip("msgpack")
+        serializer = VersionedSerializer(MsgPackSerializer(), compression_threshold=0)
+
+        assert (
+            VersionedSerializer(JsonSerializer()).deserialize(
+                serializer.serialize(VALUE)
+            )
+            == VALUE
+        )
+
+    def test_msgpack_serializer_requires_msgpack(self, monkeypatch):
+        monkeypatch.setattr(serializer_module, "msgpack", None)
+
+        with pytest.raises(ImportError):
+            MsgPackSerializer()
+
+
+class TestStorageSerializer:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("storage_cls", [MemoryStorage, ShardedMemoryStorage])
+    async def test_memory_storages_keep_items_serialized(self, storage_cls):
+        storage = storage_cls(
+            {"initial": {"value": 0}}, serializer=VersionedSerializer(JsonSerializer())
+        )
+        item = _Item({"nested": [1, 2]})
+        await storage.write({"key": item})
+        item.value["nested"].append(3)
+
+        items = await storage.read(["key", "initial"], target_cls=_Item)
+        assert items["key"].value == {"nested": [1, 2]}
+        assert items["initial"].value == 0
+
+    @pytest.mark.asyncio
+    async def test_max_bytes_counts_serialized_size(self):
+        storage = MemoryStorage(
+            max_bytes=10_000,
+            serializer=VersionedSerializer(JsonSerializer(), compression_threshold=64),
+        )
+        await storage.write({"key": _Item("x" * 50_000)})
+
+        assert storage.entry_count == 1
+        assert storage.size_in_bytes < 1_000
+
+    @pytest.mark.asyncio
+    async def test_sqlite_storage_reads_rows_written_either_way(self, tmp_path):
+        path = str(tmp_path / "state.db")
+        storage = SqliteStorage(path)
+        await storage.write({"text": _Item(1)})
+        await storage.close()
+
+        storage = SqliteStorage(path, serializer=VersionedSerializer(JsonSerializer()))
+        await storage.write({"blob": _Item(2)})
+        items = await storage.read(["text", "blob"], target_cls=_Item)
+        await storage.close()
+
+        assert {key: item.value for key, item in items.items()} == {
+            "text": 1,
+            "blob": 2,
+        }
+
+    @pytest.mark.asyncio
+    async def test_caching_storage_caches_serialized_items(self):
+        backing = MemoryStorage()
+        await backing.write({"read": _Item([1])})
+        storage = CachingStorage(
+            backing, serializer=VersionedSerializer(JsonSerializer())
+        )
+        await storage.write({"written": _Item([2])})
+
+        first = await storage.read(["read", "written"], target_cls=_Item)
+        first["read"].value.append(3)
+        second = await storage.read(["read", "written"], target_cls=_Item)
+
+        assert second["read"].value == [1]
+        assert second["written"].value == [2]
+        assert storage.hits == 3
@@ -0,0 +1,73 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from microsoft.agents.storage import ETagConflictError, ShardedMemoryStorage, StoreItem
+
+
+class _Counter(StoreItem):
+    def __init__(self, value: int = 0):
+        self.value = value
+
+    def store_item_to_json(self) -> dict:
+        return {"value": self.value}
+
+    @staticmethod
+    def from_json_to_store_item(json_data: dict) -> "StoreItem":
+        return _Counter(json_data["value"])
+
+
+class TestShardedMemoryStorage:
+    def test_shard_count_must_be_positive(self):
+        with pytest.raises(ValueError):
+            ShardedMemoryStorage(shard_count=0)
+
+    @pytest.mark.asyncio
+    async def test_initial_state_is_readable(self):
+        storage = ShardedMemoryStorage({"a": {"value": 1}, "b": {"value": 2}})
+
+        items = await storage.read(["a", "b"], target_cls=_Counter)
+
+        assert items["a"].value == 1 and items["b"].value == 2
+        assert items["a"].e_tag != items["b"].e_tag
+
+    @pytest.mark.asyncio
+    async def test_conflicting_batch_across_shards_writes_nothing(self):
+        storage = ShardedMemoryStorage(shard_count=8)
+        keys = [f"key{index}" for index in range(16)]
+        await storage.write({keys[0]: _Counter(1)})
+        stale = _Counter(2)
+        stale.e_tag = "stale"
+
+        changes = {key: _Counter() for key in keys[1:]}
+        changes[keys[0]] = stale
+        with pytest.raises(ETagConflictError):
+            await storage.write(changes)
+
+        assert list(await storage.read(keys)) == [keys[0]]
+
+    def test_concurrent_increments_from_threads_are_not_lost(self):
+        storage = ShardedMemoryStorage(shard_count=4)
+        keys = [f"counter{index}" for index in range(8)]
+        asyncio.run(storage.write({key: _Counter() for key in keys}))
+
+        async def increment(key: str):
+            while True:
+                counter = (await storage.read([key], target_cls=_Counter))[key]
+                counter.value += 1
+                try:
+                    await storage.write({key: counter})
+                    return
+                except ETagConflictError:
+                    pass
+
+        def run(key: str):
+            for _ in range(50):
+                asyncio.run(increment(key))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(run, keys * 4))
+
+        items = asyncio.run(storage.read(keys, target_cls=_Counter))
+        assert [items[key].value for key in keys] == [200] * len(keys)
@@ -0,0 +1,80 @@
+import pytest
+import pytest_asyncio
+
+from microsoft.agents.storage import ETagConflictError, SqliteStorage, StoreItem
+
+
+class _Item(StoreItem):
+    def __init__(self, value=0):
+        self.value = value
+
+    def store_item_to_json(self) -> dict:
+        return {"value": self.value}
+
+    @staticmethod
+    def from_json_to_store_item(json_data: dict) -> "StoreItem":
+        return _Item(json_data["value"])
+
+
+class TestSqliteStorage:
+    @pytest_asyncio.fixture
+    async def storage(self, tmp_path):
+        storage = SqliteStorage(str(tmp_path / "state.db"))
+        yield storage
+        await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_write_read_and_delete(self, storage):
+        keys = [f"key{index}" for index in range(600)]
+        await storage.write({key: _Item(index) for index, key in enumerate(keys)})
+
+        items = await storage.read(keys + ["missing"], target_cls=_Item)
+        assert [items[key].value for key in keys] == list(range(600))
+        assert all(items[key].e_tag for key in keys)
+
+        await storage.delete(keys[1:])
+        assert await storage.read(keys) == {"key0": {"value": 0}}
+
+    @pytest.mark.asyncio
+    async def test_conflicting_batch_writes_nothing(self, storage):
+        await storage.write({"key": _Item(1)})
+        stale = (await storage.read(["key"], target_cls=_Item))["key"]
+        await storage.write(
+            {"key": (await storage.read(["key"], target_cls=_Item))["key"]}
+        )
+
+        with pytest.raises(ETagConflictError):
+            await storage.write({"other": _Item(2), "key": stale})
+
+        assert await storage.read(["other"]) == {}
+
+    @pytest.mark.asyncio
+    async def test_items_expire_after_ttl(self, storage, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(
+            "microsoft.agents.storage.sqlite_storage.time", lambda: now[0]
+        )
+        await storage.write({"short": _Item(1)}, ttl=10)
+        await storage.write({"kept": _Item(2)})
+
+        now[0] += 15
+        assert list(await storage.read(["short", "kept"])) == ["kept"]
+
+        created = _Item(3)
+        created.e_tag = ""
+        await storage.write({"short": created})
+        assert (await storage.read(["short"], target_cls=_Item))["short"].value == 3
+
+        await storage.write({"expiring": _Item(4)}, ttl=1)
+        now[0] += 2
+        assert await storage.sweep() == 1
+
+    @pytest.mark.asyncio
+    async def test_items_survive_reopening(self, tmp_path):
+        storage = SqliteStorage(str(tmp_path / "durable.db"))
+        await storage.write({"key": _Item(1)})
+        await storage.close()
+
+        storage = SqliteStorage(str(tmp_path / "durable.db"))
+        assert (await storage.read(["key"], target_cls=_Item))["key"].value == 1
+        await storage.close()
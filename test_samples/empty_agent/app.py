@@ -5,6 +5,7 @@ from aiohttp.web import Application, Request, Response, run_app
 from dotenv import load_dotenv
 
 from microsoft.agents.builder import RestChannelServiceClientFactory
+from microsoft.agents.connector import ClientSessionPool
 from microsoft.agents.hosting.aiohttp import CloudAdapter, jwt_authorization_middleware
 from microsoft.agents.authorization import (
     Connections,
@@ -35,7 +36,9 @@ class DefaultConnection(Connections):
 
 
 CONFIG = DefaultConfig()
-CHANNEL_CLIENT_FACTORY = RestChannelServiceClientFactory(CONFIG, DefaultConnection())
+CHANNEL_CLIENT_FACTORY = RestChannelServiceClientFactory(
+    CONFIG, DefaultConnection(), session_pool=ClientSessionPool()
+)
 
 # Create adapter.
 ADAPTER = CloudAdapter(CHANNEL_CLIENT_FACTORY)
@@ -54,6 +57,7 @@ APP = Application(middlewares=[jwt_authorization_middleware])
 APP.router.add_post("/api/messages", messages)
 APP["agent_configuration"] = CONFIG
 APP["adapter"] = ADAPTER
+APP.on_cleanup.append(ADAPTER.on_cleanup)
 
 if __name__ == "__main__":
     try: